@@ -0,0 +1,71 @@
+"""Compares the tiled DGEMM with the reference triple loop.
+
+Usage: python benchmarks/bench_gemm.py [SIZE]
+
+SIZE (default 96) sets the scale of the problems.  The reference loop is
+pure python, so SIZE much beyond 200 will take minutes.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas.level3.dgemm import DGEMM
+
+
+def reference_dgemm(M, N, K, ALPHA, A, B, BETA, C):
+    # The netlib loop for C := alpha*A*B + beta*C.
+    for J in range(N):
+        if BETA == 0:
+            for I in range(M):
+                C[I, J] = 0
+        elif BETA != 1:
+            for I in range(M):
+                C[I, J] *= BETA
+        for L in range(K):
+            TEMP = ALPHA * B[L, J]
+            for I in range(M):
+                C[I, J] += TEMP * A[I, L]
+
+
+def shapes(size):
+    return [
+        ("square", size, size, size),
+        ("tall-skinny", 8 * size, size // 8, size),
+        ("short-wide", size // 8, 8 * size, size),
+    ]
+
+
+def main(size):
+    rng = np.random.default_rng(0)
+    print(
+        "%-12s %6s %6s %6s %12s %12s %9s"
+        % ("shape", "M", "N", "K", "loop (s)", "tiled (s)", "speedup")
+    )
+    for name, M, N, K in shapes(size):
+        A = np.asfortranarray(rng.standard_normal((M, K)))
+        B = np.asfortranarray(rng.standard_normal((K, N)))
+        C = np.asfortranarray(rng.standard_normal((M, N)))
+        C_loop, C_tiled = C.copy(order="F"), C.copy(order="F")
+        loop = timeit.timeit(
+            lambda: reference_dgemm(M, N, K, 1.0, A, B, 0.5, C_loop), number=1
+        )
+        tiled = min(
+            timeit.repeat(
+                lambda: DGEMM("N", "N", M, N, K, 1.0, A, M, B, K, 0.5, C_tiled, M),
+                number=1,
+                repeat=5,
+            )
+        )
+        print(
+            "%-12s %6d %6d %6d %12.4f %12.4f %8.0fx"
+            % (name, M, N, K, loop, tiled, loop / tiled)
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 96)
@@ -0,0 +1,73 @@
+"""Accuracy and speed of the 3M method (xGEMM3M) against classical xGEMM.
+
+Usage: python benchmarks/bench_gemm3m.py [SIZE ...]
+
+For each square size (default 256 512 1024) this prints the time of
+CGEMM/CGEMM3M and ZGEMM/ZGEMM3M and the normwise error of the real and
+imaginary parts of the result
+
+    max|C - C_exact| / (max|A| * max|B| * N)
+
+For single precision C_exact is the product computed in double precision.
+For double precision it is ZGEMM itself, so the error measures how far the
+two algorithms drift apart.  The imaginary part of the 3M product is the one
+with the weaker error bound.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas.level3.cgemm import CGEMM
+from pyblas.level3.cgemm3m import CGEMM3M
+from pyblas.level3.zgemm import ZGEMM
+from pyblas.level3.zgemm3m import ZGEMM3M
+
+
+def best_time(f):
+    return min(timeit.repeat(f, number=1, repeat=3))
+
+
+def error(C, C_exact, A, B):
+    N = A.shape[1]
+    SCALE = np.abs(A).max() * np.abs(B).max() * N
+    return (
+        np.abs(C.real - C_exact.real).max() / SCALE,
+        np.abs(C.imag - C_exact.imag).max() / SCALE,
+    )
+
+
+def run(name, classical, threem, dtype, N, rng):
+    A = (rng.uniform(-1, 1, (N, N)) + 1j * rng.uniform(-1, 1, (N, N))).astype(dtype)
+    B = (rng.uniform(-1, 1, (N, N)) + 1j * rng.uniform(-1, 1, (N, N))).astype(dtype)
+    C = np.empty((N, N), dtype)
+    T = best_time(lambda: classical("N", "N", N, N, N, 1, A, N, B, N, 0, C, N))
+    if dtype == np.csingle:
+        C_exact = A.astype(np.cdouble) @ B.astype(np.cdouble)
+        ER, EI = error(C, C_exact, A, B)
+    else:
+        C_exact = C.copy()
+        ER = EI = 0.0
+    print("%-9s %6d %9.4f %10.2e %10.2e %8s" % (name, N, T, ER, EI, "1.00"))
+    T3 = best_time(lambda: threem("N", "N", N, N, N, 1, A, N, B, N, 0, C, N))
+    ER, EI = error(C, C_exact, A, B)
+    print("%-9s %6d %9.4f %10.2e %10.2e %8.2f" % (name + "3M", N, T3, ER, EI, T / T3))
+
+
+def main(sizes):
+    rng = np.random.default_rng(0)
+    print(
+        "%-9s %6s %9s %10s %10s %8s"
+        % ("routine", "N", "time (s)", "error re", "error im", "speedup")
+    )
+    for N in sizes:
+        run("CGEMM", CGEMM, CGEMM3M, np.csingle, N, rng)
+        run("ZGEMM", ZGEMM, ZGEMM3M, np.cdouble, N, rng)
+
+
+if __name__ == "__main__":
+    main([int(N) for N in sys.argv[1:]] or [256, 512, 1024])
@@ -0,0 +1,77 @@
+"""Accuracy and speed of Strassen-Winograd (xGEMMS) against classical xGEMM.
+
+Usage: python benchmarks/bench_strassen.py [SIZE ...]
+
+For each square size (default 512 1024 2048) and a range of cutoffs this
+prints the time of SGEMM/SGEMMS and DGEMM/DGEMMS and the normwise error
+
+    max|C - C_exact| / (max|A| * max|B| * N)
+
+For single precision C_exact is the product computed in double precision.
+For double precision no more accurate product is available, so the error
+is taken against DGEMM itself and measures how far the two algorithms drift
+apart.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas.level3.dgemm import DGEMM
+from pyblas.level3.dgemms import DGEMMS
+from pyblas.level3.sgemm import SGEMM
+from pyblas.level3.sgemms import SGEMMS
+
+
+def best_time(f):
+    return min(timeit.repeat(f, number=1, repeat=3))
+
+
+def error(C, C_exact, A, B):
+    N = A.shape[1]
+    return np.abs(C - C_exact).max() / (np.abs(A).max() * np.abs(B).max() * N)
+
+
+def run(name, classical, strassen, dtype, N, cutoffs, rng):
+    A = rng.uniform(-1, 1, (N, N)).astype(dtype)
+    B = rng.uniform(-1, 1, (N, N)).astype(dtype)
+    C = np.empty((N, N), dtype)
+    T = best_time(lambda: classical("N", "N", N, N, N, 1, A, N, B, N, 0, C, N))
+    C_classical = C.copy()
+    if dtype == np.single:
+        C_exact = A.astype(np.double) @ B.astype(np.double)
+        E = error(C_classical, C_exact, A, B)
+    else:
+        C_exact = C_classical
+        E = 0.0
+    print("%-7s %6d %7s %9.4f %10.2e %8s" % (name, N, "-", T, E, "1.00"))
+    for cutoff in cutoffs:
+        if cutoff >= N:
+            continue
+        TS = best_time(
+            lambda: strassen("N", "N", N, N, N, 1, A, N, B, N, 0, C, N, CUTOFF=cutoff)
+        )
+        ES = error(C, C_exact, A, B)
+        print(
+            "%-7s %6d %7d %9.4f %10.2e %8.2f" % (name + "S", N, cutoff, TS, ES, T / TS)
+        )
+
+
+def main(sizes):
+    rng = np.random.default_rng(0)
+    cutoffs = [128, 256, 512, 1024]
+    print(
+        "%-7s %6s %7s %9s %10s %8s"
+        % ("routine", "N", "cutoff", "time (s)", "error", "speedup")
+    )
+    for N in sizes:
+        run("SGEMM", SGEMM, SGEMMS, np.single, N, cutoffs, rng)
+        run("DGEMM", DGEMM, DGEMMS, np.double, N, cutoffs, rng)
+
+
+if __name__ == "__main__":
+    main([int(N) for N in sys.argv[1:]] or [512, 1024, 2048])
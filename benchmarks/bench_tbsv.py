@@ -0,0 +1,73 @@
+"""Speed of the banded triangular solve DTBSV.
+
+Usage: python benchmarks/bench_tbsv.py [N ...]
+
+For each order N (default 10**4 10**5 10**6) and bandwidth K in 1, 4, 16
+and 64 this prints the time of one lower triangular solve with
+TRANS = 'N' and 'T', the time spent per column of the band, and the
+normwise residual
+
+    max|op(A)*x - b| / (max|A| * max|x| * (K + 1))
+
+The solve is a recurrence over the columns, so the time per column is
+roughly constant until K is large enough for the arithmetic on a column to
+outweigh the cost of a numpy call.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas.level2.dtbsv import DTBSV
+
+BANDWIDTHS = (1, 4, 16, 64)
+
+
+def best_time(f, setup, N):
+    # Large solves take seconds, so they are run only once.
+    repeat = 3 if N <= 10**5 else 1
+    return min(timeit.repeat(f, setup=setup, number=1, repeat=repeat))
+
+
+def residual(trans, N, K, A, x, b):
+    # op(A)*x one diagonal at a time.
+    y = A[0] * x
+    for d in range(1, K + 1):
+        if trans == "N":
+            y[d:] += A[d, : N - d] * x[: N - d]
+        else:
+            y[: N - d] += A[d, : N - d] * x[d:]
+    return np.abs(y - b).max() / (np.abs(A).max() * np.abs(x).max() * (K + 1))
+
+
+def main(sizes):
+    rng = np.random.default_rng(0)
+    print(
+        "%8s %4s %5s %9s %13s %10s"
+        % ("N", "K", "trans", "time (s)", "per col (us)", "residual")
+    )
+    for N in sizes:
+        b = rng.uniform(-1, 1, N)
+        x = np.empty(N)
+        for K in BANDWIDTHS:
+            A = rng.uniform(-1, 1, (K + 1, N)) / (K + 1)
+            A[0] += 2
+            A = np.asfortranarray(A)
+            for trans in "NT":
+                T = best_time(
+                    lambda: DTBSV("L", trans, "N", N, K, A, K + 1, x, 1),
+                    lambda: np.copyto(x, b),
+                    N,
+                )
+                print(
+                    "%8d %4d %5s %9.4f %13.2f %10.2e"
+                    % (N, K, trans, T, 1e6 * T / N, residual(trans, N, K, A, x, b))
+                )
+
+
+if __name__ == "__main__":
+    main([int(N) for N in sys.argv[1:]] or [10**4, 10**5, 10**6])
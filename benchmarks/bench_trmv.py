@@ -0,0 +1,100 @@
+"""Speed of the triangular matrix-vector products by storage format.
+
+Usage: python benchmarks/bench_trmv.py [N ...]
+
+For each order N (default 500 1000 2000) this times x := A*x for a lower
+triangular A held in full (DTRMV), band (DTBMV, K = 16) and packed (DTPMV)
+storage, and compares it with the element-by-element loop of the reference
+routine on the same storage.  The reference loops are slow, so they are timed
+once and only up to N = 2000.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas.level2.dtbmv import DTBMV
+from pyblas.level2.dtpmv import DTPMV
+from pyblas.level2.dtrmv import DTRMV
+
+K = 16
+
+
+def full_loop(N, A, x):
+    for j in range(N - 1, -1, -1):
+        temp = x[j]
+        for i in range(N - 1, j, -1):
+            x[i] += temp * A[i, j]
+        x[j] *= A[j, j]
+
+
+def band_loop(N, A, x):
+    for j in range(N - 1, -1, -1):
+        temp = x[j]
+        for i in range(min(N - 1, j + K), j, -1):
+            x[i] += temp * A[i - j, j]
+        x[j] *= A[0, j]
+
+
+def packed_loop(N, AP, x):
+    kk = N * (N + 1) // 2 - 1
+    for j in range(N - 1, -1, -1):
+        temp = x[j]
+        k = kk
+        for i in range(N - 1, j, -1):
+            x[i] += temp * AP[k]
+            k -= 1
+        x[j] *= AP[kk - N + j + 1]
+        kk -= N - j
+
+
+def best_time(f, setup, repeat=3):
+    return min(timeit.repeat(f, setup=setup, number=1, repeat=repeat))
+
+
+def main(sizes):
+    rng = np.random.default_rng(0)
+    print(
+        "%-7s %6s %11s %14s %9s"
+        % ("format", "N", "time (s)", "loop time (s)", "speedup")
+    )
+    for N in sizes:
+        L = np.asfortranarray(np.tril(rng.uniform(-1, 1, (N, N))))
+        AB = np.asfortranarray(
+            [np.concatenate([np.diag(L, -d), np.zeros(d)]) for d in range(K + 1)]
+        )
+        AP = np.concatenate([L[j:, j] for j in range(N)])
+        b = rng.uniform(-1, 1, N)
+        x = np.empty(N)
+        reset = lambda: np.copyto(x, b)
+        for name, run, loop in [
+            (
+                "full",
+                lambda: DTRMV("L", "N", "N", N, L, N, x, 1),
+                lambda: full_loop(N, L, x),
+            ),
+            (
+                "band",
+                lambda: DTBMV("L", "N", "N", N, K, AB, K + 1, x, 1),
+                lambda: band_loop(N, AB, x),
+            ),
+            (
+                "packed",
+                lambda: DTPMV("L", "N", "N", N, AP, x, 1),
+                lambda: packed_loop(N, AP, x),
+            ),
+        ]:
+            T = best_time(run, reset)
+            if N <= 2000:
+                T_LOOP = best_time(loop, reset, repeat=1)
+                print("%-7s %6d %11.5f %14.4f %9.1f" % (name, N, T, T_LOOP, T_LOOP / T))
+            else:
+                print("%-7s %6d %11.5f %14s %9s" % (name, N, T, "-", "-"))
+
+
+if __name__ == "__main__":
+    main([int(N) for N in sys.argv[1:]] or [500, 1000, 2000])
@@ -0,0 +1,295 @@
+"""Vectorized kernels shared by the level 2 band routines.
+
+The reference routines walk a band matrix one element at a time.  The
+kernels here touch a whole stored column of the band with one numpy
+operation instead, so the Python overhead is paid once per column rather
+than once per element.
+
+Band matrices are passed as the ``(K + 1) x N`` array holding the band, laid
+out as the reference routines expect it, and vectors as 1-D views holding
+their ``N`` elements in order, so the increment of the caller has already
+been applied (see `pyblas.util.slice_`).
+
+The products work along the diagonals of the band rather than its columns,
+so they need only ``K + 1`` numpy operations per `CHUNK` elements of the
+result, however narrow the band.
+
+For an upper triangular band, element ``(I, J)`` of the matrix is stored in
+``A[K + I - J, J]`` and the diagonal is row ``K``; for a lower triangular
+band it is stored in ``A[I - J, J]`` and the diagonal is row ``0``.  For a
+general band with ``KL`` sub- and ``KU`` super-diagonals it is stored in
+``A[KU + I - J, J]``.  Either way every diagonal of the matrix is a row of
+the band storage, so it is read as a strided vector by plain slicing, even
+when `A` is a view of a flat buffer made by `pyblas.util.as_matrix`.
+"""
+
+import numpy as np
+
+from .. import workspace
+from ..util import lsame
+
+# Elements of the result formed per pass over the diagonals of the band in
+# the matrix-vector products.
+CHUNK = 4096
+
+
+def tbsv(UPLO, TRANS, DIAG, A, X):
+    """Solves ``op(A)*x = b`` in place for the triangular band matrix `A`.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, whether `A` is upper or lower triangular
+    TRANS : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    DIAG : str
+        ``'U'`` if `A` has a unit diagonal, which is then not read, else ``'N'``
+    A : numpy.ndarray
+        The ``(K + 1) x N`` band storage of `A`
+    X : numpy.ndarray
+        The ``N`` elements of `b`, overwritten with `x`
+
+    Returns
+    -------
+    None
+    """
+    K = A.shape[0] - 1
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(A)
+    D = A[K] if UPPER else A[0]
+    if CONJ:
+        D = D.conj()
+    if K == 0:
+        # A diagonal matrix needs no substitution at all.
+        if NOUNIT:
+            X /= D
+        return
+    if lsame(TRANS, "N"):
+        # Form  x := inv( A )*x, subtracting each solved element times the
+        # rest of its column from the elements still to be solved.
+        if UPPER:
+            for J in range(N - 1, -1, -1):
+                TEMP = X[J]
+                if TEMP != 0:
+                    if NOUNIT:
+                        TEMP = TEMP / D[J]
+                        X[J] = TEMP
+                    L = min(K, J)
+                    X[J - L : J] -= TEMP * A[K - L : K, J]
+        else:
+            for J in range(N):
+                TEMP = X[J]
+                if TEMP != 0:
+                    if NOUNIT:
+                        TEMP = TEMP / D[J]
+                        X[J] = TEMP
+                    L = min(K, N - 1 - J)
+                    X[J + 1 : J + 1 + L] -= TEMP * A[1 : 1 + L, J]
+    else:
+        # Form  x := inv( A**T )*x  or  x := inv( A**H )*x, each element
+        # being its right hand side less the dot product of its column with
+        # the elements already solved.
+        DOT = np.vdot if CONJ else np.dot
+        if UPPER:
+            for J in range(N):
+                L = min(K, J)
+                TEMP = X[J] - DOT(A[K - L : K, J], X[J - L : J])
+                if NOUNIT:
+                    TEMP = TEMP / D[J]
+                X[J] = TEMP
+        else:
+            for J in range(N - 1, -1, -1):
+                L = min(K, N - 1 - J)
+                TEMP = X[J] - DOT(A[1 : 1 + L, J], X[J + 1 : J + 1 + L])
+                if NOUNIT:
+                    TEMP = TEMP / D[J]
+                X[J] = TEMP
+
+
+def tbmv(UPLO, TRANS, DIAG, A, X):
+    """Forms ``x := op(A)*x`` in place for the triangular band matrix `A`.
+
+    Element ``I`` of ``op(A)*x`` is the sum over the ``K + 1`` diagonals
+    ``L`` of the band of one element of the diagonal times ``x[I + S*L]``,
+    with ``S = 1`` when ``op(A)`` is upper triangular and ``S = -1`` when it
+    is lower triangular.  Chunks of `CHUNK` elements are formed one diagonal
+    at a time in a scratch vector, visiting the chunks in the direction that
+    only reads elements of `x` not yet overwritten.  For ``op(A) = A`` the
+    columns of `A` for which ``x(j)`` is zero are left out, as the reference
+    routines skip them.
+
+    The arguments are those of `tbsv`.
+    """
+    K = A.shape[0] - 1
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOTRANS = lsame(TRANS, "N")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(A)
+    # op(A) is upper triangular, and reads x ahead of each element, for an
+    # upper A or for a lower A transposed.
+    S = 1 if UPPER == NOTRANS else -1
+    D = A[K] if UPPER else A[0]
+    # Only when x has zeros are the columns of A masked, so NaN or Inf in
+    # columns the reference never reads does not spread.
+    NONZERO = X != 0 if NOTRANS and not X.all() else None
+    STARTS = range(0, N, CHUNK)
+    with workspace.borrow((min(N, CHUNK),), np.result_type(A, X)) as ACC:
+        for I0 in STARTS if S == 1 else reversed(STARTS):
+            I1 = min(I0 + CHUNK, N)
+            AT = ACC[: I1 - I0]
+            if not NOUNIT:
+                AT[...] = X[I0:I1]
+            elif CONJ:
+                np.multiply(D[I0:I1].conj(), X[I0:I1], out=AT)
+            else:
+                DT = D[I0:I1]
+                if NONZERO is not None:
+                    DT = np.where(NONZERO[I0:I1], DT, 0)
+                np.multiply(DT, X[I0:I1], out=AT)
+            for L in range(1, K + 1):
+                # Rows I of the chunk with I + S*L inside x.
+                R0, R1 = (I0, min(I1, N - L)) if S == 1 else (max(I0, L), I1)
+                if R0 >= R1:
+                    continue
+                # Element (I, I + S*L) of op(A) is stored in row ROW of A, at
+                # column I + L*S when op(A) = A and at column I otherwise.
+                ROW = K - L if UPPER else L
+                SHIFT = S * L if NOTRANS else 0
+                W = A[ROW, R0 + SHIFT : R1 + SHIFT]
+                if CONJ:
+                    W = W.conj()
+                elif NONZERO is not None:
+                    W = np.where(NONZERO[R0 + SHIFT : R1 + SHIFT], W, 0)
+                AT[R0 - I0 : R1 - I0] += W * X[R0 + S * L : R1 + S * L]
+            X[I0:I1] = AT
+
+
+def gbmv(TRANS, KL, KU, ALPHA, A, X, BETA, Y):
+    """Forms ``y := ALPHA*op(A)*x + BETA*y`` for the general band matrix `A`.
+
+    ``op(A)*x`` is formed as the sum over the ``KL + KU + 1`` diagonals of
+    `A` of the diagonal times a shifted slice of `x`, for chunks of `CHUNK`
+    elements of `y` at a time, so the number of numpy operations grows with
+    the bandwidth and not with the order of `A`.
+
+    Parameters
+    ----------
+    TRANS : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    KL : int
+        Number of sub-diagonals of `A`
+    KU : int
+        Number of super-diagonals of `A`
+    ALPHA : scalar
+        Multiplier of ``op(A)*x``
+    A : numpy.ndarray
+        The ``(KL + KU + 1) x N`` band storage of the ``M x N`` matrix `A`
+    X : numpy.ndarray
+        The elements of `x`, ``N`` of them for ``TRANS = 'N'``, else ``M``
+    BETA : scalar
+        Multiplier of `y`, which is not read when zero
+    Y : numpy.ndarray
+        The elements of `y`, ``M`` of them for ``TRANS = 'N'``, else ``N``,
+        overwritten with the result
+
+    Returns
+    -------
+    None
+    """
+    NOTRANS = lsame(TRANS, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(A)
+    LENX = X.shape[0]
+    LENY = Y.shape[0]
+    if BETA == 0:
+        Y[...] = 0
+    elif BETA != 1:
+        Y *= BETA
+    if ALPHA == 0:
+        return
+    with workspace.borrow((min(LENY, CHUNK),), np.result_type(A, X)) as ACC:
+        for I0 in range(0, LENY, CHUNK):
+            I1 = min(I0 + CHUNK, LENY)
+            AT = ACC[: I1 - I0]
+            AT[...] = 0
+            for D in range(-KL, KU + 1):
+                # Diagonal D holds the elements (I, I + D) of A, in row
+                # KU - D of the band storage at column I + D.
+                if NOTRANS:
+                    # y[I] += A[I, I + D]*x[I + D]
+                    R0, R1 = max(I0, -D), min(I1, LENX - D)
+                    W = A[KU - D, R0 + D : R1 + D]
+                    XD = X[R0 + D : R1 + D]
+                else:
+                    # y[J] += A[J - D, J]*x[J - D]
+                    R0, R1 = max(I0, D), min(I1, LENX + D)
+                    W = A[KU - D, R0:R1]
+                    XD = X[R0 - D : R1 - D]
+                if R0 >= R1:
+                    continue
+                if CONJ:
+                    W = W.conj()
+                AT[R0 - I0 : R1 - I0] += W * XD
+            if ALPHA != 1:
+                AT *= ALPHA
+            Y[I0:I1] += AT
+
+
+def sbmv(UPLO, ALPHA, A, X, BETA, Y, HERM=False):
+    """Forms ``y := ALPHA*A*x + BETA*y`` for the symmetric or Hermitian band `A`.
+
+    Only the `UPLO` triangle of `A` is stored.  Each of its ``K``
+    off-diagonals is read once and gives two products: its own, and that of
+    the matching diagonal of the other triangle, which holds the same
+    elements (conjugated when `HERM`) shifted by the distance between them.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` held in the band storage
+    ALPHA : scalar
+        Multiplier of ``A*x``
+    A : numpy.ndarray
+        The ``(K + 1) x N`` band storage of the `UPLO` triangle of `A`
+    X : numpy.ndarray
+        The ``N`` elements of `x`
+    BETA : scalar
+        Multiplier of `y`, which is not read when zero
+    Y : numpy.ndarray
+        The ``N`` elements of `y`, overwritten with the result
+    HERM : bool
+        Whether `A` is Hermitian, in which case the imaginary parts of its
+        diagonal are not read
+
+    Returns
+    -------
+    None
+    """
+    K = A.shape[0] - 1
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    if BETA == 0:
+        Y[...] = 0
+    elif BETA != 1:
+        Y *= BETA
+    if ALPHA == 0:
+        return
+    D = A[K] if UPPER else A[0]
+    with workspace.borrow((N,), np.result_type(A, X)) as Z:
+        np.multiply(D.real if HERM else D, X, out=Z)
+        for L in range(1, min(K, N - 1) + 1):
+            # W[I] is element (I, I + L) of A for an upper triangle and
+            # element (I + L, I) for a lower one, I = 0, ..., N - L - 1.
+            W = A[K - L, L:] if UPPER else A[L, : N - L]
+            WT = W.conj() if HERM else W
+            if UPPER:
+                Z[: N - L] += W * X[L:]
+                Z[L:] += WT * X[: N - L]
+            else:
+                Z[L:] += W * X[: N - L]
+                Z[: N - L] += WT * X[L:]
+        if ALPHA != 1:
+            Z *= ALPHA
+        Y += Z
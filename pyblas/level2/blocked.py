@@ -0,0 +1,430 @@
+"""Blocked kernels shared by the level 2 routines on full storage.
+
+The reference routines visit a matrix one element at a time.  The kernels in
+this module split it into panels of at most `NB` columns.  Only the work on
+the small diagonal blocks is done column by column; the rest is a single
+matrix-vector product per panel, which numpy hands to an optimized GEMV.
+
+Matrices are passed exactly ``N x N`` in their stored orientation and
+vectors as 1-D views holding their ``N`` elements in order, so the increment
+of the caller has already been applied (see `pyblas.util.slice_`).
+"""
+
+import numpy as np
+
+from .. import workspace
+from ..util import lsame
+
+# Columns of a panel, the order of the diagonal blocks done column by column.
+NB = 64
+
+# Rows of the off-diagonal tiles of `symv`, each read by two products in a
+# row and so best kept within the cache.
+MB = 2048
+
+# Bytes of the scratch panel of `ger`, which holds a whole number of columns
+# of the update.
+PANEL_BYTES = 1 << 19
+
+
+def _panels(N, FORWARD):
+    # The (J0, J1) bounds of the panels, in the order they are visited.
+    BOUNDS = [(J0, min(J0 + NB, N)) for J0 in range(0, N, NB)]
+    return BOUNDS if FORWARD else BOUNDS[::-1]
+
+
+def gemv(TRANS, ALPHA, A, X, BETA, Y):
+    """Forms ``y := ALPHA*op(A)*x + BETA*y`` for the general matrix `A`.
+
+    The product is a single matrix-vector product on `A` as it is stored,
+    ``x**T*A`` (or ``(x**H*A)**H``) standing in for ``A**T*x`` (or
+    ``A**H*x``), so `A` is never copied.
+
+    Parameters
+    ----------
+    TRANS : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    ALPHA : scalar
+        Multiplier of ``op(A)*x``
+    A : numpy.ndarray
+        The ``M x N`` matrix `A`
+    X : numpy.ndarray
+        The elements of `x`, ``N`` of them for ``'N'`` and ``M`` otherwise
+    BETA : scalar
+        Multiplier of `y`, which is not read when zero
+    Y : numpy.ndarray
+        The elements of `y`, overwritten with the result
+
+    Returns
+    -------
+    None
+    """
+    if BETA == 0:
+        Y[...] = 0
+    elif BETA != 1:
+        Y *= BETA
+    if ALPHA == 0:
+        return
+    with workspace.borrow(Y.shape, np.result_type(A, X)) as Z:
+        if lsame(TRANS, "N"):
+            np.matmul(A, X, out=Z)
+        elif lsame(TRANS, "C") and np.iscomplexobj(A):
+            np.matmul(X.conj(), A, out=Z)
+            np.conjugate(Z, out=Z)
+        else:
+            np.matmul(X, A, out=Z)
+        if ALPHA != 1:
+            Z *= ALPHA
+        Y += Z
+
+
+def syr(UPLO, ALPHA, X, Y, A, HERM=False):
+    """Forms the rank 1 or rank 2 update of a symmetric or Hermitian matrix.
+
+    ``A := ALPHA*x*x**T + A`` if `Y` is None, else
+    ``A := ALPHA*x*y**T + ALPHA*y*x**T + A``, on the `UPLO` triangle of `A`
+    only.  With `HERM` the transposes are conjugate transposes, the second
+    term of the rank 2 update is multiplied by ``conj(ALPHA)`` and the
+    diagonal of `A` is made real, as in ``xHER`` and ``xHER2``.
+
+    The update of a panel of `NB` columns is formed with one outer product
+    per term in a scratch panel.  The part of it off the diagonal block is
+    added at once and the diagonal block column by column, within the
+    triangle.  Columns ``j`` with ``x(j)`` (and ``y(j)``) zero are left
+    untouched, as in the reference routines.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` to update
+    ALPHA : scalar
+        Multiplier of the update, real for a Hermitian rank 1 update
+    X : numpy.ndarray
+        The ``N`` elements of `x`
+    Y : numpy.ndarray or None
+        The ``N`` elements of `y`, for a rank 2 update
+    A : numpy.ndarray
+        The ``N x N`` matrix `A`, overwritten with the result
+    HERM : bool
+        Whether `A` is Hermitian
+
+    Returns
+    -------
+    None
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    XT = X.conj() if HERM else X
+    if Y is None:
+        TERMS = [(ALPHA * X, XT)]
+        SKIP = X == 0
+    else:
+        TERMS = [
+            (ALPHA * X, Y.conj() if HERM else Y),
+            ((ALPHA.conjugate() if HERM else ALPHA) * Y, XT),
+        ]
+        SKIP = (X == 0) & (Y == 0)
+    NBLOCK = min(N, NB)
+    with workspace.borrow((N, 2 * NBLOCK), A.dtype, "F") as SCRATCH:
+        for J0, J1 in _panels(N, True):
+            W = J1 - J0
+            R0, R1 = (0, J1) if UPPER else (J0, N)
+            P, Q = SCRATCH[: R1 - R0, :W], SCRATCH[: R1 - R0, W : 2 * W]
+            for T, (U, V) in enumerate(TERMS):
+                np.multiply.outer(U[R0:R1], V[J0:J1], out=Q if T else P)
+                if T:
+                    P += Q
+            ZERO = SKIP[J0:J1]
+            if ZERO.any():
+                P[:, ZERO] = 0
+            if UPPER:
+                A[:J0, J0:J1] += P[:J0]
+                for J in range(J0, J1):
+                    A[J0 : J + 1, J] += P[J0 : J + 1, J - J0]
+            else:
+                A[J1:, J0:J1] += P[W:]
+                for J in range(J0, J1):
+                    A[J:J1, J] += P[J - J0 : W, J - J0]
+            if HERM:
+                D = np.arange(J0, J1)
+                A[D, D] = A[D, D].real
+
+
+def _nonzero_columns(A, XB):
+    # Returns A and XB without the columns of A for which XB is zero, as the
+    # reference routines skip them, so NaN or Inf there does not spread.
+    NONZERO = XB != 0
+    if NONZERO.all():
+        return A, XB
+    return A[:, NONZERO], XB[NONZERO]
+
+
+def _subtract_product(A, XB, Y):
+    # Forms Y := Y - A*XB, leaving out the columns of A for which XB is zero.
+    A, XB = _nonzero_columns(A, XB)
+    Y -= A @ XB
+
+
+def _subtract_transposed(A, X, YB, CONJ):
+    # Forms YB := YB - A**T*X, or YB - A**H*X with CONJ, without copying A.
+    if CONJ:
+        YB -= (X.conj() @ A).conj()
+    else:
+        YB -= X @ A
+
+
+def trsv(UPLO, TRANS, DIAG, A, X):
+    """Solves ``op(A)*x = b`` in place for the triangular matrix `A`.
+
+    Inside a diagonal block the solve follows the loops of the reference
+    routines, so for real `A`, ``TRANS = 'N'`` and ``N <= NB`` the result is
+    the reference one bit for bit.  The panel products (and, for ``'T'`` and
+    ``'C'``, the dot products inside a block) sum in another order, so
+    otherwise the result may differ from the reference by rounding: for a
+    well-conditioned `A` by a few units in the last place of the largest
+    element of `x`.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, whether `A` is upper or lower triangular
+    TRANS : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    DIAG : str
+        ``'U'`` if `A` has a unit diagonal, which is then not read, else ``'N'``
+    A : numpy.ndarray
+        The ``N x N`` matrix `A`, only its `UPLO` triangle is read
+    X : numpy.ndarray
+        The ``N`` elements of `b`, overwritten with `x`
+
+    Returns
+    -------
+    None
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(A)
+    if lsame(TRANS, "N"):
+        # Form  x := inv( A )*x.  Each diagonal block is solved by columns,
+        # then its solution is subtracted from the rest of x at once.
+        for J0, J1 in _panels(N, not UPPER):
+            COLUMNS = range(J1 - 1, J0 - 1, -1) if UPPER else range(J0, J1)
+            for J in COLUMNS:
+                TEMP = X[J]
+                if TEMP != 0:
+                    if NOUNIT:
+                        TEMP = TEMP / A[J, J]
+                        X[J] = TEMP
+                    if UPPER:
+                        X[J0:J] -= TEMP * A[J0:J, J]
+                    else:
+                        X[J + 1 : J1] -= TEMP * A[J + 1 : J1, J]
+            if UPPER:
+                _subtract_product(A[:J0, J0:J1], X[J0:J1], X[:J0])
+            else:
+                _subtract_product(A[J1:, J0:J1], X[J0:J1], X[J1:])
+    else:
+        # Form  x := inv( A**T )*x  or  x := inv( A**H )*x.  The elements
+        # already solved are subtracted from each block at once, then the
+        # block is solved by columns.
+        DOT = np.vdot if CONJ else np.dot
+        for J0, J1 in _panels(N, UPPER):
+            if UPPER:
+                _subtract_transposed(A[:J0, J0:J1], X[:J0], X[J0:J1], CONJ)
+                COLUMNS = range(J0, J1)
+            else:
+                _subtract_transposed(A[J1:, J0:J1], X[J1:], X[J0:J1], CONJ)
+                COLUMNS = range(J1 - 1, J0 - 1, -1)
+            for J in COLUMNS:
+                if UPPER:
+                    TEMP = X[J] - DOT(A[J0:J, J], X[J0:J])
+                else:
+                    TEMP = X[J] - DOT(A[J + 1 : J1, J], X[J + 1 : J1])
+                if NOUNIT:
+                    D = A[J, J]
+                    TEMP = TEMP / (D.conjugate() if CONJ else D)
+                X[J] = TEMP
+
+
+def _diagonal_block(A, UPPER, NOUNIT, OUT):
+    # Copies the UPPER or lower triangle of the square block A into OUT,
+    # zeroing the rest and putting ones on a unit diagonal.
+    OUT[...] = np.triu(A) if UPPER else np.tril(A)
+    if not NOUNIT:
+        np.fill_diagonal(OUT, 1)
+    return OUT
+
+
+def trmv(UPLO, TRANS, DIAG, A, X):
+    """Forms ``x := op(A)*x`` in place for the triangular matrix `A`.
+
+    Block row ``I`` of ``op(A)*x`` only needs the elements of `x` on one side
+    of block ``I``: those above it when ``op(A)`` is lower triangular and
+    those below it when it is upper triangular.  Visiting the blocks from the
+    far end, each block of the result is formed in a scratch vector of `NB`
+    elements from parts of `x` not yet overwritten, then stored back.  For
+    ``op(A) = A`` the columns of `A` for which ``x(j)`` is zero are left out,
+    as the reference routines skip them.
+
+    The arguments are those of `trsv`.
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOTRANS = lsame(TRANS, "N")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(A)
+    # op(A) is lower triangular for a lower A, or for an upper A transposed.
+    LOWER = UPPER != NOTRANS
+    NBLOCK = min(N, NB)
+    with workspace.borrow((NBLOCK,), np.result_type(A, X)) as ACC, workspace.borrow(
+        (NBLOCK, NBLOCK), A.dtype, "F"
+    ) as D:
+        for I0, I1 in _panels(N, not LOWER):
+            K0, K1 = (0, I0) if LOWER else (I1, N)
+            AT = ACC[: I1 - I0]
+            DT = _diagonal_block(
+                A[I0:I1, I0:I1], UPPER, NOUNIT, D[: I1 - I0, : I1 - I0]
+            )
+            if NOTRANS:
+                AK, XK = _nonzero_columns(A[I0:I1, K0:K1], X[K0:K1])
+                np.matmul(AK, XK, out=AT)
+                DT, XB = _nonzero_columns(DT, X[I0:I1])
+                AT += DT @ XB
+            elif CONJ:
+                # A**H*x is conj(x**H*A); conjugating x in place and back is
+                # exact and needs no copy of A or of x.
+                XK = X[K0:K1]
+                np.conjugate(XK, out=XK)
+                np.matmul(XK, A[K0:K1, I0:I1], out=AT)
+                np.conjugate(XK, out=XK)
+                XB = X[I0:I1]
+                np.conjugate(XB, out=XB)
+                AT += XB @ DT
+                np.conjugate(AT, out=AT)
+            else:
+                np.matmul(X[K0:K1], A[K0:K1, I0:I1], out=AT)
+                AT += X[I0:I1] @ DT
+            X[I0:I1] = AT
+
+
+def _symmetric_block(A, UPPER, HERM, OUT):
+    # Fills OUT with the symmetric, or Hermitian, square block whose UPPER or
+    # lower triangle is stored in the diagonal block A.
+    OUT[...] = np.triu(A) if UPPER else np.tril(A)
+    STRICT = np.triu(A, 1) if UPPER else np.tril(A, -1)
+    OUT += STRICT.T.conj() if HERM else STRICT.T
+    if HERM:
+        np.fill_diagonal(OUT, A.diagonal().real)
+    return OUT
+
+
+def symv(UPLO, ALPHA, A, X, BETA, Y, HERM=False):
+    """Forms ``y := ALPHA*A*x + BETA*y`` for the symmetric or Hermitian matrix `A`.
+
+    Only the `UPLO` triangle of `A` is read, a panel of `NB` columns at a
+    time, each exactly once.  The diagonal block of a panel is completed
+    from its stored triangle in a scratch tile.  The rest of the panel is
+    split into tiles of at most `MB` rows, and a tile ``T`` covering rows
+    ``I`` and columns ``J`` gives both its own product, ``T*x[J]`` added to
+    ``y[I]``, and that of its mirror image in the other triangle,
+    ``T**T*x[I]`` (or ``T**H*x[I]``) added to ``y[J]``, while it is still in
+    cache.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` to read
+    ALPHA : scalar
+        Multiplier of ``A*x``
+    A : numpy.ndarray
+        The ``N x N`` matrix `A`
+    X : numpy.ndarray
+        The ``N`` elements of `x`
+    BETA : scalar
+        Multiplier of `y`, which is not read when zero
+    Y : numpy.ndarray
+        The ``N`` elements of `y`, overwritten with the result
+    HERM : bool
+        Whether `A` is Hermitian, in which case the imaginary parts of its
+        diagonal are not read
+
+    Returns
+    -------
+    None
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    if BETA == 0:
+        Y[...] = 0
+    elif BETA != 1:
+        Y *= BETA
+    if ALPHA == 0:
+        return
+    NBLOCK = min(N, NB)
+    with workspace.borrow((N,), np.result_type(A, X)) as Z, workspace.borrow(
+        (NBLOCK, NBLOCK), A.dtype, "F"
+    ) as D:
+        Z[...] = 0
+        for J0, J1 in _panels(N, True):
+            DT = _symmetric_block(A[J0:J1, J0:J1], UPPER, HERM, D[: J1 - J0, : J1 - J0])
+            Z[J0:J1] += DT @ X[J0:J1]
+            # The tiles of the panel in the stored triangle, above the
+            # diagonal block for UPPER and below it otherwise.
+            R0, R1 = (0, J0) if UPPER else (J1, N)
+            for I0 in range(R0, R1, MB):
+                I1 = min(I0 + MB, R1)
+                T = A[I0:I1, J0:J1]
+                Z[I0:I1] += T @ X[J0:J1]
+                if HERM:
+                    Z[J0:J1] += (X[I0:I1].conj() @ T).conj()
+                else:
+                    Z[J0:J1] += X[I0:I1] @ T
+        if ALPHA != 1:
+            Z *= ALPHA
+        Y += Z
+
+
+def ger(ALPHA, X, Y, A, CONJ=False):
+    """Forms ``A := ALPHA*x*y**T + A``, or ``ALPHA*x*y**H + A`` with `CONJ`.
+
+    The update is formed a panel of whole columns at a time in a scratch
+    array of about `PANEL_BYTES`, with a single outer product, and then added
+    to `A`.  Columns for which ``y(j)`` is zero are left untouched, as in the
+    reference routines, even where `x` holds infinities or NaNs.
+
+    Parameters
+    ----------
+    ALPHA : scalar
+        Multiplier of the update
+    X : numpy.ndarray
+        The ``M`` elements of `x`
+    Y : numpy.ndarray
+        The ``N`` elements of `y`
+    A : numpy.ndarray
+        The ``M x N`` matrix `A`, overwritten with the result
+    CONJ : bool
+        Whether to conjugate `y`
+
+    Returns
+    -------
+    None
+    """
+    M, N = A.shape
+    WIDTH = max(1, min(N, PANEL_BYTES // max(1, M * A.itemsize)))
+    with workspace.borrow((M, WIDTH), A.dtype, "F") as P, workspace.borrow(
+        (WIDTH,), A.dtype
+    ) as W:
+        for J0 in range(0, N, WIDTH):
+            J1 = min(J0 + WIDTH, N)
+            PANEL, YB = P[:, : J1 - J0], W[: J1 - J0]
+            if CONJ:
+                np.conjugate(Y[J0:J1], out=YB)
+                YB *= ALPHA
+            else:
+                np.multiply(Y[J0:J1], ALPHA, out=YB)
+            np.multiply.outer(X, YB, out=PANEL)
+            ZERO = Y[J0:J1] == 0
+            if ZERO.any():
+                PANEL[:, ZERO] = 0
+            A[:, J0:J1] += PANEL
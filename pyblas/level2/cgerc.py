@@ -128,7 +128,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from xerbla import xerbla
+from ..util import as_matrix, slice_
+from ..xerbla import xerbla
+from .blocked import ger
 
 
 def cgerc(M, N, ALPHA, X, INCX, Y, INCY, A, LDA):
@@ -164,31 +166,12 @@ def cgerc(M, N, ALPHA, X, INCX, Y, INCY, A, LDA):
         xerbla("CGERC ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, M, N)
+
     # Quick return if possible.
     if (M == 0) or (N == 0) or (ALPHA == 0):
         return
 
-    # Start the operations. In this version the elements of A are
-    # accessed sequentially with one pass through A.
-    if INCY > 0:
-        JY = 1
-    else:
-        JY = 1 - (N - 1) * INCY
-    if INCX == 1:
-        for J in range(N):
-            if Y[JY] != 0:
-                A[:M, J] += X[:M] * ALPHA * Y[JY].conjugate()
-            JY += INCY
-    else:
-        if INCX > 0:
-            KX = 1
-        else:
-            KX = 1 - (M - 1) * INCX
-        for J in range(N):
-            if Y[JY] != 0:
-                TEMP = ALPHA * Y[JY].conjugate()
-                IX = KX
-                for I in range(M):
-                    A[I, J] += X[IX] * TEMP
-                    IX += INCX
-            JY += INCY
+    # Start the operations, forming the update a panel of columns at a time.
+    ger(ALPHA, X[slice_(M, INCX)], Y[slice_(N, INCY)], A[:M, :N], CONJ=True)
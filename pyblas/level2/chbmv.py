@@ -185,8 +185,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .banded import sbmv
 
 
 def CHBMV(UPLO, N, K, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
@@ -246,93 +247,20 @@ def CHBMV(UPLO, N, K, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
         xerbla("CHBMV ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, K + 1, N)
+
     # Quick return if possible.
     if (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    #     Set up the start points in  X  and  Y.
-    #
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (N - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (N - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of the array A
-    #     are accessed sequentially with one pass through A.
-    #
-    # First form  y := beta*y.
-    if INCY > 0:
-        Y[: N * INCY : INCY] *= BETA
-    else:
-        Y[-(N - 1) * INCY :: INCY] *= BETA
 
-    if ALPHA == 0:
-        return
-    if lsame(UPLO, "U"):
-        #
-        #        Form  y  when upper triangle of A is stored.
-        #
-        KPLUS1 = K + 1
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                L = KPLUS1 - J
-                for I in range(max(1, J - K) - 1, J - 1):
-                    Y[I] += TEMP1 * A[L + I, J]
-                    TEMP2 += A[L + I, J].conjugate() * X[I]
-                Y[J] += TEMP1 * A[KPLUS1, J].real + ALPHA * TEMP2
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                IX = KX
-                IY = KY
-                L = KPLUS1 - J
-                for I in range(max(1, J - K) - 1, J - 1):
-                    Y[IY] += TEMP1 * A[L + I, J]
-                    TEMP2 += A[L + I, J].conjugate() * X[IX]
-                    IX += INCX
-                    IY += INCY
-                Y[JY] += TEMP1 * A[KPLUS1, J].real + ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
-                if J > K:
-                    KX += INCX
-                    KY += INCY
-    else:
-        # Form  y  when lower triangle of A is stored.
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                Y[J] += TEMP1 * A[1, J].real
-                L = 1 - J
-                for I in range(J, min(N, J + K)):
-                    Y[I] += TEMP1 * A[L + I, J]
-                    TEMP2 += A[L + I, J].conjugate() * X[I]
-                Y[J] += ALPHA * TEMP2
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                Y[JY] += TEMP1 * A[1, J].real
-                L = 1 - J
-                IX = JX
-                IY = JY
-                for I in range(J, min(N, J + K)):
-                    IX += INCX
-                    IY += INCY
-                    Y[IY] += TEMP1 * A[L + I, J]
-                    TEMP2 += A[L + I, J].conjugate() * X[IX]
-                Y[JY] += ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
+    # Start the operations, reading each stored diagonal of A once.
+    sbmv(
+        UPLO,
+        ALPHA,
+        A[: K + 1, :N],
+        X[slice_(N, INCX)],
+        BETA,
+        Y[slice_(N, INCY)],
+        HERM=True,
+    )
@@ -152,8 +152,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import symv
 
 
 def CHEMV(UPLO, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
@@ -211,81 +212,14 @@ def CHEMV(UPLO, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
         xerbla("CHEMV ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
+
     # Quick return if possible.
     if (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    #     Set up the start points in  X  and  Y.
-    #
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (N - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (N - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the triangular part
-    #     of A.
-    #
-    # First form  y := beta*y.
-    Y[slice_(N, INCY)] *= BETA
 
-    if ALPHA == 0:
-        return
-    if lsame(UPLO, "U"):
-        # Form  y  when A is stored in upper triangle.
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                for I in range(J - 1):
-                    Y[I] += TEMP1 * A[I, J]
-                    TEMP2 += A[1, J].conjugate() * X[I]
-                Y[J] += TEMP1 * A[J, J].real + ALPHA * TEMP2
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                IX = KX
-                IY = KY
-                for I in range(J - 1):
-                    Y[IY] += TEMP1 * A[I, J]
-                    TEMP2 += A[1, J].conjugate() * X[IX]
-                    IX += INCX
-                    IY += INCY
-                Y[JY] += TEMP1 * A[J, J].real + ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
-    else:
-        # Form  y  when A is stored in lower triangle.
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                Y[J] += TEMP1 * A[J, J].real
-                for I in range(J, N):
-                    Y[I] += TEMP1 * A[I, J]
-                    TEMP2 += A[1, J].conjugate() * X[I]
-                Y[J] += ALPHA * TEMP2
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                Y[JY] += TEMP1 * A[J, J].real
-                IX = JX
-                IY = JY
-                for I in range(J, N):
-                    IX += INCX
-                    IY += INCY
-                    Y[IY] += TEMP1 * A[I, J]
-                    TEMP2 += A[1, J].conjugate() * X[IX]
-                Y[JY] += ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
+    # Start the operations, reading each tile of the UPLO triangle once.
+    symv(
+        UPLO, ALPHA, A[:N, :N], X[slice_(N, INCX)], BETA, Y[slice_(N, INCY)], HERM=True
+    )
@@ -133,8 +133,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import syr
 
 
 def CHER(UPLO, N, ALPHA, X, INCX, A, LDA):
@@ -188,66 +189,12 @@ def CHER(UPLO, N, ALPHA, X, INCX, A, LDA):
         xerbla("CHER  ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
+
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set the start point in X if the increment is not unity.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the triangular part
-    #     of A.
-    #
-    if lsame(UPLO, "U"):
-        # Form  A  when A is stored in upper triangle.
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * (X[J]).conjugate()
-                    for I in range(J - 1):
-                        A[I, J] += X[I] * TEMP
-                    A[J, J] = A[J, J] + (X[J] * TEMP).real
-                else:
-                    A[J, J] = A[J, J].real
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * (X[JX]).conjugate()
-                    IX = KX
-                    for I in range(J - 1):
-                        A[I, J] += X[IX] * TEMP
-                        IX += INCX
-                    A[J, J] = A[J, J].real + (X[JX] * TEMP).real
-                else:
-                    A[J, J] = A[J, J].real
-                JX += INCX
-    else:
-        # Form  A  when A is stored in lower triangle.
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * (X[J]).conjugate()
-                    A[J, J] = A[J, J].real + (TEMP * X[J]).real
-                    for I in range(J, N):
-                        A[I, J] += X[I] * TEMP
-                else:
-                    A[J, J] = A[J, J].real
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * (X[JX]).conjugate()
-                    A[J, J] = A[J, J].real + (TEMP * X[JX]).real
-                    IX = JX
-                    for I in range(J, N):
-                        IX += INCX
-                        A[I, J] += X[IX] * TEMP
-                else:
-                    A[J, J] = A[J, J].real
-                JX += INCX
+
+    # Start the operations, a panel of columns of the UPLO triangle at a time.
+    syr(UPLO, ALPHA, X[slice_(N, INCX)], None, A[:N, :N], HERM=True)
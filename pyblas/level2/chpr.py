@@ -128,8 +128,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import spr
 
 
 def chpr(UPLO, N, ALPHA, X, INCX, AP):
@@ -160,76 +161,11 @@ def chpr(UPLO, N, ALPHA, X, INCX, AP):
         INFO = 5
     if INFO != 0:
         xerbla("CHPR  ", INFO)
+        return
 
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
 
-    # Set the start point in X if the increment is not unity.
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-
-    # Start the operations. In this version the elements of the array AP
-    # are accessed sequentially with one pass through AP.
-    if lsame(UPLO, "U"):
-        # Form  A  when upper triangle is stored in AP.
-        if INCX == 1:
-            KK = 1
-            for J in range(N):
-                JM1 = J - 1
-                if X[J] != 0:
-                    TEMP = ALPHA * (X[J]).conjugate()
-                    AP[KK : KK + JM1] += X[:JM1] * TEMP
-                    # Diagonal term
-                    AP[KK + JM1] = AP[KK + JM1].real + (X[J] * TEMP).real
-                else:
-                    AP[KK + JM1] = AP[KK + JM1].real
-                KK += J
-        else:
-            KK = 1
-            JX = KX
-            for J in range(N):
-                JM1 = J - 1
-                if X[JX] != 0:
-                    TEMP = ALPHA * (X[JX]).conjugate()
-                    IX = KX
-                    for K in range(KK - 1, KK + JM1 - 1):
-                        AP[K] += X[IX] * TEMP
-                        IX += INCX
-                    AP[KK + JM1] = AP[KK + JM11].real + (X[JX] * TEMP).real
-                else:
-                    AP[KK + JM1] = AP[KK + JM1].real
-                JX += INCX
-                KK += J
-    else:
-        # Form  A  when lower triangle is stored in AP.
-        if INCX == 1:
-            KK = 1
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * (X[J]).conjugate()
-                    AP[KK] = (AP[KK]).real + (TEMP * X[J]).real
-                    K = KK + 1
-                    for I in range(J, N):
-                        AP[K] += X[I] * TEMP
-                        K += 1
-                else:
-                    AP[KK] = (AP[KK]).real
-                KK += N - J + 1
-        else:
-            KK = 1
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * (X[JX]).conjugate()
-                    AP[KK] = (AP[KK]).real + (TEMP * X[JX]).real
-                    IX = JX
-                    for K in range(KK, KK + N - J):
-                        IX += INCX
-                        AP[K] += X[IX] * TEMP
-                else:
-                    AP[KK] = (AP[KK]).real
-                JX += INCX
-                KK += N - J + 1
+    # Start the operations, updating the whole packed triangle at once.
+    spr(UPLO, ALPHA, X[slice_(N, INCX)], None, AP, HERM=True)
@@ -140,8 +140,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import tpmv
 
 
 def CTPMV(UPLO, TRANS, DIAG, N, AP, X, INCX):
@@ -180,156 +181,6 @@ def CTPMV(UPLO, TRANS, DIAG, N, AP, X, INCX):
     # Quick return if possible.
     if N == 0:
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    NOUNIT = lsame(DIAG, "N")
-    #
-    #     Set up the start point in X if the increment is not unity. This
-    #     will be  ( N - 1 )*INCX  too small for descending loops.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of AP are
-    #     accessed sequentially with one pass through AP.
-    #
-    if lsame(TRANS, "N"):
-        # Form  x:= A*x.
-        if lsame(UPLO, "U"):
-            if INCX == 1:
-                KK = 1
-                for J in range(N):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        K = KK
-                        for I in range(J - 1):
-                            X[I] += TEMP * AP[K]
-                            K += 1
-                        if NOUNIT:
-                            X[J] = X[J] * AP[KK + J - 1]
-                    KK += J
-            else:
-                KK = 1
-                JX = KX
-                for J in range(N):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        for K in range(KK - 1, KK + J - 2):
-                            X[IX] = X[IX] + TEMP * AP[K]
-                            IX += INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * AP[KK + J - 1]
-                    JX += INCX
-                    KK += J
-        else:
-            KK = (N * (N + 1)) / 2
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        K = KK
-                        for I in range(N - 1, J - 1, -1):
-                            X[I] += TEMP * AP[K]
-                            K -= 1
-                        if NOUNIT:
-                            X[J] = X[J] * AP[KK - N + J]
-                    KK -= N - J + 1
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        for K in range(KK - 1, KK - (N - (J + 1)) - 2, -1):
-                            X[IX] = X[IX] + TEMP * AP[K]
-                            IX -= INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * AP[KK - N + J]
-                    JX -= INCX
-                    KK -= N - J + 1
-    else:
-        # Form  x := A**T*x  or  x := A**H*x.
-        if lsame(UPLO, "U"):
-            KK = (N * (N + 1)) / 2
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[J]
-                    K = KK - 1
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * AP[KK]
-                        for I in range(J - 2, -1, -1):
-                            TEMP += AP[K] * X[I]
-                            K -= 1
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * (AP[KK]).conjugate()
-                        for I in range(J - 2, -1, -1):
-                            TEMP += AP[K].conjugate() * X[I]
-                            K -= 1
-                    X[J] = TEMP
-                    KK -= J
-            else:
-                JX = KX + (N - 1) * INCX
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[JX]
-                    IX = JX
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * AP[KK]
-                        for K in range(KK - 2, KK - J - 2, -1):
-                            IX -= INCX
-                            TEMP += AP[K] * X[IX]
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * (AP[KK]).conjugate()
-                        for K in range(KK - 2, KK - J - 2, -1):
-                            IX -= INCX
-                            TEMP += AP[K].conjugate() * X[IX]
-                    X[JX] = TEMP
-                    JX -= INCX
-                    KK -= J
-        else:
-            KK = 1
-            if INCX == 1:
-                for J in range(N):
-                    TEMP = X[J]
-                    K = KK + 1
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * AP[KK]
-                        for I in range(J, N):
-                            TEMP += AP[K] * X[I]
-                            K += 1
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * (AP[KK]).conjugate()
-                        for I in range(J, N):
-                            TEMP += AP[K].conjugate() * X[I]
-                            K += 1
-                    X[J] = TEMP
-                    KK += N - J + 1
-            else:
-                JX = KX
-                for J in range(N):
-                    TEMP = X[JX]
-                    IX = JX
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * AP[KK]
-                        for K in range(KK, KK + N - J):
-                            IX += INCX
-                            TEMP += AP[K] * X[IX]
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * (AP[KK]).conjugate()
-                        for K in range(KK, KK + N - J):
-                            IX += INCX
-                            TEMP += AP[K].conjugate() * X[IX]
-                    X[JX] = TEMP
-                    JX += INCX
-                    KK += N - J + 1
+
+    # Start the operations, one vectorized operation per column of A.
+    tpmv(UPLO, TRANS, DIAG, AP, X[slice_(N, INCX)])
@@ -145,8 +145,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import spmv
 
 
 def DSPMV(UPLO, N, ALPHA, AP, X, INCX, BETA, Y, INCY):
@@ -200,93 +201,6 @@ def DSPMV(UPLO, N, ALPHA, AP, X, INCX, BETA, Y, INCY):
     # Quick return if possible.
     if (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    #     Set up the start points in  X  and  Y.
-    #
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (N - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (N - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of the array AP
-    #     are accessed sequentially with one pass through AP.
-    #
-    # First form  y := beta*y.
-    if INCY > 0:
-        Y[: N * INCY : INCY] *= BETA
-    else:
-        Y[-(N - 1) * INCY :: INCY] *= BETA
 
-    if ALPHA == 0:
-        return
-    KK = 1
-    if lsame(UPLO, "U"):
-        #
-        #        Form  y  when AP contains the upper triangle.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                K = KK
-                for I in range(J - 1):
-                    Y[I] += TEMP1 * AP[K]
-                    TEMP2 += AP[K] * X[I]
-                    K += 1
-                Y[J] += TEMP1 * AP[KK + J - 1] + ALPHA * TEMP2
-                KK += J
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                IX = KX
-                IY = KY
-                for K in range(KK - 1, KK + J - 2):
-                    Y[IY] += TEMP1 * AP[K]
-                    TEMP2 += AP[K] * X[IX]
-                    IX += INCX
-                    IY += INCY
-                Y[JY] += TEMP1 * AP[KK + J - 1] + ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
-                KK += J
-    else:
-        #
-        #        Form  y  when AP contains the lower triangle.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * X[J]
-                TEMP2 = 0
-                Y[J] += TEMP1 * AP[KK]
-                K = KK + 1
-                for I in range(J, N):
-                    Y[I] += TEMP1 * AP[K]
-                    TEMP2 += AP[K] * X[I]
-                    K += 1
-                Y[J] += ALPHA * TEMP2
-                KK += N - J + 1
-        else:
-            JX = KX
-            JY = KY
-            for J in range(N):
-                TEMP1 = ALPHA * X[JX]
-                TEMP2 = 0
-                Y[JY] += TEMP1 * AP[KK]
-                IX = JX
-                IY = JY
-                for K in range(KK, KK + N - J):
-                    IX += INCX
-                    IY += INCY
-                    Y[IY] += TEMP1 * AP[K]
-                    TEMP2 += AP[K] * X[IX]
-                Y[JY] += ALPHA * TEMP2
-                JX += INCX
-                JY += INCY
-                KK += N - J + 1
+    # Start the operations, reading each column of AP once.
+    spmv(UPLO, ALPHA, AP, X[slice_(N, INCX)], BETA, Y[slice_(N, INCY)])
@@ -140,8 +140,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import spr
 
 
 def DSPR2(UPLO, N, ALPHA, X, INCX, Y, INCY, AP):
@@ -195,79 +196,6 @@ def DSPR2(UPLO, N, ALPHA, X, INCX, Y, INCY, AP):
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set up the start points in X and Y if the increments are not both
-    #     unity.
-    #
-    if (INCX != 1) or (INCY != 1):
-        if INCX > 0:
-            KX = 1
-        else:
-            KX = 1 - (N - 1) * INCX
-        if INCY > 0:
-            KY = 1
-        else:
-            KY = 1 - (N - 1) * INCY
-        JX = KX
-        JY = KY
-    #
-    #     Start the operations. In this version the elements of the array AP
-    #     are accessed sequentially with one pass through AP.
-    #
-    KK = 1
-    if lsame(UPLO, "U"):
-        #
-        #        Form  A  when upper triangle is stored in AP.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * Y[J]
-                    TEMP2 = ALPHA * X[J]
-                    K = KK
-                    for I in range(J):
-                        AP[K] += X[I] * TEMP1 + Y[I] * TEMP2
-                        K += 1
-                KK += J
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY]
-                    TEMP2 = ALPHA * X[JX]
-                    IX = KX
-                    IY = KY
-                    for K in range(KK - 1, KK + J - 1):
-                        AP[K] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                JX += INCX
-                JY += INCY
-                KK += J
-    else:
-        #
-        #        Form  A  when lower triangle is stored in AP.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * Y[J]
-                    TEMP2 = ALPHA * X[J]
-                    K = KK
-                    for I in range(J - 1, N):
-                        AP[K] += X[I] * TEMP1 + Y[I] * TEMP2
-                        K += 1
-                KK += N - J + 1
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY]
-                    TEMP2 = ALPHA * X[JX]
-                    IX = JX
-                    IY = JY
-                    for K in range(KK - 1, KK + N - J):
-                        AP[K] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                JX += INCX
-                JY += INCY
-                KK += N - J + 1
+
+    # Start the operations, updating the whole packed triangle at once.
+    spr(UPLO, ALPHA, X[slice_(N, INCX)], Y[slice_(N, INCY)], AP)
@@ -0,0 +1,337 @@
+"""Index maps and vectorized kernels for packed triangular storage.
+
+The packed routines hold the ``UPLO`` triangle of an ``N x N`` matrix column
+by column in a 1-D array ``AP`` of ``N*(N + 1)/2`` elements.  The reference
+routines keep track of where each column starts with running offsets (``KK``
+and ``K``) and visit the elements one at a time.
+
+`index_map` instead returns, for every position of ``AP``, the row and the
+column of the matrix element stored there.  With them a whole triangle is
+read or updated with one fancy-indexing operation, for instance the rank 1
+update ``A := alpha*x*x**T + A`` of ``xSPR`` is just::
+
+    AP += ALPHA * X[MAP.rows] * X[MAP.cols]
+
+Maps are kept in a least recently used cache holding at most `CACHE_BYTES`
+bytes of index arrays, so repeated calls with the same ``N`` and ``UPLO``
+build them only once.  `column_starts` gives just the offset of each column,
+for the routines that work column by column and so need no more.
+
+The matrix-vector products use the columns directly too: one contiguous
+column of the stored triangle gives both its own contribution to ``A*x`` and
+that of the matching row of the other triangle, so `AP` is read once and
+never unpacked.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .. import workspace
+from ..util import lsame
+
+# Bytes of index arrays the cache of `index_map` may hold.
+CACHE_BYTES = int(os.environ.get("PYBLAS_PACKED_CACHE_BYTES", 256 * 2**20))
+
+_CACHE = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0}
+
+
+class PackedIndex(object):
+    """Where the elements of a packed triangle live.
+
+    Attributes
+    ----------
+    n : int
+        Order of the matrix
+    upper : bool
+        Whether the upper or the lower triangle is packed
+    starts : numpy.ndarray
+        ``n + 1`` offsets, column ``J`` being ``AP[starts[J]:starts[J + 1]]``
+    diag : numpy.ndarray
+        The ``n`` offsets of the diagonal elements
+    rows : numpy.ndarray
+        The row of the element at each offset of ``AP``
+    cols : numpy.ndarray
+        The column of the element at each offset of ``AP``
+    """
+
+    __slots__ = ("n", "upper", "starts", "diag", "rows", "cols")
+
+    def __init__(self, n, upper, starts, diag, rows, cols):
+        self.n = n
+        self.upper = upper
+        self.starts = starts
+        self.diag = diag
+        self.rows = rows
+        self.cols = cols
+
+    @property
+    def nbytes(self):
+        return sum(X.nbytes for X in (self.starts, self.diag, self.rows, self.cols))
+
+
+def column_starts(N, UPLO):
+    """Returns the ``N + 1`` offsets in ``AP`` at which the columns start."""
+    J = np.arange(N + 1)
+    if lsame(UPLO, "U"):
+        return J * (J + 1) // 2
+    return J * N - J * (J - 1) // 2
+
+
+def _build(N, UPPER):
+    STARTS = column_starts(N, "U" if UPPER else "L")
+    COLS = np.repeat(np.arange(N), np.diff(STARTS))
+    ROWS = np.arange(STARTS[-1]) - STARTS[COLS]
+    if UPPER:
+        DIAG = STARTS[1:] - 1
+    else:
+        ROWS += COLS
+        DIAG = STARTS[:-1].copy()
+    return PackedIndex(N, UPPER, STARTS, DIAG, ROWS, COLS)
+
+
+def index_map(N, UPLO):
+    """Returns the `PackedIndex` of the ``UPLO`` triangle of order `N`.
+
+    The arrays of the map are shared between callers and must not be
+    modified.
+    """
+    KEY = (N, lsame(UPLO, "U"))
+    with _LOCK:
+        MAP = _CACHE.get(KEY)
+        if MAP is not None:
+            _CACHE.move_to_end(KEY)
+            _STATS["hits"] += 1
+            return MAP
+        _STATS["misses"] += 1
+    MAP = _build(*KEY)
+    for X in (MAP.starts, MAP.diag, MAP.rows, MAP.cols):
+        X.flags.writeable = False
+    if MAP.nbytes <= CACHE_BYTES:
+        with _LOCK:
+            _CACHE[KEY] = MAP
+            while sum(M.nbytes for M in _CACHE.values()) > CACHE_BYTES:
+                _CACHE.popitem(last=False)
+    return MAP
+
+
+def cache_info():
+    """Returns the ``hits`` and ``misses`` of `index_map` so far, and the
+    ``size`` and ``nbytes`` of the maps it holds."""
+    with _LOCK:
+        INFO = dict(_STATS)
+        INFO["size"] = len(_CACHE)
+        INFO["nbytes"] = sum(M.nbytes for M in _CACHE.values())
+    return INFO
+
+
+def clear_cache():
+    """Empties the cache of `index_map` and sets its counts back to zero."""
+    with _LOCK:
+        _CACHE.clear()
+        for NAME in _STATS:
+            _STATS[NAME] = 0
+
+
+def spr(UPLO, ALPHA, X, Y, AP, HERM=False):
+    """Forms the packed rank 1 or rank 2 update of a symmetric or Hermitian matrix.
+
+    ``A := ALPHA*x*x**T + A`` if `Y` is None, else
+    ``A := ALPHA*x*y**T + ALPHA*y*x**T + A``.  With `HERM` the transposes are
+    conjugate transposes, the second term of the rank 2 update is multiplied
+    by ``conj(ALPHA)`` and the diagonal of `A` is made real, as in ``xHPR``
+    and ``xHPR2``.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` held in `AP`
+    ALPHA : scalar
+        Multiplier of the update
+    X : numpy.ndarray
+        The ``N`` elements of `x`
+    Y : numpy.ndarray or None
+        The ``N`` elements of `y`, for a rank 2 update
+    AP : numpy.ndarray
+        The packed triangle of `A`, at least ``N*(N + 1)/2`` elements
+
+    Returns
+    -------
+    None
+    """
+    MAP = index_map(X.shape[0], UPLO)
+    AP = AP[: MAP.starts[-1]]
+    if HERM:
+        XC = X.conj()
+        if Y is None:
+            AP += (ALPHA * X)[MAP.rows] * XC[MAP.cols]
+        else:
+            AP += (ALPHA * X)[MAP.rows] * Y.conj()[MAP.cols]
+            AP += (np.conj(ALPHA) * Y)[MAP.rows] * XC[MAP.cols]
+        AP[MAP.diag] = AP[MAP.diag].real
+    elif Y is None:
+        AP += (ALPHA * X)[MAP.rows] * X[MAP.cols]
+    else:
+        AP += (ALPHA * X)[MAP.rows] * Y[MAP.cols]
+        AP += (ALPHA * Y)[MAP.rows] * X[MAP.cols]
+
+
+def spmv(UPLO, ALPHA, AP, X, BETA, Y, HERM=False):
+    """Forms ``y := ALPHA*A*x + BETA*y`` for the packed symmetric or Hermitian `A`.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` held in `AP`
+    ALPHA : scalar
+        Multiplier of ``A*x``
+    AP : numpy.ndarray
+        The packed triangle of `A`
+    X : numpy.ndarray
+        The ``N`` elements of `x`
+    BETA : scalar
+        Multiplier of `y`, which is not read when zero
+    Y : numpy.ndarray
+        The ``N`` elements of `y`, overwritten with the result
+    HERM : bool
+        Whether `A` is Hermitian, in which case the imaginary parts of its
+        diagonal are not read
+
+    Returns
+    -------
+    None
+    """
+    N = X.shape[0]
+    if BETA == 0:
+        Y[...] = 0
+    elif BETA != 1:
+        Y *= BETA
+    if ALPHA == 0:
+        return
+    S = column_starts(N, UPLO).tolist()
+    DOT = np.vdot if HERM else np.dot
+    with workspace.borrow((N,), np.result_type(AP, X)) as Z:
+        Z[...] = 0
+        # Column J of the stored triangle adds X[J] times itself to Z, and
+        # its dot product with X to Z[J], as the matching row of the other
+        # triangle.
+        if lsame(UPLO, "U"):
+            for J in range(N):
+                C = AP[S[J] : S[J + 1] - 1]
+                D = AP[S[J + 1] - 1]
+                Z[:J] += C * X[J]
+                Z[J] += (D.real if HERM else D) * X[J] + DOT(C, X[:J])
+        else:
+            for J in range(N):
+                C = AP[S[J] + 1 : S[J + 1]]
+                D = AP[S[J]]
+                Z[J + 1 :] += C * X[J]
+                Z[J] += (D.real if HERM else D) * X[J] + DOT(C, X[J + 1 :])
+        Y += ALPHA * Z
+
+
+def tpmv(UPLO, TRANS, DIAG, AP, X):
+    """Forms ``x := op(A)*x`` in place for the packed triangular matrix `A`.
+
+    The arguments are those of `tpsv`.  Each column of `A`, a contiguous
+    slice of `AP`, is used in one vectorized operation, in the order that
+    only reads elements of `x` not yet overwritten, so no scratch space is
+    needed.
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(AP)
+    S = column_starts(N, UPLO).tolist()
+    if lsame(TRANS, "N"):
+        # Form  x := A*x, adding each element times the rest of its column
+        # to the elements of x whose own update is already done.
+        if UPPER:
+            for J in range(N):
+                TEMP = X[J]
+                if TEMP != 0:
+                    X[:J] += TEMP * AP[S[J] : S[J + 1] - 1]
+                    if NOUNIT:
+                        X[J] = TEMP * AP[S[J + 1] - 1]
+        else:
+            for J in range(N - 1, -1, -1):
+                TEMP = X[J]
+                if TEMP != 0:
+                    X[J + 1 :] += TEMP * AP[S[J] + 1 : S[J + 1]]
+                    if NOUNIT:
+                        X[J] = TEMP * AP[S[J]]
+    else:
+        # Form  x := A**T*x  or  x := A**H*x, each element becoming the dot
+        # product of its column with elements of x not yet overwritten.
+        DOT = np.vdot if CONJ else np.dot
+        if UPPER:
+            for J in range(N - 1, -1, -1):
+                TEMP = X[J]
+                if NOUNIT:
+                    D = AP[S[J + 1] - 1]
+                    TEMP = TEMP * (D.conjugate() if CONJ else D)
+                X[J] = TEMP + DOT(AP[S[J] : S[J + 1] - 1], X[:J])
+        else:
+            for J in range(N):
+                TEMP = X[J]
+                if NOUNIT:
+                    D = AP[S[J]]
+                    TEMP = TEMP * (D.conjugate() if CONJ else D)
+                X[J] = TEMP + DOT(AP[S[J] + 1 : S[J + 1]], X[J + 1 :])
+
+
+def tpsv(UPLO, TRANS, DIAG, AP, X):
+    """Solves ``op(A)*x = b`` in place for the packed triangular matrix `A`.
+
+    The arguments are those of `pyblas.level2.banded.tbsv`, with the packed
+    triangle `AP` in place of the band storage.  Each column of `A` is a
+    contiguous slice of `AP`, so the solve does one vectorized operation per
+    column.
+    """
+    N = X.shape[0]
+    UPPER = lsame(UPLO, "U")
+    NOUNIT = lsame(DIAG, "N")
+    CONJ = lsame(TRANS, "C") and np.iscomplexobj(AP)
+    S = column_starts(N, UPLO).tolist()
+    if lsame(TRANS, "N"):
+        # Form  x := inv( A )*x, subtracting each solved element times the
+        # rest of its column from the elements still to be solved.
+        if UPPER:
+            for J in range(N - 1, -1, -1):
+                TEMP = X[J]
+                if TEMP != 0:
+                    if NOUNIT:
+                        TEMP = TEMP / AP[S[J + 1] - 1]
+                        X[J] = TEMP
+                    X[:J] -= TEMP * AP[S[J] : S[J + 1] - 1]
+        else:
+            for J in range(N):
+                TEMP = X[J]
+                if TEMP != 0:
+                    if NOUNIT:
+                        TEMP = TEMP / AP[S[J]]
+                        X[J] = TEMP
+                    X[J + 1 :] -= TEMP * AP[S[J] + 1 : S[J + 1]]
+    else:
+        # Form  x := inv( A**T )*x  or  x := inv( A**H )*x, each element
+        # being its right hand side less the dot product of its column with
+        # the elements already solved.
+        DOT = np.vdot if CONJ else np.dot
+        if UPPER:
+            for J in range(N):
+                TEMP = X[J] - DOT(AP[S[J] : S[J + 1] - 1], X[:J])
+                if NOUNIT:
+                    D = AP[S[J + 1] - 1]
+                    TEMP = TEMP / (D.conjugate() if CONJ else D)
+                X[J] = TEMP
+        else:
+            for J in range(N - 1, -1, -1):
+                TEMP = X[J] - DOT(AP[S[J] + 1 : S[J + 1]], X[J + 1 :])
+                if NOUNIT:
+                    D = AP[S[J]]
+                    TEMP = TEMP / (D.conjugate() if CONJ else D)
+                X[J] = TEMP
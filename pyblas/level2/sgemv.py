@@ -154,9 +154,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
-from ..util import slice_, range_
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import gemv
 
 
 def SGEMV(TRANS, M, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
@@ -194,57 +194,15 @@ def SGEMV(TRANS, M, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
         INFO = 11
     if INFO != 0:
         xerbla("SGEMV ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, M, N)
 
     # Quick return if possible.
     if (M == 0) or (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    #     Set  LENX  and  LENY, the lengths of the vectors x and y, and set
-    #     up the start points in  X  and  Y.
-    #
-    if lsame(TRANS, "N"):
-        LENX = N
-        LENY = M
-    else:
-        LENX = M
-        LENY = N
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (LENX - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (LENY - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through A.
-    #
-    # First form  y := beta*y.
-    Y[slice_(LENY, INCY)] *= BETA
 
-    if ALPHA == 0:
-        return
-    if lsame(TRANS, "N"):
-        # Form  y := alpha*A*x + y.
-        for J, JX in enumerate(range(N, INCX)):
-            Y[slice_(M, INCY)] += ALPHA * X[JX] * A[slice_(M, INCY), J]
-    else:
-        # Form  y := alpha*A**T*x + y.
-        JY = KY
-        if INCX == 1:
-            for J in range(N):
-                TEMP = 0
-                for I in range(M):
-                    TEMP += A[I, J] * X[I]
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
-        else:
-            for J in range(N):
-                TEMP = 0
-                IX = KX
-                for I in range(M):
-                    TEMP += A[I, J] * X[IX]
-                    IX += INCX
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
+    # Start the operations, with a single product on A as it is stored.
+    LENX, LENY = (N, M) if lsame(TRANS, "N") else (M, N)
+    gemv(TRANS, ALPHA, A[:M, :N], X[slice_(LENX, INCX)], BETA, Y[slice_(LENY, INCY)])
@@ -128,8 +128,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from xerbla import xerbla
-from ..util import range_, slice_
+from ..util import as_matrix, slice_
+from ..xerbla import xerbla
+from .blocked import ger
 
 
 def SGER(M, N, ALPHA, X, INCX, Y, INCY, A, LDA):
@@ -178,6 +179,14 @@ def SGER(M, N, ALPHA, X, INCX, Y, INCY, A, LDA):
         INFO = 9
     if INFO != 0:
         xerbla("SGER  ", INFO)
+        return
 
-    for J, JY in enumerate(range_(N, INCY)):
-        A[:M, J] += ALPHA * X[slice_(M, INCX)] * Y[JY]
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, M, N)
+
+    # Quick return if possible.
+    if (M == 0) or (N == 0) or (ALPHA == 0):
+        return
+
+    # Start the operations, forming the update a panel of columns at a time.
+    ger(ALPHA, X[slice_(M, INCX)], Y[slice_(N, INCY)], A[:M, :N])
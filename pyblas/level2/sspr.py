@@ -125,8 +125,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import spr
 
 
 def SSPR(UPLO, N, ALPHA, X, INCX, AP):
@@ -173,67 +174,11 @@ def SSPR(UPLO, N, ALPHA, X, INCX, AP):
         INFO = 5
     if INFO != 0:
         xerbla("SSPR  ", INFO)
+        return
 
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set the start point in X if the increment is not unity.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of the array AP
-    #     are accessed sequentially with one pass through AP.
-    #
-    KK = 1
-    if lsame(UPLO, "U"):
-        #
-        #        Form  A  when upper triangle is stored in AP.
-        #
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * X[J]
-                    K = KK
-                    for I in range(J):
-                        AP[K] += X[I] * TEMP
-                        K += 1
-                KK += J
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * X[JX]
-                    IX = KX
-                    for K in range(KK - 1, KK + J - 1):
-                        AP[K] += X[IX] * TEMP
-                        IX += INCX
-                JX += INCX
-                KK += J
-    else:
-        #
-        #        Form  A  when lower triangle is stored in AP.
-        #
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * X[J]
-                    K = KK
-                    for I in range(J - 1, N):
-                        AP[K] += X[I] * TEMP
-                        K += 1
-                KK += N - J + 1
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * X[JX]
-                    IX = JX
-                    for K in range(KK - 1, KK + N - J):
-                        AP[K] += X[IX] * TEMP
-                        IX += INCX
-                JX += INCX
-                KK += N - J + 1
+
+    # Start the operations, updating the whole packed triangle at once.
+    spr(UPLO, ALPHA, X[slice_(N, INCX)], None, AP)
@@ -130,8 +130,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from xerbla import xerbla
-from util import lsame
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import syr
 
 
 def SSYR(UPLO, N, ALPHA, X, INCX, A, LDA):
@@ -185,52 +186,12 @@ def SSYR(UPLO, N, ALPHA, X, INCX, A, LDA):
         xerbla("SSYR  ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
+
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set the start point in X if the increment is not unity.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the triangular part
-    #     of A.
-    #
-    if lsame(UPLO, "U"):
-        # Form  A  when A is stored in upper triangle.
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    A[:J, J] += X[:J] * ALPHA * X[J]
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * X[JX]
-                    IX = KX
-                    for I in range(J):
-                        A[I, J] += X[IX] * TEMP
-                        IX += INCX
-                JX += INCX
-    else:
-        # Form  A  when A is stored in lower triangle.
-        if INCX == 1:
-            for J in range(N):
-                if X[J] != 0:
-                    TEMP = ALPHA * X[J]
-                    for I in range(J - 1, N):
-                        A[I, J] += X[I] * TEMP
-        else:
-            JX = KX
-            for J in range(N):
-                if X[JX] != 0:
-                    TEMP = ALPHA * X[JX]
-                    IX = JX
-                    for I in range(J - 1, N):
-                        A[I, J] += X[IX] * TEMP
-                        IX += INCX
-                JX += INCX
+
+    # Start the operations, a panel of columns of the UPLO triangle at a time.
+    syr(UPLO, ALPHA, X[slice_(N, INCX)], None, A[:N, :N])
@@ -145,8 +145,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import syr
 
 
 def SSYR2(UPLO, N, ALPHA, X, INCX, Y, INCY, A, LDA):
@@ -181,72 +182,14 @@ def SSYR2(UPLO, N, ALPHA, X, INCX, Y, INCY, A, LDA):
         INFO = 9
     if INFO != 0:
         xerbla("SSYR2 ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
 
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set up the start points in X and Y if the increments are not both
-    #     unity.
-    #
-    if (INCX != 1) or (INCY != 1):
-        if INCX > 0:
-            KX = 1
-        else:
-            KX = 1 - (N - 1) * INCX
-        if INCY > 0:
-            KY = 1
-        else:
-            KY = 1 - (N - 1) * INCY
-        JX = KX
-        JY = KY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the triangular part
-    #     of A.
-    #
-    if lsame(UPLO, "U"):
-        #
-        #        Form  A  when A is stored in the upper triangle.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                TEMP1 = ALPHA * Y[J]
-                TEMP2 = ALPHA * X[J]
-                for I in range(J):
-                    A[I, J] += X[I] * TEMP1 + Y[I] * TEMP2
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY]
-                    TEMP2 = ALPHA * X[JX]
-                    IX = KX
-                    IY = KY
-                    for I in range(J):
-                        A[I, J] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                JX += INCX
-                JY += INCY
-    else:
-        # Form  A  when A is stored in the lower triangle.
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * Y[J]
-                    TEMP2 = ALPHA * X[J]
-                    for I in range(J - 1, N):
-                        A[I, J] += X[I] * TEMP1 + Y[I] * TEMP2
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY]
-                    TEMP2 = ALPHA * X[JX]
-                    IX = JX
-                    IY = JY
-                    for I in range(J - 1, N):
-                        A[I, J] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                JX += INCX
-                JY += INCY
+
+    # Start the operations, a panel of columns of the UPLO triangle at a time.
+    syr(UPLO, ALPHA, X[slice_(N, INCX)], Y[slice_(N, INCY)], A[:N, :N])
@@ -187,8 +187,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .banded import tbsv
 
 
 def STBSV(UPLO, TRANS, DIAG, N, K, A, LDA, X, INCX):
@@ -248,126 +249,13 @@ def STBSV(UPLO, TRANS, DIAG, N, K, A, LDA, X, INCX):
         xerbla("STBSV ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, K + 1, N)
+
     # Quick return if possible.
     if N == 0:
         return
-    #
-    NOUNIT = lsame(DIAG, "N")
-    #
-    #     Set up the start point in X if the increment is not unity. This
-    #     will be  ( N - 1 )*INCX  too small for descending loops.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed by sequentially with one pass through A.
-    #
-    if lsame(TRANS, "N"):
-        # Form  x := inv( A )*x.
-        if lsame(UPLO, "U"):
-            KPLUS1 = K + 1
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    if X[J] != 0:
-                        L = KPLUS1 - J
-                        if NOUNIT:
-                            X[J] = X[J] / A[KPLUS1, J]
-                        TEMP = X[J]
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            X[I] -= TEMP * A[L + I, J]
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    KX -= INCX
-                    if X[JX] != 0:
-                        IX = KX
-                        L = KPLUS1 - J
-                        if NOUNIT:
-                            X[JX] = X[JX] / A[KPLUS1, J]
-                        TEMP = X[JX]
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            X[IX] -= TEMP * A[L + I, J]
-                            IX -= INCX
-                    JX -= INCX
-        else:
-            if INCX == 1:
-                for J in range(N):
-                    if X[J] != 0:
-                        L = 1 - J
-                        if NOUNIT:
-                            X[J] = X[J] / A[1, J]
-                        TEMP = X[J]
-                        for I in range(J, min(N, J + K)):
-                            X[I] -= TEMP * A[L + I, J]
-            else:
-                JX = KX
-                for J in range(N):
-                    KX += INCX
-                    if X[JX] != 0:
-                        IX = KX
-                        L = 1 - J
-                        if NOUNIT:
-                            X[JX] = X[JX] / A[1, J]
-                        TEMP = X[JX]
-                        for I in range(J, min(N, J + K)):
-                            X[IX] -= TEMP * A[L + I, J]
-                            IX += INCX
-                    JX += INCX
-    else:
-        # Form  x := inv( A**T)*x.
-        if lsame(UPLO, "U"):
-            KPLUS1 = K + 1
-            if INCX == 1:
-                for J in range(N):
-                    TEMP = X[J]
-                    L = KPLUS1 - J
-                    for I in range(max(1, J - K) - 1, J - 1):
-                        TEMP -= A[L + I, J] * X[I]
-                    if NOUNIT:
-                        TEMP = TEMP / A[KPLUS1, J]
-                    X[J] = TEMP
-            else:
-                JX = KX
-                for J in range(N):
-                    TEMP = X[JX]
-                    IX = KX
-                    L = KPLUS1 - J
-                    for I in range(max(1, J - K) - 1, J - 1):
-                        TEMP -= A[L + I, J] * X[IX]
-                        IX += INCX
-                    if NOUNIT:
-                        TEMP = TEMP / A[KPLUS1, J]
-                    X[JX] = TEMP
-                    JX += INCX
-                    if J > K:
-                        KX += INCX
-        else:
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[J]
-                    L = 1 - J
-                    for I in range(min(N, J + K) - 1, J - 1, -1):
-                        TEMP -= A[L + I, J] * X[I]
-                    if NOUNIT:
-                        TEMP /= A[1, J]
-                    X[J] = TEMP
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[JX]
-                    IX = KX
-                    L = 1 - J
-                    for I in range(min(N, J + K) - 1, J - 1, -1):
-                        TEMP -= A[L + I, J] * X[IX]
-                        IX -= INCX
-                    if NOUNIT:
-                        TEMP /= A[1, J]
-                    X[JX] = TEMP
-                    JX -= INCX
-                    if (N - J) >= K:
-                        KX -= INCX
+
+    # Start the operations, updating x with one vectorized operation per
+    # column of the band.
+    tbsv(UPLO, TRANS, DIAG, A[: K + 1, :N], X[slice_(N, INCX)])
@@ -185,8 +185,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .banded import gbmv
 
 
 def ZGBMV(TRANS, M, N, KL, KU, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
@@ -227,97 +228,27 @@ def ZGBMV(TRANS, M, N, KL, KU, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
         INFO = 13
     if INFO != 0:
         xerbla("ZGBMV ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, KL + KU + 1, N)
 
     # Quick return if possible.
     if (M == 0) or (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    #
-    #     Set  LENX  and  LENY, the lengths of the vectors x and y, and set
-    #     up the start points in  X  and  Y.
-    #
-    if lsame(TRANS, "N"):
-        LENX = N
-        LENY = M
-    else:
-        LENX = M
-        LENY = N
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (LENX - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (LENY - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the band part of A.
-    #
-    # First form  y := beta*y.
-    if INCY > 0:
-        Y[: LENY * INCY : INCY] *= BETA
-    else:
-        Y[-(LENY - 1) * INCY :: INCY] *= BETA
 
-    if ALPHA == 0:
-        return
-    KUP1 = KU + 1
+    # Start the operations, one diagonal of the band at a time.
     if lsame(TRANS, "N"):
-        #
-        #        Form  y := alpha*A*x + y.
-        #
-        JX = KX
-        if INCY == 1:
-            for J in range(N):
-                TEMP = ALPHA * X[JX]
-                K = KUP1 - J
-                for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                    Y[I] += TEMP * A[K + I, J]
-                JX += INCX
-        else:
-            for J in range(N):
-                TEMP = ALPHA * X[JX]
-                IY = KY
-                K = KUP1 - J
-                for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                    Y[IY] += TEMP * A[K + I, J]
-                    IY += INCY
-                JX += INCX
-                if J > KU:
-                    KY += INCY
+        LENX, LENY = N, M
     else:
-        #
-        #        Form  y := alpha*A**T*x + y  or  y := alpha*A**H*x + y.
-        #
-        JY = KY
-        if INCX == 1:
-            for J in range(N):
-                TEMP = 0
-                K = KUP1 - J
-                if NOCONJ:
-                    for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                        TEMP += A[K + I, J] * X[I]
-                else:
-                    for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                        TEMP += A[K + I, J].conjugate() * X[I]
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
-        else:
-            for J in range(N):
-                TEMP = 0
-                IX = KX
-                K = KUP1 - J
-                if NOCONJ:
-                    for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                        TEMP += A[K + I, J] * X[IX]
-                        IX += INCX
-                else:
-                    for I in range(max(1, J - KU) - 1, min(M, J + KL)):
-                        TEMP += A[K + I, J].conjugate() * X[IX]
-                        IX += INCX
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
-                if J > KU:
-                    KX += INCX
+        LENX, LENY = M, N
+    gbmv(
+        TRANS,
+        KL,
+        KU,
+        ALPHA,
+        A[: KL + KU + 1, :N],
+        X[slice_(LENX, INCX)],
+        BETA,
+        Y[slice_(LENY, INCY)],
+    )
@@ -156,8 +156,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import gemv
 
 
 def ZGEMV(TRANS, M, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
@@ -218,87 +219,13 @@ def ZGEMV(TRANS, M, N, ALPHA, A, LDA, X, INCX, BETA, Y, INCY):
         xerbla("ZGEMV ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, M, N)
+
     # Quick return if possible.
     if (M == 0) or (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    #
-    #     Set  LENX  and  LENY, the lengths of the vectors x and y, and set
-    #     up the start points in  X  and  Y.
-    #
-    if lsame(TRANS, "N"):
-        LENX = N
-        LENY = M
-    else:
-        LENX = M
-        LENY = N
-    if INCX > 0:
-        KX = 1
-    else:
-        KX = 1 - (LENX - 1) * INCX
-    if INCY > 0:
-        KY = 1
-    else:
-        KY = 1 - (LENY - 1) * INCY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through A.
-    #
-    # First form  y := beta*y.
-    if INCY > 0:
-        Y[: LENY * INCY : INCY] *= BETA
-    else:
-        Y[-(LENY - 1) * INCY :: INCY] *= BETA
 
-    if ALPHA == 0:
-        return
-    if lsame(TRANS, "N"):
-        #
-        #        Form  y := alpha*A*x + y.
-        #
-        JX = KX
-        if INCY == 1:
-            for J in range(N):
-                TEMP = ALPHA * X[JX]
-                for I in range(M):
-                    Y[I] += TEMP * A[I, J]
-                JX += INCX
-        else:
-            for J in range(N):
-                TEMP = ALPHA * X[JX]
-                IY = KY
-                for I in range(M):
-                    Y[IY] += TEMP * A[I, J]
-                    IY += INCY
-                JX += INCX
-    else:
-        #
-        #        Form  y := alpha*A**T*x + y  or  y := alpha*A**H*x + y.
-        #
-        JY = KY
-        if INCX == 1:
-            for J in range(N):
-                TEMP = 0
-                if NOCONJ:
-                    for I in range(M):
-                        TEMP += A[I, J] * X[I]
-                else:
-                    for I in range(M):
-                        TEMP += A[1, J].conjugate() * X[I]
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
-        else:
-            for J in range(N):
-                TEMP = 0
-                IX = KX
-                if NOCONJ:
-                    for I in range(M):
-                        TEMP += A[I, J] * X[IX]
-                        IX += INCX
-                else:
-                    for I in range(M):
-                        TEMP += A[1, J].conjugate() * X[IX]
-                        IX += INCX
-                Y[JY] += ALPHA * TEMP
-                JY += INCY
+    # Start the operations, with a single product on A as it is stored.
+    LENX, LENY = (N, M) if lsame(TRANS, "N") else (M, N)
+    gemv(TRANS, ALPHA, A[:M, :N], X[slice_(LENX, INCX)], BETA, Y[slice_(LENY, INCY)])
@@ -148,8 +148,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import syr
 
 
 def ZHER2(UPLO, N, ALPHA, X, INCX, Y, INCY, A, LDA):
@@ -186,84 +187,12 @@ def ZHER2(UPLO, N, ALPHA, X, INCX, Y, INCY, A, LDA):
         xerbla("ZHER2 ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
+
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set up the start points in X and Y if the increments are not both
-    #     unity.
-    #
-    if (INCX != 1) or (INCY != 1):
-        if INCX > 0:
-            KX = 1
-        else:
-            KX = 1 - (N - 1) * INCX
-        if INCY > 0:
-            KY = 1
-        else:
-            KY = 1 - (N - 1) * INCY
-        JX = KX
-        JY = KY
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through the triangular part
-    #     of A.
-    #
-    if lsame(UPLO, "U"):
-        #
-        #        Form  A  when A is stored in the upper triangle.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * (Y[J]).conjugate()
-                    TEMP2 = (ALPHA * X[J]).conjugate()
-                    for I in range(J - 1):
-                        A[I, J] += X[I] * TEMP1 + Y[I] * TEMP2
-                    A[J, J] = A[J, J].real + (X[J] * TEMP1 + Y[J] * TEMP2).real
-                else:
-                    A[J, J] = A[J, J].real
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY].conjugate()
-                    TEMP2 = (ALPHA * X[JX]).conjugate()
-                    IX = KX
-                    IY = KY
-                    for I in range(J - 1):
-                        A[I, J] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                    A[J, J] = A[J, J].real + (X[JX] * TEMP1 + Y[JY] * TEMP2).real
-                else:
-                    A[J, J] = A[J, J].real
-                JX += INCX
-                JY += INCY
-    else:
-        # Form  A  when A is stored in the lower triangle.
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * (Y[J]).conjugate()
-                    TEMP2 = (ALPHA * X[J]).conjugate()
-                    A[J, J] = A[J, J].real + (X[J] * TEMP1 + Y[J] * TEMP2).real
-                    for I in range(J, N):
-                        A[I, J] += X[I] * TEMP1 + Y[I] * TEMP2
-                else:
-                    A[J, J] = A[J, J].real
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY].conjugate()
-                    TEMP2 = (ALPHA * X[JX]).conjugate()
-                    A[J, J] = A[J, J].real + (X[JX] * TEMP1 + Y[JY] * TEMP2).real
-                    IX = JX
-                    IY = JY
-                    for I in range(J, N):
-                        IX += INCX
-                        IY += INCY
-                        A[I, J] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                else:
-                    A[J, J] = A[J, J].real
-                JX += INCX
-                JY += INCY
+
+    # Start the operations, a panel of columns of the UPLO triangle at a time.
+    syr(UPLO, ALPHA, X[slice_(N, INCX)], Y[slice_(N, INCY)], A[:N, :N], HERM=True)
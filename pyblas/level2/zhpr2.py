@@ -143,8 +143,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import lsame, slice_
+from ..xerbla import xerbla
+from .packed import spr
 
 
 def ZHPR2(UPLO, N, ALPHA, X, INCX, Y, INCY, AP):
@@ -196,99 +197,11 @@ def ZHPR2(UPLO, N, ALPHA, X, INCX, Y, INCY, AP):
         INFO = 7
     if INFO != 0:
         xerbla("ZHPR2 ", INFO)
+        return
 
     # Quick return if possible.
     if (N == 0) or (ALPHA == 0):
         return
-    #
-    #     Set up the start points in X and Y if the increments are not both
-    #     unity.
-    #
-    if (INCX != 1) or (INCY != 1):
-        if INCX > 0:
-            KX = 1
-        else:
-            KX = 1 - (N - 1) * INCX
-        if INCY > 0:
-            KY = 1
-        else:
-            KY = 1 - (N - 1) * INCY
-        JX = KX
-        JY = KY
-    #
-    #     Start the operations. In this version the elements of the array AP
-    #     are accessed sequentially with one pass through AP.
-    #
-    KK = 1
-    if lsame(UPLO, "U"):
-        #
-        #        Form  A  when upper triangle is stored in AP.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * (Y[J]).conjugate()
-                    TEMP2 = (ALPHA * X[J]).conjugate()
-                    K = KK
-                    for I in range(J - 1):
-                        AP[K] += X[I] * TEMP1 + Y[I] * TEMP2
-                        K += 1
-                    AP[KK + J - 1] = (
-                        AP[KK + J - 1].real + (X[J] * TEMP1 + Y[J] * TEMP2).real
-                    )
-                else:
-                    AP[KK + J - 1] = AP[KK + J - 1].real
-                KK += J
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY].conjugate()
-                    TEMP2 = (ALPHA * X[JX]).conjugate()
-                    IX = KX
-                    IY = KY
-                    for K in range(KK - 1, KK + J - 2):
-                        AP[K] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                        IX += INCX
-                        IY += INCY
-                    AP[KK + J - 1] = (
-                        AP[KK + J - 1].real + (X[JX] * TEMP1 + Y[JY] * TEMP2).real
-                    )
-                else:
-                    AP[KK + J - 1] = AP[KK + J - 1].real
-                JX += INCX
-                JY += INCY
-                KK += J
-    else:
-        #
-        #        Form  A  when lower triangle is stored in AP.
-        #
-        if (INCX == 1) and (INCY == 1):
-            for J in range(N):
-                if (X[J] != 0) or (Y[J] != 0):
-                    TEMP1 = ALPHA * (Y[J]).conjugate()
-                    TEMP2 = (ALPHA * X[J]).conjugate()
-                    AP[KK] = (AP[KK]).real + (X[J] * TEMP1 + Y[J] * TEMP2).real
-                    K = KK + 1
-                    for I in range(J, N):
-                        AP[K] += X[I] * TEMP1 + Y[I] * TEMP2
-                        K += 1
-                else:
-                    AP[KK] = (AP[KK]).real
-                KK += N - J + 1
-        else:
-            for J in range(N):
-                if (X[JX] != 0) or (Y[JY] != 0):
-                    TEMP1 = ALPHA * Y[JY].conjugate()
-                    TEMP2 = (ALPHA * X[JX]).conjugate()
-                    AP[KK] = (AP[KK]).real + (X[JX] * TEMP1 + Y[JY] * TEMP2).real
-                    IX = JX
-                    IY = JY
-                    for K in range(KK, KK + N - J):
-                        IX += INCX
-                        IY += INCY
-                        AP[K] += X[IX] * TEMP1 + Y[IY] * TEMP2
-                else:
-                    AP[KK] = (AP[KK]).real
-                JX += INCX
-                JY += INCY
-                KK += N - J + 1
+
+    # Start the operations, updating the whole packed triangle at once.
+    spr(UPLO, ALPHA, X[slice_(N, INCX)], Y[slice_(N, INCY)], AP, HERM=True)
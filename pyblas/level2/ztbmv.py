@@ -184,8 +184,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .banded import tbmv
 
 
 def ZTBMV(UPLO, TRANS, DIAG, N, K, A, LDA, X, INCX):
@@ -223,154 +224,14 @@ def ZTBMV(UPLO, TRANS, DIAG, N, K, A, LDA, X, INCX):
         INFO = 9
     if INFO != 0:
         xerbla("ZTBMV ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, K + 1, N)
 
     # Quick return if possible.
     if N == 0:
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    NOUNIT = lsame(DIAG, "N")
-    #
-    #     Set up the start point in X if the increment is not unity. This
-    #     will be  ( N - 1 )*INCX   too small for descending loops.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through A.
-    #
-    if lsame(TRANS, "N"):
-        # Form  x := A*x.
-        if lsame(UPLO, "U"):
-            KPLUS1 = K + 1
-            if INCX == 1:
-                for J in range(N):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        L = KPLUS1 - J
-                        for I in range(max(1, J - K) - 1, J - 1):
-                            X[I] += TEMP * A[L + I, J]
-                        if NOUNIT:
-                            X[J] = X[J] * A[KPLUS1, J]
-            else:
-                JX = KX
-                for J in range(N):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        L = KPLUS1 - J
-                        for I in range(max(1, J - K) - 1, J - 1):
-                            X[IX] = X[IX] + TEMP * A[L + I, J]
-                            IX += INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * A[KPLUS1, J]
-                    JX += INCX
-                    if J > K:
-                        KX += INCX
-        else:
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        L = 1 - J
-                        for I in range(min(N, J + K) - 1, J - 1, -1):
-                            X[I] += TEMP * A[L + I, J]
-                        if NOUNIT:
-                            X[J] = X[J] * A[1, J]
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        L = 1 - J
-                        for I in range(min(N, J + K) - 1, J - 1, -1):
-                            X[IX] = X[IX] + TEMP * A[L + I, J]
-                            IX -= INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * A[1, J]
-                    JX -= INCX
-                    if (N - J) >= K:
-                        KX -= INCX
-    else:
-        # Form  x := A**T*x  or  x := A**H*x.
-        if lsame(UPLO, "U"):
-            KPLUS1 = K + 1
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[J]
-                    L = KPLUS1 - J
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * A[KPLUS1, J]
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            TEMP += A[L + I, J] * X[I]
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * A[KPLUS1, J].conjugate()
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            TEMP += A[L + I, J].conjugate() * X[I]
-                    X[J] = TEMP
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[JX]
-                    KX -= INCX
-                    IX = KX
-                    L = KPLUS1 - J
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * A[KPLUS1, J]
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            TEMP += A[L + I, J] * X[IX]
-                            IX -= INCX
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * A[KPLUS1, J].conjugate()
-                        for I in range(J - 2, max(1, J - K) - 2, -1):
-                            TEMP += A[L + I, J].conjugate() * X[IX]
-                            IX -= INCX
-                    X[JX] = TEMP
-                    JX -= INCX
-        else:
-            if INCX == 1:
-                for J in range(N):
-                    TEMP = X[J]
-                    L = 1 - J
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * A[1, J]
-                        for I in range(J, min(N, J + K)):
-                            TEMP += A[L + I, J] * X[I]
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * A[1, J].conjugate()
-                        for I in range(J, min(N, J + K)):
-                            TEMP += A[L + I, J].conjugate() * X[I]
-                    X[J] = TEMP
-            else:
-                JX = KX
-                for J in range(N):
-                    TEMP = X[JX]
-                    KX += INCX
-                    IX = KX
-                    L = 1 - J
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP = TEMP * A[1, J]
-                        for I in range(J, min(N, J + K)):
-                            TEMP += A[L + I, J] * X[IX]
-                            IX += INCX
-                    else:
-                        if NOUNIT:
-                            TEMP = TEMP * A[1, J].conjugate()
-                        for I in range(J, min(N, J + K)):
-                            TEMP += A[L + I, J].conjugate() * X[IX]
-                            IX += INCX
-                    X[JX] = TEMP
-                    JX += INCX
+
+    # Start the operations, one diagonal of the band at a time.
+    tbmv(UPLO, TRANS, DIAG, A[: K + 1, :N], X[slice_(N, INCX)])
@@ -145,8 +145,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import trmv
 
 
 def ZTRMV(UPLO, TRANS, DIAG, N, A, LDA, X, INCX):
@@ -182,137 +183,14 @@ def ZTRMV(UPLO, TRANS, DIAG, N, A, LDA, X, INCX):
         INFO = 8
     if INFO != 0:
         xerbla("ZTRMV ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
 
     # Quick return if possible.
     if N == 0:
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    NOUNIT = lsame(DIAG, "N")
-    #
-    #     Set up the start point in X if the increment is not unity. This
-    #     will be  ( N - 1 )*INCX  too small for descending loops.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through A.
-    #
-    if lsame(TRANS, "N"):
-        # Form  x := A*x.
-        if lsame(UPLO, "U"):
-            if INCX == 1:
-                for J in range(N):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        for I in range(J - 1):
-                            X[I] += TEMP * A[I, J]
-                        if NOUNIT:
-                            X[J] = X[J] * A[J, J]
-            else:
-                JX = KX
-                for J in range(N):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        for I in range(J - 1):
-                            X[IX] = X[IX] + TEMP * A[I, J]
-                            IX += INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * A[J, J]
-                    JX += INCX
-        else:
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    if X[J] != 0:
-                        TEMP = X[J]
-                        for I in range(N - 1, J - 1, -1):
-                            X[I] += TEMP * A[I, J]
-                        if NOUNIT:
-                            X[J] = X[J] * A[J, J]
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    if X[JX] != 0:
-                        TEMP = X[JX]
-                        IX = KX
-                        for I in range(N - 1, J - 1, -1):
-                            X[IX] = X[IX] + TEMP * A[I, J]
-                            IX -= INCX
-                        if NOUNIT:
-                            X[JX] = X[JX] * A[J, J]
-                    JX -= INCX
-    else:
-        # Form  x := A**T*x  or  x := A**H*x.
-        if lsame(UPLO, "U"):
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[J]
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP *= A[J, J]
-                        for I in range(J - 2, -1, -1):
-                            TEMP += A[I, J] * X[I]
-                    else:
-                        if NOUNIT:
-                            TEMP *= A[J, J].conjugate()
-                        for I in range(J - 2, -1, -1):
-                            TEMP += A[1, J].conjugate() * X[I]
-                    X[J] = TEMP
-            else:
-                JX = KX + (N - 1) * INCX
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[JX]
-                    IX = JX
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP *= A[J, J]
-                        for I in range(J - 2, -1, -1):
-                            IX -= INCX
-                            TEMP += A[I, J] * X[IX]
-                    else:
-                        if NOUNIT:
-                            TEMP *= A[J, J].conjugate()
-                        for I in range(J - 2, -1, -1):
-                            IX -= INCX
-                            TEMP += A[1, J].conjugate() * X[IX]
-                    X[JX] = TEMP
-                    JX -= INCX
-        else:
-            if INCX == 1:
-                for J in range(N):
-                    TEMP = X[J]
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP *= A[J, J]
-                        for I in range(J, N):
-                            TEMP += A[I, J] * X[I]
-                    else:
-                        if NOUNIT:
-                            TEMP *= A[J, J].conjugate()
-                        for I in range(J, N):
-                            TEMP += A[1, J].conjugate() * X[I]
-                    X[J] = TEMP
-            else:
-                JX = KX
-                for J in range(N):
-                    TEMP = X[JX]
-                    IX = JX
-                    if NOCONJ:
-                        if NOUNIT:
-                            TEMP *= A[J, J]
-                        for I in range(J, N):
-                            IX += INCX
-                            TEMP += A[I, J] * X[IX]
-                    else:
-                        if NOUNIT:
-                            TEMP *= A[J, J].conjugate()
-                        for I in range(J, N):
-                            IX += INCX
-                            TEMP += A[1, J].conjugate() * X[IX]
-                    X[JX] = TEMP
-                    JX += INCX
+
+    # Start the operations, one block of blocked.NB elements of x at a time.
+    trmv(UPLO, TRANS, DIAG, A[:N, :N], X[slice_(N, INCX)])
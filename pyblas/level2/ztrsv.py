@@ -147,8 +147,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame, slice_
+from ..xerbla import xerbla
+from .blocked import trsv
 
 
 def ZTRSV(UPLO, TRANS, DIAG, N, A, LDA, X, INCX):
@@ -186,138 +187,13 @@ def ZTRSV(UPLO, TRANS, DIAG, N, A, LDA, X, INCX):
         xerbla("ZTRSV ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, N, N)
+
     # Quick return if possible.
     if N == 0:
         return
-    #
-    NOCONJ = lsame(TRANS, "T")
-    NOUNIT = lsame(DIAG, "N")
-    #
-    #     Set up the start point in X if the increment is not unity. This
-    #     will be  ( N - 1 )*INCX  too small for descending loops.
-    #
-    if INCX <= 0:
-        KX = 1 - (N - 1) * INCX
-    elif INCX != 1:
-        KX = 1
-    #
-    #     Start the operations. In this version the elements of A are
-    #     accessed sequentially with one pass through A.
-    #
-    if lsame(TRANS, "N"):
-        #
-        #        Form  x := inv( A )*x.
-        #
-        if lsame(UPLO, "U"):
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    if X[J] != 0:
-                        if NOUNIT:
-                            X[J] = X[J] / A[J, J]
-                        TEMP = X[J]
-                        for I in range(J - 2, -1, -1):
-                            X[I] -= TEMP * A[I, J]
-            else:
-                JX = KX + (N - 1) * INCX
-                for J in range(N - 1, -1, -1):
-                    if X[JX] != 0:
-                        if NOUNIT:
-                            X[JX] = X[JX] / A[J, J]
-                        TEMP = X[JX]
-                        IX = JX
-                        for I in range(J - 2, -1, -1):
-                            IX -= INCX
-                            X[IX] -= TEMP * A[I, J]
-                    JX -= INCX
-        else:
-            if INCX == 1:
-                for J in range(N):
-                    if X[J] != 0:
-                        if NOUNIT:
-                            X[J] = X[J] / A[J, J]
-                        TEMP = X[J]
-                        for I in range(J, N):
-                            X[I] -= TEMP * A[I, J]
-            else:
-                JX = KX
-                for J in range(N):
-                    if X[JX] != 0:
-                        if NOUNIT:
-                            X[JX] = X[JX] / A[J, J]
-                        TEMP = X[JX]
-                        IX = JX
-                        for I in range(J, N):
-                            IX += INCX
-                            X[IX] -= TEMP * A[I, J]
-                    JX += INCX
-    else:
-        # Form  x := inv( A**T )*x  or  x := inv( A**H )*x.
-        if lsame(UPLO, "U"):
-            if INCX == 1:
-                for J in range(N):
-                    TEMP = X[J]
-                    if NOCONJ:
-                        for I in range(J - 1):
-                            TEMP -= A[I, J] * X[I]
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J]
-                    else:
-                        for I in range(J - 1):
-                            TEMP -= A[1, J].conjugate() * X[I]
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J].conjugate()
-                    X[J] = TEMP
-            else:
-                JX = KX
-                for J in range(N):
-                    IX = KX
-                    TEMP = X[JX]
-                    if NOCONJ:
-                        for I in range(J - 1):
-                            TEMP -= A[I, J] * X[IX]
-                            IX += INCX
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J]
-                    else:
-                        for I in range(J - 1):
-                            TEMP -= A[1, J].conjugate() * X[IX]
-                            IX += INCX
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J].conjugate()
-                    X[JX] = TEMP
-                    JX += INCX
-        else:
-            if INCX == 1:
-                for J in range(N - 1, -1, -1):
-                    TEMP = X[J]
-                    if NOCONJ:
-                        for I in range(N - 1, J - 1, -1):
-                            TEMP -= A[I, J] * X[I]
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J]
-                    else:
-                        for I in range(N - 1, J - 1, -1):
-                            TEMP -= A[1, J].conjugate() * X[I]
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J].conjugate()
-                    X[J] = TEMP
-            else:
-                KX += (N - 1) * INCX
-                JX = KX
-                for J in range(N - 1, -1, -1):
-                    IX = KX
-                    TEMP = X[JX]
-                    if NOCONJ:
-                        for I in range(N - 1, J - 1, -1):
-                            TEMP -= A[I, J] * X[IX]
-                            IX -= INCX
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J]
-                    else:
-                        for I in range(N - 1, J - 1, -1):
-                            TEMP -= A[1, J].conjugate() * X[IX]
-                            IX -= INCX
-                        if NOUNIT:
-                            TEMP = TEMP / A[J, J].conjugate()
-                    X[JX] = TEMP
-                    JX -= INCX
+
+    # Start the operations, solving diagonal blocks of blocked.NB columns
+    # and updating the rest of x with one matrix-vector product per block.
+    trsv(UPLO, TRANS, DIAG, A[:N, :N], X[slice_(N, INCX)])
@@ -0,0 +1,724 @@
+"""Blocked kernels shared by the level 3 routines.
+
+The reference routines work one scalar at a time.  The kernels in this module
+split the operands into tiles of at most ``MB x KB`` (for ``A``), ``KB x NB``
+(for ``B``) and ``MB x NB`` (for ``C``) elements and compute each tile with a
+single vectorized numpy operation.
+
+Operands are passed in their *stored* orientation together with the BLAS
+``TRANS`` character, exactly as the reference routines receive them.
+
+numpy returns every product laid out by rows, while the reference routines
+expect Fortran (column) order.  So that neither kind of array is walked
+with large strides, each tile product is formed in the storage order of the
+``C`` it updates, as ``C**T = op(B)**T*op(A)**T`` on transposed views when
+``C`` is stored by columns, and the tiles of ``C`` are visited in the same
+order.  No operand is ever copied to change its layout.
+
+Independent tiles of ``C`` can be farmed out to a persistent thread pool.
+numpy releases the GIL inside its block products, so the tiles really do run
+concurrently, and since each tile is computed in the same order whichever
+thread picks it up the result does not depend on the number of threads.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+from .. import tune, workspace
+from ..util import lsame
+
+# Rows of C, columns of C and the inner (K) dimension of a single tile.
+MB = 256
+NB = 256
+KB = 256
+
+# Tile sizes per dtype character, as measured by ``python -m pyblas.tune`` on
+# this machine.  Dtypes not listed use MB, NB and KB.
+TUNED = tune.load()
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def block_sizes(DTYPE=None):
+    """Returns the ``(MB, NB, KB)`` tile sizes for arrays of `DTYPE`."""
+    if DTYPE is not None:
+        SIZES = TUNED.get(np.dtype(DTYPE).char)
+        if SIZES is not None:
+            return SIZES
+    return MB, NB, KB
+
+
+def num_threads(NUM_THREADS=None):
+    """Returns the number of threads to use.
+
+    `NUM_THREADS` takes precedence, then the ``PYBLAS_NUM_THREADS`` environment
+    variable.  The default is a single thread.
+    """
+    if NUM_THREADS is None:
+        NUM_THREADS = int(os.environ.get("PYBLAS_NUM_THREADS", "1"))
+    return max(1, int(NUM_THREADS))
+
+
+def thread_pool(NUM_THREADS):
+    """Returns the persistent pool of `NUM_THREADS` workers.
+
+    The pool is created on first use.
+    """
+    with _POOLS_LOCK:
+        if NUM_THREADS not in _POOLS:
+            _POOLS[NUM_THREADS] = ThreadPoolExecutor(
+                NUM_THREADS, thread_name_prefix="pyblas"
+            )
+        return _POOLS[NUM_THREADS]
+
+
+def for_each_tile(f, M, N, NUM_THREADS=None, ORDER="F", DTYPE=None):
+    """Calls ``f(I0, I1, J0, J1)`` for every ``MB x NB`` tile of an ``M x N`` matrix.
+
+    The tiles are visited a column of tiles at a time, or a row at a time for
+    ``ORDER = 'C'``, following the storage order of the matrix.  They must be
+    independent of each other.  With more than one thread they are handed to
+    the thread pool and any exception raised by `f` is re-raised here once
+    all tiles have finished.  Tile sizes are those for `DTYPE`, see
+    `block_sizes`.
+    """
+    MB, NB, _ = block_sizes(DTYPE)
+    if ORDER == "C":
+        TILES = [(I0, I1, J0, J1) for I0, I1 in tiles(M, MB) for J0, J1 in tiles(N, NB)]
+    else:
+        TILES = [(I0, I1, J0, J1) for J0, J1 in tiles(N, NB) for I0, I1 in tiles(M, MB)]
+    run_tiles(f, TILES, NUM_THREADS)
+
+
+def run_tiles(f, TILES, NUM_THREADS=None):
+    """Calls ``f(*TILE)`` for every tile in `TILES`, see `for_each_tile`."""
+    NUM_THREADS = min(num_threads(NUM_THREADS), len(TILES))
+    if NUM_THREADS <= 1:
+        for TILE in TILES:
+            f(*TILE)
+        return
+    FUTURES = [thread_pool(NUM_THREADS).submit(f, *TILE) for TILE in TILES]
+    for FUTURE in FUTURES:
+        FUTURE.result()
+
+
+def storage_order(X):
+    """Returns ``'F'`` if the 2-D array `X` is stored by columns, else ``'C'``."""
+    return "F" if abs(X.strides[0]) < abs(X.strides[1]) else "C"
+
+
+def tiles(N, NB):
+    """Yields the ``(start, stop)`` bounds of consecutive blocks of size `NB`
+    covering ``range(N)``."""
+    for J in range(0, N, NB):
+        yield J, min(J + NB, N)
+
+
+def op_tile(X, TRANS, I0, I1, J0, J1):
+    """Returns the ``[I0:I1, J0:J1]`` tile of ``op(X)``.
+
+    Only the tile is conjugated, so ``TRANS = 'C'`` on a complex matrix never
+    makes a copy of the full operand.
+    """
+    if lsame(TRANS, "N"):
+        return X[I0:I1, J0:J1]
+    T = X[J0:J1, I0:I1].T
+    if lsame(TRANS, "C") and np.iscomplexobj(T):
+        return T.conj()
+    return T
+
+
+def scale(BETA, C):
+    """Forms ``C := BETA*C`` in place, with ``BETA = 0`` clearing `C`."""
+    if BETA == 0:
+        C[...] = 0
+    elif BETA != 1:
+        C *= BETA
+
+
+def _matmul(X, Y, ORDER, OUT=None):
+    # X*Y laid out in ORDER, written to OUT if given.
+    if ORDER == "C":
+        return np.matmul(X, Y, out=OUT)
+    return np.matmul(Y.T, X.T, out=None if OUT is None else OUT.T).T
+
+
+def accumulate(PAIRS, ALPHA, ORDER="C", OUT=None):
+    """Returns ``ALPHA`` times the sum of ``X*Y`` over the pairs ``(X, Y)`` in `PAIRS`.
+
+    The sum is laid out in memory by rows, or by columns for ``ORDER = 'F'``,
+    in which case each product is formed as ``(Y**T*X**T)**T`` on transposed
+    views.  Adding it to a tile of ``C`` stored the same way then runs over
+    unit-stride memory in both operands, without any copy.
+
+    The sum is formed in `OUT` if it is given, an array of the right shape
+    laid out in `ORDER`, and in a new array otherwise.  Partial products go
+    to a scratch tile borrowed from the `workspace` pool.
+    """
+    PAIRS = iter(PAIRS)
+    X, Y = next(PAIRS)
+    ACC = _matmul(X, Y, ORDER, OUT)
+    with ExitStack() as STACK:
+        P = None
+        for X, Y in PAIRS:
+            if P is None:
+                P = STACK.enter_context(workspace.borrow(ACC.shape, ACC.dtype, ORDER))
+            ACC += _matmul(X, Y, ORDER, P)
+    if ALPHA != 1:
+        ACC *= ALPHA
+    return ACC
+
+
+def product_tile(TRANSA, TRANSB, ALPHA, A, B, I0, I1, J0, J1, ORDER="C", OUT=None):
+    """Returns the ``[I0:I1, J0:J1]`` tile of ``ALPHA*op(A)*op(B)`` laid out in
+    `ORDER`, in `OUT` if given, see `accumulate`.
+
+    The inner dimension is accumulated in a fixed order, so a tile is always
+    bit-for-bit the same no matter which other tiles are computed around it.
+    """
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    KB = block_sizes(np.result_type(A, B))[2]
+    return accumulate(
+        (
+            (op_tile(A, TRANSA, I0, I1, L0, L1), op_tile(B, TRANSB, L0, L1, J0, J1))
+            for L0, L1 in tiles(K, KB)
+        ),
+        ALPHA,
+        ORDER,
+        OUT,
+    )
+
+
+def gemm_tile(TRANSA, TRANSB, ALPHA, A, B, BETA, C, I0, I1, J0, J1, EPILOGUE=None):
+    """Computes the ``[I0:I1, J0:J1]`` tile of ``C := ALPHA*op(A)*op(B) + BETA*C``,
+    then applies `EPILOGUE` to it.  The product is formed in the storage order
+    of `C`, in a tile borrowed from the `workspace` pool."""
+    CT = C[I0:I1, J0:J1]
+    ORDER = storage_order(CT)
+    with workspace.borrow(CT.shape, np.result_type(A, B), ORDER) as ACC:
+        product_tile(TRANSA, TRANSB, ALPHA, A, B, I0, I1, J0, J1, ORDER, ACC)
+        scale(BETA, CT)
+        CT += ACC
+    if EPILOGUE is not None:
+        EPILOGUE(CT, I0, I1, J0, J1)
+
+
+def scale_tiles(BETA, C, EPILOGUE=None, NUM_THREADS=None):
+    """Forms ``C := BETA*C`` and applies `EPILOGUE`, one tile of `C` at a time.
+
+    This is the whole of a GEMM whose product vanishes (``ALPHA = 0`` or
+    ``K = 0``).
+    """
+    if EPILOGUE is None:
+        scale(BETA, C)
+        return
+
+    def f(I0, I1, J0, J1):
+        CT = C[I0:I1, J0:J1]
+        scale(BETA, CT)
+        EPILOGUE(CT, I0, I1, J0, J1)
+
+    for_each_tile(f, C.shape[0], C.shape[1], NUM_THREADS, storage_order(C), C.dtype)
+
+
+def gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_THREADS=None, EPILOGUE=None):
+    """Forms ``C := ALPHA*op(A)*op(B) + BETA*C`` one ``MB x NB`` tile of `C` at a time.
+
+    Parameters
+    ----------
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    TRANSB : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(B)``
+    ALPHA : scalar
+        Multiplier of ``op(A)*op(B)``
+    A : numpy.ndarray
+        The stored matrix `A`, exactly ``NROWA x NCOLA``
+    B : numpy.ndarray
+        The stored matrix `B`, exactly ``NROWB x NCOLB``
+    BETA : scalar
+        Multiplier of `C`
+    C : numpy.ndarray
+        The ``M x N`` matrix `C`, overwritten with the result
+    NUM_THREADS : int, optional
+        Number of threads computing tiles of `C`, see `num_threads`
+    EPILOGUE : callable, optional
+        Called as ``EPILOGUE(CT, I0, I1, J0, J1)`` on each finished tile
+        ``CT = C[I0:I1, J0:J1]``, see `epilogue.Epilogue`
+
+    Returns
+    -------
+    None
+    """
+    M, N = C.shape
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    if M == 0 or N == 0:
+        return
+    if ALPHA == 0 or K == 0:
+        scale_tiles(BETA, C, EPILOGUE, NUM_THREADS)
+        return
+
+    def f(I0, I1, J0, J1):
+        gemm_tile(TRANSA, TRANSB, ALPHA, A, B, BETA, C, I0, I1, J0, J1, EPILOGUE)
+
+    for_each_tile(f, M, N, NUM_THREADS, storage_order(C), C.dtype)
+
+
+def product_tile_3m(TRANSA, TRANSB, ALPHA, A, B, I0, I1, J0, J1):
+    """Returns the ``[I0:I1, J0:J1]`` tile of complex ``ALPHA*op(A)*op(B)`` by 3M.
+
+    With ``op(A) = Ar + i*Ai`` and ``op(B) = Br + i*Bi`` each block product is
+    formed from the three real products ``T1 = Ar*Br``, ``T2 = Ai*Bi`` and
+    ``T3 = (Ar + Ai)*(Br + Bi)`` as ``(T1 - T2) + i*(T3 - T1 - T2)``, rather
+    than the four real products of the complex multiplication.
+    """
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    KB = block_sizes(np.result_type(A, B))[2]
+    RE = IM = None
+    for L0, L1 in tiles(K, KB):
+        X = op_tile(A, TRANSA, I0, I1, L0, L1)
+        Y = op_tile(B, TRANSB, L0, L1, J0, J1)
+        T1 = X.real @ Y.real
+        T2 = X.imag @ Y.imag
+        T3 = (X.real + X.imag) @ (Y.real + Y.imag)
+        T3 -= T1
+        T3 -= T2
+        T1 -= T2
+        if RE is None:
+            RE, IM = T1, T3
+        else:
+            RE += T1
+            IM += T3
+    ACC = RE + 1j * IM
+    if ALPHA != 1:
+        ACC *= ALPHA
+    return ACC
+
+
+def gemm3m(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_THREADS=None):
+    """Forms complex ``C := ALPHA*op(A)*op(B) + BETA*C`` with 3 real block products.
+
+    The arguments are those of `gemm`.  See `product_tile_3m` for the method.
+    It does 3/4 of the real flops of `gemm`, at the price of a larger error
+    in the imaginary part: it is bounded relative to
+    ``(|Ar| + |Ai|)*(|Br| + |Bi|)`` rather than to ``|op(A)|*|op(B)|``, so
+    products with heavy cancellation between the real and imaginary parts
+    lose more digits.
+    """
+    M, N = C.shape
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    if M == 0 or N == 0:
+        return
+    if ALPHA == 0 or K == 0:
+        scale(BETA, C)
+        return
+
+    def f(I0, I1, J0, J1):
+        ACC = product_tile_3m(TRANSA, TRANSB, ALPHA, A, B, I0, I1, J0, J1)
+        CT = C[I0:I1, J0:J1]
+        scale(BETA, CT)
+        CT += ACC
+
+    for_each_tile(f, M, N, NUM_THREADS, storage_order(C), C.dtype)
+
+
+def triangle_tiles(N, UPLO, DTYPE=None):
+    """Returns the ``NB x NB`` tiles of an ``N x N`` matrix meeting its `UPLO` triangle.
+
+    Diagonal tiles come first in each block column, as ``(J0, J1, J0, J1)``.
+    """
+    NB = block_sizes(DTYPE)[1]
+    UPPER = lsame(UPLO, "U")
+    TILES = []
+    for J0, J1 in tiles(N, NB):
+        TILES.append((J0, J1, J0, J1))
+        for I0, I1 in tiles(N, NB):
+            if (I1 <= J0) if UPPER else (I0 >= J1):
+                TILES.append((I0, I1, J0, J1))
+    return TILES
+
+
+def update_triangle(UPLO, BETA, P, C, HERM=False):
+    """Forms ``C := P + BETA*C`` on the `UPLO` triangle of the square tile `C` only.
+
+    `P` may be ``None`` for ``C := BETA*C``.  With `HERM` the diagonal of the
+    result is made real, as the Hermitian routines require.
+    """
+    N = C.shape[0]
+    I, J = np.triu_indices(N) if lsame(UPLO, "U") else np.tril_indices(N)
+    T = C[I, J]
+    scale(BETA, T)
+    if P is not None:
+        T += P[I, J]
+    C[I, J] = T
+    if HERM:
+        D = np.arange(N)
+        C[D, D] = C[D, D].real
+
+
+def syrk(UPLO, TRANS, ALPHA, A, BETA, C, HERM=False, NUM_THREADS=None, B=None):
+    """Forms the `UPLO` triangle of a symmetric or Hermitian rank-k update.
+
+    ``C := ALPHA*A*A**T + BETA*C`` or ``C := ALPHA*A**T*A + BETA*C`` (with
+    ``**H`` in place of ``**T`` when `HERM` is set).  Given `B`, the rank-2k
+    update ``C := ALPHA*A*B**T + ALPHA*B*A**T + BETA*C`` or
+    ``C := ALPHA*A**T*B + ALPHA*B**T*A + BETA*C`` is formed instead, the
+    second term taking ``conj(ALPHA)`` when `HERM` is set.
+
+    Only the ``NB x NB`` tiles of `C` that meet the `UPLO` triangle are
+    computed: off-diagonal tiles are ordinary GEMM tiles, and on diagonal
+    tiles only the `UPLO` part of the tile product is stored.  The other
+    triangle of `C` is not touched.
+
+    Parameters
+    ----------
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `C` to update
+    TRANS : str
+        ``'N'`` for ``A*A**T``, ``'T'`` or ``'C'`` for ``A**T*A``
+    ALPHA : scalar
+        Multiplier of the rank-k term, real when `HERM` is set
+    A : numpy.ndarray
+        The stored matrix `A`, exactly ``N x K`` (``'N'``) or ``K x N``
+    BETA : scalar
+        Multiplier of `C`, real when `HERM` is set
+    C : numpy.ndarray
+        The ``N x N`` matrix `C`
+    HERM : bool
+        Whether to form the Hermitian (``**H``) rather than symmetric update
+    NUM_THREADS : int, optional
+        Number of threads computing tiles of `C`, see `num_threads`
+    B : numpy.ndarray, optional
+        The stored matrix `B` of a rank-2k update, shaped like `A`
+
+    Returns
+    -------
+    None
+    """
+    N = C.shape[0]
+    NOTRANS = lsame(TRANS, "N")
+    K = A.shape[1] if NOTRANS else A.shape[0]
+    CONJ = "C" if HERM else "T"
+    TRANSA, TRANSB = ("N", CONJ) if NOTRANS else (CONJ, "N")
+    RANKK = ALPHA != 0 and K != 0
+    if B is None:
+        TERMS = [(ALPHA, A, A)]
+    else:
+        TERMS = [(ALPHA, A, B), (ALPHA.conjugate() if HERM else ALPHA, B, A)]
+
+    def f(I0, I1, J0, J1):
+        if I0 == J0:
+            P = None
+            if RANKK:
+                for T, (AL, X, Y) in enumerate(TERMS):
+                    PT = product_tile(TRANSA, TRANSB, AL, X, Y, I0, I1, J0, J1)
+                    P = P + PT if T else PT
+            update_triangle(UPLO, BETA, P, C[I0:I1, J0:J1], HERM)
+        elif RANKK:
+            for T, (AL, X, Y) in enumerate(TERMS):
+                CB = 1 if T else BETA
+                gemm_tile(TRANSA, TRANSB, AL, X, Y, CB, C, I0, I1, J0, J1)
+        else:
+            scale(BETA, C[I0:I1, J0:J1])
+
+    run_tiles(f, triangle_tiles(N, UPLO, C.dtype), NUM_THREADS)
+
+
+def sym_tile(A, UPLO, I0, I1, J0, J1, HERM=False):
+    """Returns the ``[I0:I1, J0:J1]`` tile of the symmetric or, with `HERM`,
+    Hermitian matrix whose `UPLO` triangle is stored in `A`.
+
+    A tile strictly inside one triangle is a view of `A` (conjugated for the
+    mirrored triangle of a Hermitian matrix).  Only tiles crossing the
+    diagonal are assembled into a new array, with the imaginary part of the
+    diagonal of a Hermitian matrix taken as zero.
+    """
+    UPPER = lsame(UPLO, "U")
+    if (I1 <= J0) if UPPER else (I0 >= J1):
+        return A[I0:I1, J0:J1]
+    MIRROR = A[J0:J1, I0:I1].T
+    if HERM:
+        MIRROR = MIRROR.conj()
+    if (I0 >= J1) if UPPER else (I1 <= J0):
+        return MIRROR
+    I = np.arange(I0, I1)[:, None]
+    J = np.arange(J0, J1)[None, :]
+    T = np.where((I <= J) if UPPER else (I >= J), A[I0:I1, J0:J1], MIRROR)
+    if HERM:
+        D = np.arange(max(I0, J0), min(I1, J1))
+        T[D - I0, D - J0] = T[D - I0, D - J0].real
+    return T
+
+
+def symm(SIDE, UPLO, ALPHA, A, B, BETA, C, HERM=False, NUM_THREADS=None):
+    """Forms ``C := ALPHA*A*B + BETA*C`` or ``C := ALPHA*B*A + BETA*C``, `A`
+    symmetric or Hermitian.
+
+    This is a GEMM whose tiles of `A` come from `sym_tile`, so only the
+    `UPLO` triangle of `A` is referenced.
+
+    Parameters
+    ----------
+    SIDE : str
+        ``'L'`` for ``A*B``, ``'R'`` for ``B*A``
+    UPLO : str
+        ``'U'`` or ``'L'``, the triangle of `A` that is stored
+    ALPHA : scalar
+        Multiplier of the product
+    A : numpy.ndarray
+        The symmetric matrix, exactly ``M x M`` (``'L'``) or ``N x N``
+    B : numpy.ndarray
+        The ``M x N`` matrix `B`
+    BETA : scalar
+        Multiplier of `C`
+    C : numpy.ndarray
+        The ``M x N`` matrix `C`, overwritten with the result
+    HERM : bool
+        Whether `A` is Hermitian rather than symmetric
+    NUM_THREADS : int, optional
+        Number of threads computing tiles of `C`, see `num_threads`
+
+    Returns
+    -------
+    None
+    """
+    M, N = C.shape
+    if M == 0 or N == 0:
+        return
+    if ALPHA == 0:
+        scale(BETA, C)
+        return
+    LEFT = lsame(SIDE, "L")
+    KB = block_sizes(C.dtype)[2]
+
+    def f(I0, I1, J0, J1):
+        CT = C[I0:I1, J0:J1]
+        if LEFT:
+            PAIRS = (
+                (sym_tile(A, UPLO, I0, I1, L0, L1, HERM), B[L0:L1, J0:J1])
+                for L0, L1 in tiles(M, KB)
+            )
+        else:
+            PAIRS = (
+                (B[I0:I1, L0:L1], sym_tile(A, UPLO, L0, L1, J0, J1, HERM))
+                for L0, L1 in tiles(N, KB)
+            )
+        ORDER = storage_order(CT)
+        with workspace.borrow(CT.shape, np.result_type(A, B), ORDER) as ACC:
+            accumulate(PAIRS, ALPHA, ORDER, ACC)
+            scale(BETA, CT)
+            CT += ACC
+
+    for_each_tile(f, M, N, NUM_THREADS, storage_order(C), C.dtype)
+
+
+def _as_left(SIDE, UPLO, TRANSA, A, B):
+    # Brings op(A)*B or B*op(A) to the form T*B, returning (T, LOWER, CONJ, B)
+    # with T and B views of A and B.
+    LOWER = lsame(UPLO, "L")
+    CONJ = lsame(TRANSA, "C") and np.iscomplexobj(A)
+    if lsame(SIDE, "L"):
+        if lsame(TRANSA, "N"):
+            return A, LOWER, CONJ, B
+        return A.T, not LOWER, CONJ, B
+    if lsame(TRANSA, "N"):
+        return A.T, not LOWER, CONJ, B.T
+    return A, LOWER, CONJ, B.T
+
+
+def _product(ALPHA, T, CONJ, X, BETA, B, NUM_THREADS):
+    # B := ALPHA*T*X + BETA*B, with T conjugated when CONJ is set.
+    if CONJ:
+        gemm("C", "N", ALPHA, T.T, X, BETA, B, NUM_THREADS)
+    else:
+        gemm("N", "N", ALPHA, T, X, BETA, B, NUM_THREADS)
+
+
+def _substitute(T, LOWER, CONJ, NOUNIT, B):
+    # Solves T*X = B in place one row of X at a time, each row a single
+    # vectorized update over all right hand sides.
+    if CONJ:
+        T = T.conj()
+    N = T.shape[0]
+    for I in range(N) if LOWER else range(N - 1, -1, -1):
+        if LOWER and I > 0:
+            B[I] -= T[I, :I] @ B[:I]
+        elif not LOWER and I < N - 1:
+            B[I] -= T[I, I + 1 :] @ B[I + 1 :]
+        if NOUNIT:
+            B[I] /= T[I, I]
+
+
+def _trsm_left(T, LOWER, CONJ, NOUNIT, B, NUM_THREADS):
+    # Solves T*X = B in place, T triangular, by splitting T in two and
+    # handing the off-diagonal block to the blocked GEMM.
+    N = T.shape[0]
+    if N <= block_sizes(B.dtype)[1]:
+        _substitute(T, LOWER, CONJ, NOUNIT, B)
+        return
+    N1 = N // 2
+    T11, T22 = T[:N1, :N1], T[N1:, N1:]
+    B1, B2 = B[:N1], B[N1:]
+    if LOWER:
+        _trsm_left(T11, LOWER, CONJ, NOUNIT, B1, NUM_THREADS)
+        _product(-1, T[N1:, :N1], CONJ, B1, 1, B2, NUM_THREADS)
+        _trsm_left(T22, LOWER, CONJ, NOUNIT, B2, NUM_THREADS)
+    else:
+        _trsm_left(T22, LOWER, CONJ, NOUNIT, B2, NUM_THREADS)
+        _product(-1, T[:N1, N1:], CONJ, B2, 1, B1, NUM_THREADS)
+        _trsm_left(T11, LOWER, CONJ, NOUNIT, B1, NUM_THREADS)
+
+
+def trsm(SIDE, UPLO, TRANSA, DIAG, ALPHA, A, B, NUM_THREADS=None):
+    """Solves ``op(A)*X = ALPHA*B`` or ``X*op(A) = ALPHA*B``, overwriting `B` with `X`.
+
+    The triangular matrix is split recursively in halves.  The two diagonal
+    halves are solved recursively and the off-diagonal block updates the
+    remaining right hand sides with the blocked GEMM, so all but the
+    ``NB x NB`` diagonal blocks of work are matrix products.  The diagonal
+    blocks are solved by substitution, one row of ``X`` at a time across all
+    right hand sides.
+
+    A right sided solve ``X*op(A) = B`` is carried out as the left sided
+    ``op(A)**T*X**T = B**T`` on transposed views, without copies.
+
+    Parameters
+    ----------
+    SIDE : str
+        ``'L'`` for ``op(A)*X = ALPHA*B``, ``'R'`` for ``X*op(A) = ALPHA*B``
+    UPLO : str
+        ``'U'`` or ``'L'``, whether `A` is upper or lower triangular
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    DIAG : str
+        ``'U'`` if `A` is unit triangular, ``'N'`` otherwise
+    ALPHA : scalar
+        Multiplier of `B`
+    A : numpy.ndarray
+        The triangular matrix, exactly ``M x M`` (``'L'``) or ``N x N``
+    B : numpy.ndarray
+        The ``M x N`` right hand sides, overwritten with the solution
+    NUM_THREADS : int, optional
+        Number of threads used by the matrix products, see `num_threads`
+
+    Returns
+    -------
+    None
+    """
+    scale(ALPHA, B)
+    if ALPHA == 0 or B.size == 0:
+        return
+    T, LOWER, CONJ, B = _as_left(SIDE, UPLO, TRANSA, A, B)
+    NOUNIT = lsame(DIAG, "N")
+    _trsm_left(T, LOWER, CONJ, NOUNIT, B, NUM_THREADS)
+
+
+def _add_product(T, CONJ, X, Y, ACC):
+    # Forms Y := Y + T*X, or Y + conj(T)*X with CONJ, a tile of columns at a
+    # time in the scratch ACC.  conj(T)*X is formed as conj(T*conj(X)),
+    # conjugating X in place and back rather than copying T.
+    M, N = Y.shape
+    ORDER = storage_order(ACC)
+    for J0, J1 in tiles(N, ACC.shape[1]):
+        XJ, P = X[:, J0:J1], ACC[:M, : J1 - J0]
+        if CONJ:
+            np.conjugate(XJ, out=XJ)
+        _matmul(T, XJ, ORDER, P)
+        if CONJ:
+            np.conjugate(XJ, out=XJ)
+            np.conjugate(P, out=P)
+        Y[:, J0:J1] += P
+
+
+def _multiply(T, LOWER, CONJ, NOUNIT, B, ACC):
+    # Forms B := T*B in place, T triangular, by splitting T in two until a
+    # few rows are left, which are done one row at a time.  Each row or
+    # block of rows only reads rows of B that have not been overwritten yet.
+    N = T.shape[0]
+    if N > 16:
+        N1 = N // 2
+        if LOWER:
+            _multiply(T[N1:, N1:], LOWER, CONJ, NOUNIT, B[N1:], ACC)
+            _add_product(T[N1:, :N1], CONJ, B[:N1], B[N1:], ACC)
+            _multiply(T[:N1, :N1], LOWER, CONJ, NOUNIT, B[:N1], ACC)
+        else:
+            _multiply(T[:N1, :N1], LOWER, CONJ, NOUNIT, B[:N1], ACC)
+            _add_product(T[:N1, N1:], CONJ, B[N1:], B[:N1], ACC)
+            _multiply(T[N1:, N1:], LOWER, CONJ, NOUNIT, B[N1:], ACC)
+        return
+    for I in range(N - 1, -1, -1) if LOWER else range(N):
+        if NOUNIT:
+            B[I] *= T[I, I].conjugate() if CONJ else T[I, I]
+        ROW = T[I, :I] if LOWER else T[I, I + 1 :]
+        if ROW.size:
+            B[I] += (ROW.conj() if CONJ else ROW) @ (B[:I] if LOWER else B[I + 1 :])
+
+
+def trmm(SIDE, UPLO, TRANSA, DIAG, ALPHA, A, B, NUM_THREADS=None):
+    """Forms ``B := ALPHA*op(A)*B`` or ``B := ALPHA*B*op(A)`` in place, `A` triangular.
+
+    Written as ``B := T*B`` (a right sided product works on transposed views),
+    block row ``I`` of the result only depends on block rows of ``B`` on one
+    side of ``I``: those above it for a lower triangular ``T`` and those below
+    for an upper one.  Visiting block rows from the far end, each block row
+    is first multiplied in place by the diagonal block of ``T``, split in two
+    recursively, and then each of its ``NB x NB`` tiles gets the product of
+    the rest of ``T`` with rows of ``B`` that have not been overwritten yet.
+    All products are formed in a single scratch tile, one per thread, so the
+    extra memory is one tile (and a row of ``B``), never a copy of ``B``.
+
+    Parameters
+    ----------
+    SIDE : str
+        ``'L'`` for ``op(A)*B``, ``'R'`` for ``B*op(A)``
+    UPLO : str
+        ``'U'`` or ``'L'``, whether `A` is upper or lower triangular
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    DIAG : str
+        ``'U'`` if `A` is unit triangular, ``'N'`` otherwise
+    ALPHA : scalar
+        Multiplier of the product
+    A : numpy.ndarray
+        The triangular matrix, exactly ``M x M`` (``'L'``) or ``N x N``
+    B : numpy.ndarray
+        The ``M x N`` matrix `B`, overwritten with the product
+    NUM_THREADS : int, optional
+        Number of threads used by the off-diagonal products, see `num_threads`
+
+    Returns
+    -------
+    None
+    """
+    if ALPHA == 0:
+        B[...] = 0
+        return
+    T, LOWER, CONJ, B = _as_left(SIDE, UPLO, TRANSA, A, B)
+    NOUNIT = lsame(DIAG, "N")
+    M, N = B.shape
+    NB = block_sizes(B.dtype)[1]
+    ROWS = list(tiles(M, NB))
+    ORDER = storage_order(B)
+    DTYPE = np.result_type(T, B)
+
+    def f(I0, I1, K0, K1, J0, J1):
+        # Adds the off-diagonal part T[I, K]*B[K, J] to the tile B[I, J].
+        with workspace.borrow((I1 - I0, J1 - J0), DTYPE, ORDER) as ACC:
+            _add_product(T[I0:I1, K0:K1], CONJ, B[K0:K1, J0:J1], B[I0:I1, J0:J1], ACC)
+
+    for I0, I1 in reversed(ROWS) if LOWER else ROWS:
+        # The rows of B, other than I0:I1, that block row I0:I1 depends on.
+        K0, K1 = (0, I0) if LOWER else (I1, M)
+        with workspace.borrow((I1 - I0, min(N, NB)), DTYPE, ORDER) as ACC:
+            _multiply(T[I0:I1, I0:I1], LOWER, CONJ, NOUNIT, B[I0:I1], ACC)
+        if K0 < K1:
+            run_tiles(
+                f, [(I0, I1, K0, K1, J0, J1) for J0, J1 in tiles(N, NB)], NUM_THREADS
+            )
+        if ALPHA != 1:
+            B[I0:I1] *= ALPHA
@@ -185,11 +185,33 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+import numpy as np
 
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import gemm
+from .outofcore import gemm_outofcore
+from .shared import gemm_shared
 
-def CGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
+
+def CGEMM(
+    TRANSA,
+    TRANSB,
+    M,
+    N,
+    K,
+    ALPHA,
+    A,
+    LDA,
+    B,
+    LDB,
+    BETA,
+    C,
+    LDC,
+    NUM_THREADS=None,
+    NUM_PROCESSES=None,
+    MEMORY_BUDGET=None,
+):
     #
     #  -- Reference BLAS level3 routine (version 3.7.0) --
     #  -- Reference BLAS is a software package provided by Univ. of Tennessee,    --
@@ -270,98 +292,28 @@ def CGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
         xerbla("CGEMM ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if NOTA else M)
+    B = as_matrix(B, LDB, NROWB, N if NOTB else K)
+    C = as_matrix(C, LDC, M, N)
+
     # Quick return if possible.
     if (M == 0) or (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        C[:M, :N] *= BETA
-        return
-
-    # Start the operations.
-    if NOTB:
-        if NOTA:
-            # Form  C := alpha*A*B + beta*C.
-            for J in range(N):
-                if BETA == 0:
-                    C[:M, J] = 0
-                elif BETA != 1:
-                    C[:M, J] *= BETA
-                for L in range(K):
-                    TEMP = ALPHA * B[L, J]
-                    C[:M, J] += TEMP * A[:M, L]
-        elif CONJA:
-            # Form  C := alpha*A**H*B + beta*C.
-            for J in range(N):
-                for I in range(M):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I].conjugate() * B[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
-        else:
-            # Form  C := alpha*A**T*B + beta*C
-            for J in range(N):
-                for I in range(M):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I] * B[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
-    elif NOTA:
-        if CONJB:
-            # Form  C := alpha*A*B**H + beta*C.
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(M):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(M):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    TEMP = ALPHA * B[J, L].conjugate()
-                    for I in range(M):
-                        C[I, J] += TEMP * A[I, L]
-        else:
-            # Form  C := alpha*A*B**T + beta*C
-            for J in range(N):
-                if BETA == 0:
-                    C[:M, J] = 0
-                elif BETA != 1:
-                    C[:M, J] *= BETA
-                for L in range(K):
-                    C[:M, J] += ALPHA * B[J, L] * A[:M, L]
-    elif CONJA:
-        if CONJB:
-            # Form  C := alpha*A**H*B**H + beta*C.
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = (
-                        ALPHA * (A[:K, I].conjugate() * B[J, :K].conjugate()).sum()
-                        + BETA * C[I, J]
-                    )
-        else:
-            # Form  C := alpha*A**H*B**T + beta*C
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = (
-                        ALPHA * (A[:K, I].conjugate() * B[J, :K]).sum() + BETA * C[I, J]
-                    )
+    # Start the operations, one tile of C at a time.  NUM_THREADS (default:
+    # the PYBLAS_NUM_THREADS environment variable) threads share the tiles,
+    # or, given NUM_PROCESSES, worker processes share column panels of C held
+    # in shared memory.  Operands on disk (np.memmap) are streamed through
+    # memory in tiles held within MEMORY_BUDGET bytes (default:
+    # outofcore.DEFAULT_MEMORY_BUDGET); the bytes read are counted in
+    # outofcore.stats().
+    NCOLA = K if NOTA else M
+    NCOLB = N if NOTB else K
+    A, B, C = A[:NROWA, :NCOLA], B[:NROWB, :NCOLB], C[:M, :N]
+    if NUM_PROCESSES is not None:
+        gemm_shared(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_PROCESSES)
+    elif any(isinstance(X, np.memmap) for X in (A, B, C)):
+        gemm_outofcore(TRANSA, TRANSB, ALPHA, A, B, BETA, C, MEMORY_BUDGET)
     else:
-        if CONJB:
-            # Form  C := alpha*A**T*B**H + beta*C
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = (
-                        ALPHA * (A[:K, I] * B[J, :K].conjugate()).sum() + BETA * C[I, J]
-                    )
-        else:
-            # Form  C := alpha*A**T*B**T + beta*C
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = ALPHA * (A[:K, I] * B[J, :K]).sum() + BETA * C[I, J]
+        gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_THREADS)
@@ -0,0 +1,115 @@
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import gemm3m
+
+
+def CGEMM3M(
+    TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC, NUM_THREADS=None
+):
+    """Performs the matrix-matrix operation C := alpha*op(A)*op(B) + beta*C using
+    the 3M method.
+
+    The arguments are those of `CGEMM`.  Each block product is formed from
+    three real matrix products of the real and imaginary parts of op(`A`) and
+    op(`B`) instead of four, saving 1/4 of the flops.  The real part of the
+    result is as accurate as with `CGEMM`, but the error in the imaginary
+    part is bounded relative to (|Re A| + |Im A|)*(|Re B| + |Im B|) instead
+    of |A|*|B|, so it can be larger when the real and imaginary parts cancel.
+
+    Parameters
+    ----------
+    TRANSA : str
+        'N', 'T' or 'C', the form of op(A)
+    TRANSB : str
+        'N', 'T' or 'C', the form of op(B)
+    M : int
+        Number of rows of op(`A`) and of `C`
+    N : int
+        Number of columns of op(`B`) and of `C`
+    K : int
+        Number of columns of op(`A`) and rows of op(`B`)
+    ALPHA : numpy.csingle
+        Multiplier of op(`A`)*op(`B`)
+    A : numpy.ndarray
+        A single precision complex array, dimension (`LDA`, K or M)
+    LDA : int
+        Leading dimension of `A`
+    B : numpy.ndarray
+        A single precision complex array, dimension (`LDB`, N or K)
+    LDB : int
+        Leading dimension of `B`
+    BETA : numpy.csingle
+        Multiplier of `C`
+    C : numpy.ndarray
+        A single precision complex array, dimension (`LDC`, N)
+    LDC : int
+        Leading dimension of `C`
+    NUM_THREADS : int, optional
+        Number of threads computing tiles of `C`, see `blocked.num_threads`
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    zgemm3m : Double-precision complex 3M GEMM
+
+    Notes
+    -----
+    Accuracy and speed against CGEMM: benchmarks/bench_gemm3m.py
+    """
+    NOTA = lsame(TRANSA, "N")
+    NOTB = lsame(TRANSB, "N")
+    if NOTA:
+        NROWA = M
+    else:
+        NROWA = K
+    if NOTB:
+        NROWB = K
+    else:
+        NROWB = N
+
+    # Test the input parameters.
+    INFO = 0
+    if (not NOTA) and (not lsame(TRANSA, "C")) and (not lsame(TRANSA, "T")):
+        INFO = 1
+    elif (not NOTB) and (not lsame(TRANSB, "C")) and (not lsame(TRANSB, "T")):
+        INFO = 2
+    elif M < 0:
+        INFO = 3
+    elif N < 0:
+        INFO = 4
+    elif K < 0:
+        INFO = 5
+    elif LDA < max(1, NROWA):
+        INFO = 8
+    elif LDB < max(1, NROWB):
+        INFO = 10
+    elif LDC < max(1, M):
+        INFO = 13
+    if INFO != 0:
+        xerbla("CGEMM3M", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if NOTA else M)
+    B = as_matrix(B, LDB, NROWB, N if NOTB else K)
+    C = as_matrix(C, LDC, M, N)
+
+    # Quick return if possible.
+    if (M == 0) or (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
+        return
+
+    NCOLA = K if NOTA else M
+    NCOLB = N if NOTB else K
+    gemm3m(
+        TRANSA,
+        TRANSB,
+        ALPHA,
+        A[:NROWA, :NCOLA],
+        B[:NROWB, :NCOLB],
+        BETA,
+        C[:M, :N],
+        NUM_THREADS,
+    )
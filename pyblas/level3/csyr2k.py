@@ -186,8 +186,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import syrk
 
 
 def CSYR2K(UPLO, TRANS, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
@@ -232,87 +233,18 @@ def CSYR2K(UPLO, TRANS, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
         INFO = 12
     if INFO != 0:
         xerbla("CSYR2K", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if lsame(TRANS, "N") else N)
+    B = as_matrix(B, LDB, NROWA, K if lsame(TRANS, "N") else N)
+    C = as_matrix(C, LDC, N, N)
 
     # Quick return if possible.
     if (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        if UPPER:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] *= BETA
-        else:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] *= BETA
-        return
-
-    # Start the operations.
-    if lsame(TRANS, "N"):
-        # Form  C := alpha*A*B**T + alpha*B*A**T + C.
-        if UPPER:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    if (A[J, L] != 0) or (B[J, L] != 0):
-                        TEMP1 = ALPHA * B[J, L]
-                        TEMP2 = ALPHA * A[J, L]
-                        for I in range(J):
-                            C[I, J] += A[I, L] * TEMP1 + B[I, L] * TEMP2
-        else:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J - 1, N):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    if (A[J, L] != 0) or (B[J, L] != 0):
-                        TEMP1 = ALPHA * B[J, L]
-                        TEMP2 = ALPHA * A[J, L]
-                        for I in range(J, N):
-                            C[I, J] += A[I, L] * TEMP1 + B[I, L] * TEMP2
-    else:
-        # Form  C := alpha*A**T*B + alpha*B**T*A + C.
-        if UPPER:
-            for J in range(N):
-                for I in range(J):
-                    TEMP1 = 0
-                    TEMP2 = 0
-                    for L in range(K):
-                        TEMP1 += A[L, I] * B[L, J]
-                        TEMP2 += B[L, I] * A[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP1 + ALPHA * TEMP2
-                    else:
-                        C[I, J] *= BETA + ALPHA * TEMP1 + ALPHA * TEMP2
-        else:
-            for J in range(N):
-                for I in range(J - 1, N):
-                    TEMP1 = 0
-                    TEMP2 = 0
-                    for L in range(K):
-                        TEMP1 += A[L, I] * B[L, J]
-                        TEMP2 += B[L, I] * A[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP1 + ALPHA * TEMP2
-                    else:
-                        C[I, J] *= BETA + ALPHA * TEMP1 + ALPHA * TEMP2
+    # Start the operations, computing only the tiles of the UPLO triangle.
+    NCOLA = K if lsame(TRANS, "N") else N
+    A, B = A[:NROWA, :NCOLA], B[:NROWA, :NCOLA]
+    syrk(UPLO, TRANS, ALPHA, A, BETA, C[:N, :N], B=B)
@@ -175,8 +175,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import trmm
 
 
 def CTRMM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
@@ -203,8 +204,6 @@ def CTRMM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         NROWA = M
     else:
         NROWA = N
-    NOCONJ = lsame(TRANSA, "T")
-    NOUNIT = lsame(DIAG, "N")
     UPPER = lsame(UPLO, "U")
     #
     INFO = 0
@@ -232,139 +231,14 @@ def CTRMM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         xerbla("CTRMM ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, NROWA)
+    B = as_matrix(B, LDB, M, N)
+
     # Quick return if possible.
     if M == 0 or N == 0:
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        for J in range(N):
-            for I in range(M):
-                B[I, J] = 0
-        return
-
-    # Start the operations.
-    if LSIDE:
-        if lsame(TRANSA, "N"):
-            #
-            #           Form  B := alpha*A*B.
-            #
-            if UPPER:
-                for J in range(N):
-                    for K in range(M):
-                        if B[K, J] != 0:
-                            TEMP = ALPHA * B[K, J]
-                            for I in range(K - 1):
-                                B[I, J] = B[I, J] + TEMP * A[I, K]
-                            if NOUNIT:
-                                TEMP = TEMP * A[K, K]
-                            B[K, J] = TEMP
-            else:
-                for J in range(N):
-                    for K in range(M - 1, -1, -1):
-                        if B[K, J] != 0:
-                            TEMP = ALPHA * B[K, J]
-                            B[K, J] = TEMP
-                            if NOUNIT:
-                                B[K, J] = B[K, J] * A[K, K]
-                            for I in range(K, M):
-                                B[I, J] = B[I, J] + TEMP * A[I, K]
-        else:
-            # Form  B := alpha*A**T*B   or   B := alpha*A**H*B.
-            if UPPER:
-                for J in range(N):
-                    for I in range(M - 1, -1, -1):
-                        TEMP = B[I, J]
-                        if NOCONJ:
-                            if NOUNIT:
-                                TEMP = TEMP * A[I, I]
-                            for K in range(I - 1):
-                                TEMP += A[K, I] * B[K, J]
-                        else:
-                            if NOUNIT:
-                                TEMP = TEMP * A[I, I].conjugate()
-                            for K in range(I - 1):
-                                TEMP += A[K, I].conjugate() * B[K, J]
-                        B[I, J] = ALPHA * TEMP
-            else:
-                for J in range(N):
-                    for I in range(M):
-                        TEMP = B[I, J]
-                        if NOCONJ:
-                            if NOUNIT:
-                                TEMP = TEMP * A[I, I]
-                            for K in range(I, M):
-                                TEMP += A[K, I] * B[K, J]
-                        else:
-                            if NOUNIT:
-                                TEMP = TEMP * A[I, I].conjugate()
-                            for K in range(I, M):
-                                TEMP += A[K, I].conjugate() * B[K, J]
-                        B[I, J] = ALPHA * TEMP
-    else:
-        if lsame(TRANSA, "N"):
-            # Form  B := alpha*B*A.
-            if UPPER:
-                for J in range(N - 1, -1, -1):
-                    TEMP = ALPHA
-                    if NOUNIT:
-                        TEMP *= A[J, J]
-                    for I in range(M):
-                        B[I, J] = TEMP * B[I, J]
-                    for K in range(J - 1):
-                        if A[K, J] != 0:
-                            TEMP = ALPHA * A[K, J]
-                            for I in range(M):
-                                B[I, J] = B[I, J] + TEMP * B[I, K]
-            else:
-                for J in range(N):
-                    TEMP = ALPHA
-                    if NOUNIT:
-                        TEMP *= A[J, J]
-                    for I in range(M):
-                        B[I, J] = TEMP * B[I, J]
-                    for K in range(J, N):
-                        if A[K, J] != 0:
-                            TEMP = ALPHA * A[K, J]
-                            for I in range(M):
-                                B[I, J] = B[I, J] + TEMP * B[I, K]
-        else:
-            # Form  B := alpha*B*A**T   or   B := alpha*B*A**H.
-            if UPPER:
-                for K in range(N):
-                    for J in range(K - 1):
-                        if A[J, K] != 0:
-                            if NOCONJ:
-                                TEMP = ALPHA * A[J, K]
-                            else:
-                                TEMP = ALPHA * A[J, K].conjugate()
-                            for I in range(M):
-                                B[I, J] = B[I, J] + TEMP * B[I, K]
-                    TEMP = ALPHA
-                    if NOUNIT:
-                        if NOCONJ:
-                            TEMP = TEMP * A[K, K]
-                        else:
-                            TEMP = TEMP * A[K, K].conjugate()
-                    if TEMP != 1:
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
-            else:
-                for K in range(N - 1, -1, -1):
-                    for J in range(K, N):
-                        if A[J, K] != 0:
-                            if NOCONJ:
-                                TEMP = ALPHA * A[J, K]
-                            else:
-                                TEMP = ALPHA * A[J, K].conjugate()
-                            for I in range(M):
-                                B[I, J] = B[I, J] + TEMP * B[I, K]
-                    TEMP = ALPHA
-                    if NOUNIT:
-                        if NOCONJ:
-                            TEMP = TEMP * A[K, K]
-                        else:
-                            TEMP = TEMP * A[K, K].conjugate()
-                    if TEMP != 1:
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
+    # Start the operations.  B is overwritten tile by tile, in an order that
+    # never reads a tile that has already been overwritten.
+    trmm(SIDE, UPLO, TRANSA, DIAG, ALPHA, A[:NROWA, :NROWA], B[:M, :N])
@@ -178,8 +178,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import trsm
 
 
 def CTRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
@@ -206,8 +207,6 @@ def CTRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         NROWA = M
     else:
         NROWA = N
-    NOCONJ = lsame(TRANSA, "T")
-    NOUNIT = lsame(DIAG, "N")
     UPPER = lsame(UPLO, "U")
     #
     INFO = 0
@@ -233,152 +232,16 @@ def CTRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         INFO = 11
     if INFO != 0:
         xerbla("CTRSM ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, NROWA)
+    B = as_matrix(B, LDB, M, N)
 
     # Quick return if possible.
     if M == 0 or N == 0:
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        for J in range(N):
-            for I in range(M):
-                B[I, J] = 0
-        return
-
-    # Start the operations.
-    if LSIDE:
-        if lsame(TRANSA, "N"):
-            #
-            #           Form  B := alpha*inv( A )*B.
-            #
-            if UPPER:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(M - 1, -1, -1):
-                        if B[K, J] != 0:
-                            if NOUNIT:
-                                B[K, J] = B[K, J] / A[K, K]
-                            for I in range(K - 1):
-                                B[I, J] -= B[K, J] * A[I, K]
-            else:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(M):
-                        if B[K, J] != 0:
-                            if NOUNIT:
-                                B[K, J] = B[K, J] / A[K, K]
-                            for I in range(K, M):
-                                B[I, J] -= B[K, J] * A[I, K]
-        else:
-            #
-            #           Form  B := alpha*inv( A**T )*B
-            #           or    B := alpha*inv( A**H )*B.
-            #
-            if UPPER:
-                for J in range(N):
-                    for I in range(M):
-                        TEMP = ALPHA * B[I, J]
-                        if NOCONJ:
-                            for K in range(I - 1):
-                                TEMP -= A[K, I] * B[K, J]
-                            if NOUNIT:
-                                TEMP = TEMP / A[I, I]
-                        else:
-                            for K in range(I - 1):
-                                TEMP -= A[K, I].conjugate() * B[K, J]
-                            if NOUNIT:
-                                TEMP = TEMP / A[I, I].conjugate()
-                        B[I, J] = TEMP
-            else:
-                for J in range(N):
-                    for I in range(M - 1, -1, -1):
-                        TEMP = ALPHA * B[I, J]
-                        if NOCONJ:
-                            for K in range(I, M):
-                                TEMP -= A[K, I] * B[K, J]
-                            if NOUNIT:
-                                TEMP = TEMP / A[I, I]
-                        else:
-                            for K in range(I, M):
-                                TEMP -= A[K, I].conjugate() * B[K, J]
-                            if NOUNIT:
-                                TEMP = TEMP / A[I, I].conjugate()
-                        B[I, J] = TEMP
-    else:
-        if lsame(TRANSA, "N"):
-            # Form  B := alpha*B*inv( A ).
-            if UPPER:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(J - 1):
-                        if A[K, J] != 0:
-                            for I in range(M):
-                                B[I, J] -= A[K, J] * B[I, K]
-                    if NOUNIT:
-                        TEMP = 1 / A[J, J]
-                        for I in range(M):
-                            B[I, J] = TEMP * B[I, J]
-            else:
-                for J in range(N - 1, -1, -1):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(J, N):
-                        if A[K, J] != 0:
-                            for I in range(M):
-                                B[I, J] -= A[K, J] * B[I, K]
-                    if NOUNIT:
-                        TEMP = 1 / A[J, J]
-                        for I in range(M):
-                            B[I, J] = TEMP * B[I, J]
-        else:
-            #
-            #           Form  B := alpha*B*inv( A**T )
-            #           or    B := alpha*B*inv( A**H ).
-            #
-            if UPPER:
-                for K in range(N - 1, -1, -1):
-                    if NOUNIT:
-                        if NOCONJ:
-                            TEMP = 1 / A[K, K]
-                        else:
-                            TEMP = 1 / A[K, K].conjugate()
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
-                    for J in range(K - 1):
-                        if A[J, K] != 0:
-                            if NOCONJ:
-                                TEMP = A[J, K]
-                            else:
-                                TEMP = A[J, K].conjugate()
-                            for I in range(M):
-                                B[I, J] -= TEMP * B[I, K]
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, K] = ALPHA * B[I, K]
-            else:
-                for K in range(N):
-                    if NOUNIT:
-                        if NOCONJ:
-                            TEMP = 1 / A[K, K]
-                        else:
-                            TEMP = 1 / A[K, K].conjugate()
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
-                    for J in range(K, N):
-                        if A[J, K] != 0:
-                            if NOCONJ:
-                                TEMP = A[J, K]
-                            else:
-                                TEMP = A[J, K].conjugate()
-                            for I in range(M):
-                                B[I, J] -= TEMP * B[I, K]
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, K] = ALPHA * B[I, K]
+    # Start the operations.  The recursive solve does all but the diagonal
+    # blocks of the work as blocked matrix products.
+    trsm(SIDE, UPLO, TRANSA, DIAG, ALPHA, A[:NROWA, :NROWA], B[:M, :N])
@@ -64,6 +64,9 @@
 # >              TRANSB = 'T' or 't',  op( B ) = B**T.
 # >
 # >              TRANSB = 'C' or 'c',  op( B ) = B**T.
+# >
+# >              TRANSB = 'P' or 'p',  op( B ) is prepacked in B, a
+# >                                    PackedMatrix from dgemm_pack.
 # > \endverbatim
 # >
 # > \param[in] M
@@ -185,11 +188,36 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+import numpy as np
+
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import gemm
+from .epilogue import check
+from .outofcore import gemm_outofcore
+from .prepack import PackedMatrix, gemm_packed
+from .shared import gemm_shared
 
 
-def DGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
+def DGEMM(
+    TRANSA,
+    TRANSB,
+    M,
+    N,
+    K,
+    ALPHA,
+    A,
+    LDA,
+    B,
+    LDB,
+    BETA,
+    C,
+    LDC,
+    NUM_THREADS=None,
+    NUM_PROCESSES=None,
+    EPILOGUE=None,
+    MEMORY_BUDGET=None,
+):
     #
     #  -- Reference BLAS level3 routine (version 3.7.0) --
     #  -- Reference BLAS is a software package provided by Univ. of Tennessee,    --
@@ -233,11 +261,12 @@ def DGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
     #
     NOTA = lsame(TRANSA, "N")
     NOTB = lsame(TRANSB, "N")
+    PACKB = lsame(TRANSB, "P")
     if NOTA:
         NROWA = M
     else:
         NROWA = K
-    if NOTB:
+    if NOTB or PACKB:
         NROWB = K
     else:
         NROWB = N
@@ -246,7 +275,12 @@ def DGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
     INFO = 0
     if (not NOTA) and (not lsame(TRANSA, "C")) and (not lsame(TRANSA, "T")):
         INFO = 1
-    elif (not NOTB) and (not lsame(TRANSB, "C")) and (not lsame(TRANSB, "T")):
+    elif (
+        (not NOTB)
+        and (not PACKB)
+        and (not lsame(TRANSB, "C"))
+        and (not lsame(TRANSB, "T"))
+    ):
         INFO = 2
     elif M < 0:
         INFO = 3
@@ -256,68 +290,54 @@ def DGEMM(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
         INFO = 5
     elif LDA < max(1, NROWA):
         INFO = 8
-    elif LDB < max(1, NROWB):
+    elif PACKB and (
+        not isinstance(B, PackedMatrix) or B.shape != (K, N) or B.dtype != np.double
+    ):
+        INFO = 9
+    elif (not PACKB) and LDB < max(1, NROWB):
         INFO = 10
     elif LDC < max(1, M):
         INFO = 13
+    elif PACKB and NUM_PROCESSES is not None:
+        INFO = 15
     if INFO != 0:
         xerbla("DGEMM ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if NOTA else M)
+    B = as_matrix(B, LDB, NROWB, N if NOTB else K)
+    C = as_matrix(C, LDC, M, N)
+
     # Quick return if possible.
-    if (M == 0) or (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
+    if (M == 0) or (N == 0):
         return
-
-    # And if  alpha==zero.
-    if ALPHA == 0:
-        if BETA == 0:
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = 0
-        else:
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] *= BETA
+    if ((ALPHA == 0) or (K == 0)) and (BETA == 1) and (EPILOGUE is None):
         return
 
-    # Start the operations.
-    if NOTB:
-        if NOTA:
-            # Form  C := alpha*A*B + beta*C.
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(M):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(M):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    TEMP = ALPHA * B[L, J]
-                    for I in range(M):
-                        C[I, J] += TEMP * A[I, L]
-        else:
-            # Form  C := alpha*A**T*B + beta*C
-            for J in range(N):
-                for I in range(M):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I] * B[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
+    # Start the operations, one tile of C at a time.  NUM_THREADS (default:
+    # the PYBLAS_NUM_THREADS environment variable) threads share the tiles,
+    # or, given NUM_PROCESSES, worker processes share column panels of C held
+    # in shared memory.  Operands on disk (np.memmap) are streamed through
+    # memory in tiles held within MEMORY_BUDGET bytes (default:
+    # outofcore.DEFAULT_MEMORY_BUDGET); the bytes read are counted in
+    # outofcore.stats().
+    # With TRANSB = 'P', B is a PackedMatrix of the same precision from
+    # xGEMM_PACK whose tiles are used as they are, by threads only: memmap
+    # operands are then read tile by tile in place, not streamed.  EPILOGUE,
+    # if given, is applied to each tile of C as soon as it is computed, see
+    # epilogue.Epilogue.
+    check(EPILOGUE, M, N)
+    NCOLA = K if NOTA else M
+    NCOLB = N if NOTB else K
+    A, C = A[:NROWA, :NCOLA], C[:M, :N]
+    if PACKB:
+        gemm_packed(TRANSA, ALPHA, A, B, BETA, C, NUM_THREADS, EPILOGUE)
+        return
+    B = B[:NROWB, :NCOLB]
+    if NUM_PROCESSES is not None:
+        gemm_shared(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_PROCESSES, EPILOGUE)
+    elif any(isinstance(X, np.memmap) for X in (A, B, C)):
+        gemm_outofcore(TRANSA, TRANSB, ALPHA, A, B, BETA, C, MEMORY_BUDGET, EPILOGUE)
     else:
-        if NOTA:
-            # Form  C := alpha*A*B**T + beta*C
-            for J in range(N):
-                if BETA == 0:
-                    C[:M, J] = 0
-                elif BETA != 1:
-                    C[:M, J] *= BETA
-                for L in range(K):
-                    C[:M, J] += ALPHA * B[J, L] * A[:M, L]
-        else:
-            # Form  C := alpha*A**T*B**T + beta*C
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = ALPHA * (A[:K, I] * B[J, :K]).sum() + BETA * C[I, J]
+        gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_THREADS, EPILOGUE)
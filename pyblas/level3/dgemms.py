@@ -0,0 +1,112 @@
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .strassen import gemm_strassen
+
+
+def DGEMMS(TRANSA, TRANSB, M, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC, CUTOFF=None):
+    """Performs the matrix-matrix operation C := alpha*op(A)*op(B) + beta*C using
+    Strassen-Winograd recursion.
+
+    The arguments are those of `DGEMM`.  Recursion stops, and the blocked
+    GEMM kernel takes over, once any dimension of a subproblem is at most
+    `CUTOFF`.  The algorithm saves up to 1/8 of the flops per level but has a
+    weaker error bound than `DGEMM`; it pays off for large, roughly square
+    products.
+
+    Parameters
+    ----------
+    TRANSA : str
+        'N', 'T' or 'C', the form of op(A)
+    TRANSB : str
+        'N', 'T' or 'C', the form of op(B)
+    M : int
+        Number of rows of op(`A`) and of `C`
+    N : int
+        Number of columns of op(`B`) and of `C`
+    K : int
+        Number of columns of op(`A`) and rows of op(`B`)
+    ALPHA : numpy.double
+        Multiplier of op(`A`)*op(`B`)
+    A : numpy.ndarray
+        A double precision real array, dimension (`LDA`, K or M)
+    LDA : int
+        Leading dimension of `A`
+    B : numpy.ndarray
+        A double precision real array, dimension (`LDB`, N or K)
+    LDB : int
+        Leading dimension of `B`
+    BETA : numpy.double
+        Multiplier of `C`
+    C : numpy.ndarray
+        A double precision real array, dimension (`LDC`, N)
+    LDC : int
+        Leading dimension of `C`
+    CUTOFF : int, optional
+        Size at which recursion stops, by default `strassen.DEFAULT_CUTOFF`
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    sgemms : Single-precision real Strassen GEMM
+
+    Notes
+    -----
+    Accuracy and speed against DGEMM: benchmarks/bench_strassen.py
+    """
+    NOTA = lsame(TRANSA, "N")
+    NOTB = lsame(TRANSB, "N")
+    if NOTA:
+        NROWA = M
+    else:
+        NROWA = K
+    if NOTB:
+        NROWB = K
+    else:
+        NROWB = N
+
+    # Test the input parameters.
+    INFO = 0
+    if (not NOTA) and (not lsame(TRANSA, "C")) and (not lsame(TRANSA, "T")):
+        INFO = 1
+    elif (not NOTB) and (not lsame(TRANSB, "C")) and (not lsame(TRANSB, "T")):
+        INFO = 2
+    elif M < 0:
+        INFO = 3
+    elif N < 0:
+        INFO = 4
+    elif K < 0:
+        INFO = 5
+    elif LDA < max(1, NROWA):
+        INFO = 8
+    elif LDB < max(1, NROWB):
+        INFO = 10
+    elif LDC < max(1, M):
+        INFO = 13
+    if INFO != 0:
+        xerbla("DGEMMS", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if NOTA else M)
+    B = as_matrix(B, LDB, NROWB, N if NOTB else K)
+    C = as_matrix(C, LDC, M, N)
+
+    # Quick return if possible.
+    if (M == 0) or (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
+        return
+
+    NCOLA = K if NOTA else M
+    NCOLB = N if NOTB else K
+    gemm_strassen(
+        TRANSA,
+        TRANSB,
+        ALPHA,
+        A[:NROWA, :NCOLA],
+        B[:NROWB, :NCOLB],
+        BETA,
+        C[:M, :N],
+        CUTOFF,
+    )
@@ -0,0 +1,96 @@
+"""Fused GEMM epilogues.
+
+Adding a bias and applying an activation after ``xGEMM`` costs one or more
+extra passes over the whole of ``C``.  An `Epilogue` passed to the GEMM
+engine is instead applied to each tile of ``C`` right after the tile is
+computed, while it is still in cache.  The tile is updated in place as
+
+    C := act(COL_SCALE * C + ROW_BIAS + COL_BIAS)
+
+where ``C`` already holds ``ALPHA*op(A)*op(B) + BETA*C``, ``COL_SCALE`` and
+``COL_BIAS`` hold one value per column, ``ROW_BIAS`` one value per row, and
+``act`` is one of `ACTIVATIONS`.  Every part is optional.
+
+Any callable ``f(CT, I0, I1, J0, J1)`` updating the tile ``CT`` of ``C``
+in place can be used as an epilogue.  `Epilogue` instances can also be sent
+to worker processes.  The GEMM routines `check` their vectors against the
+shape of ``C`` before the first tile is computed.
+"""
+
+import numpy as np
+
+ACTIVATIONS = (None, "relu", "tanh", "clip")
+
+
+class Epilogue(object):
+    """Elementwise update applied to each tile of ``C``, see the module docstring.
+
+    Parameters
+    ----------
+    ROW_BIAS : array_like, optional
+        Length ``M``, added to every column of `C`
+    COL_BIAS : array_like, optional
+        Length ``N``, added to every row of `C`
+    COL_SCALE : array_like, optional
+        Length ``N``, multiplies the columns of `C` before the biases are added
+    ACTIVATION : str, optional
+        ``'relu'``, ``'tanh'`` or ``'clip'``, applied last
+    CLIP : tuple, optional
+        ``(LOW, HIGH)`` bounds for ``ACTIVATION = 'clip'``, either may be None
+    """
+
+    def __init__(
+        self, ROW_BIAS=None, COL_BIAS=None, COL_SCALE=None, ACTIVATION=None, CLIP=None
+    ):
+        if ACTIVATION not in ACTIVATIONS:
+            raise ValueError("unknown activation %r" % (ACTIVATION,))
+        if ACTIVATION == "clip" and CLIP is None:
+            raise ValueError("ACTIVATION 'clip' needs CLIP bounds")
+        self.ROW_BIAS = _vector(ROW_BIAS)
+        self.COL_BIAS = _vector(COL_BIAS)
+        self.COL_SCALE = _vector(COL_SCALE)
+        self.ACTIVATION = ACTIVATION
+        self.CLIP = CLIP
+
+    def check(self, M, N):
+        """Raises ValueError unless the vectors fit an ``M x N`` matrix `C`."""
+        for NAME, X, LENGTH, WHAT in (
+            ("ROW_BIAS", self.ROW_BIAS, M, "rows"),
+            ("COL_BIAS", self.COL_BIAS, N, "columns"),
+            ("COL_SCALE", self.COL_SCALE, N, "columns"),
+        ):
+            if X is not None and X.shape[0] != LENGTH:
+                raise ValueError(
+                    "%s has %d elements but C has %d %s"
+                    % (NAME, X.shape[0], LENGTH, WHAT)
+                )
+
+    def __call__(self, CT, I0, I1, J0, J1):
+        if self.COL_SCALE is not None:
+            CT *= self.COL_SCALE[J0:J1]
+        if self.ROW_BIAS is not None:
+            CT += self.ROW_BIAS[I0:I1, None]
+        if self.COL_BIAS is not None:
+            CT += self.COL_BIAS[J0:J1]
+        if self.ACTIVATION == "relu":
+            np.maximum(CT, 0, out=CT)
+        elif self.ACTIVATION == "tanh":
+            np.tanh(CT, out=CT)
+        elif self.ACTIVATION == "clip":
+            LOW, HIGH = self.CLIP
+            np.clip(CT, LOW, HIGH, out=CT)
+
+
+def _vector(X):
+    if X is None:
+        return None
+    return np.asarray(X).ravel()
+
+
+def check(EPILOGUE, M, N):
+    """Checks `EPILOGUE` against an ``M x N`` matrix `C` if it is an `Epilogue`.
+
+    Other callables are taken as they are.
+    """
+    if isinstance(EPILOGUE, Epilogue):
+        EPILOGUE.check(M, N)
@@ -0,0 +1,255 @@
+"""Batched GEMM for large numbers of small matrices.
+
+Calling ``DGEMM`` once per pair of small matrices is dominated by the cost
+of the call and of checking its arguments.  The routines here check the
+arguments of the whole batch once and compute
+
+    C[p] := alpha[p]*op(A[p])*op(B[p]) + beta[p]*C[p],   p = 0, ..., BATCH_COUNT - 1
+
+with one vectorized ``numpy.matmul`` per chunk of the batch.  Chunks are
+sized so that the stack of products held at once stays around `CHUNK_BYTES`.
+As in xGEMM, `A[p]` and `B[p]` are not read when ``alpha[p]`` is zero.
+
+Two layouts are supported:
+
+* strided: `A`, `B` and `C` are 3-D arrays holding the matrices one after
+  the other along the first axis (``xgemm_strided_batched``);
+* pointer-list: `A`, `B` and `C` are sequences of 2-D arrays
+  (``xgemm_batched``).
+
+`ALPHA` and `BETA` are either scalars shared by the whole batch or
+sequences holding one value per matrix.
+"""
+
+import numpy as np
+
+from ..util import lsame
+from ..xerbla import xerbla
+
+# Approximate upper bound on the bytes of products formed in a single pass.
+CHUNK_BYTES = 32 * 2**20
+
+
+def _op(X, TRANS):
+    # op() applied to every matrix of the stack X.
+    if lsame(TRANS, "N"):
+        return X
+    X = X.swapaxes(-1, -2)
+    if lsame(TRANS, "C") and np.iscomplexobj(X):
+        return X.conj()
+    return X
+
+
+def _per_batch(X, P0, P1):
+    # The values of ALPHA or BETA for matrices P0:P1, shaped to broadcast.
+    if np.ndim(X) == 0:
+        return X
+    return np.asarray(X)[P0:P1, None, None]
+
+
+def _too_small(X, SHAPE):
+    # Whether any matrix of the batch X has fewer rows or columns than SHAPE,
+    # or is not a matrix.  A 3-D stack is checked at once, a list entry by
+    # entry.
+    if isinstance(X, np.ndarray) and X.ndim == 3:
+        return X.shape[1] < SHAPE[0] or X.shape[2] < SHAPE[1]
+    for Y in X:
+        if np.ndim(Y) != 2 or Y.shape[0] < SHAPE[0] or Y.shape[1] < SHAPE[1]:
+            return True
+    return False
+
+
+def _check(SRNAME, TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    # Returns the BATCH_COUNT after testing the arguments, or None on error.
+    NOTA = lsame(TRANSA, "N")
+    NOTB = lsame(TRANSB, "N")
+    SHAPEA = (M, K) if NOTA else (K, M)
+    SHAPEB = (K, N) if NOTB else (N, K)
+    BATCH_COUNT = len(C)
+    INFO = 0
+    if (not NOTA) and (not lsame(TRANSA, "C")) and (not lsame(TRANSA, "T")):
+        INFO = 1
+    elif (not NOTB) and (not lsame(TRANSB, "C")) and (not lsame(TRANSB, "T")):
+        INFO = 2
+    elif M < 0:
+        INFO = 3
+    elif N < 0:
+        INFO = 4
+    elif K < 0:
+        INFO = 5
+    elif np.ndim(ALPHA) != 0 and len(ALPHA) != BATCH_COUNT:
+        INFO = 6
+    elif len(A) != BATCH_COUNT or _too_small(A, SHAPEA):
+        INFO = 7
+    elif len(B) != BATCH_COUNT or _too_small(B, SHAPEB):
+        INFO = 8
+    elif np.ndim(BETA) != 0 and len(BETA) != BATCH_COUNT:
+        INFO = 9
+    elif _too_small(C, (M, N)):
+        INFO = 10
+    if INFO != 0:
+        xerbla(SRNAME, INFO)
+        return None
+    return BATCH_COUNT
+
+
+def _chunks(BATCH_COUNT, M, N, ITEMSIZE):
+    STEP = max(1, CHUNK_BYTES // max(1, M * N * ITEMSIZE))
+    for P0 in range(0, BATCH_COUNT, STEP):
+        yield P0, min(P0 + STEP, BATCH_COUNT)
+
+
+def _scale(BETA, C):
+    # Forms C := BETA*C, a BETA of zero clearing C as in xGEMM.
+    if np.ndim(BETA) == 0:
+        if BETA == 0:
+            C[...] = 0
+        elif BETA != 1:
+            C *= BETA
+    else:
+        C *= BETA
+        C[np.broadcast_to(BETA == 0, C.shape)] = 0
+
+
+def _multiplied(ALPHA, P0, P1):
+    # The positions within P0:P1 of the matrices whose ALPHA is not zero, as
+    # a slice when that is all of them and None when there are none.  The
+    # others only have C scaled, and their A and B are not read, as in xGEMM.
+    if np.ndim(ALPHA) == 0:
+        return slice(None) if ALPHA != 0 else None
+    KEEP = np.asarray(ALPHA)[P0:P1] != 0
+    if KEEP.all():
+        return slice(None)
+    return np.flatnonzero(KEEP) if KEEP.any() else None
+
+
+def _add(ALPHA, P, C, USE):
+    # Forms C[USE] := C[USE] + ALPHA[USE]*P, with P overwritten.
+    if np.ndim(ALPHA) != 0:
+        P *= ALPHA[USE]
+    elif ALPHA != 1:
+        P *= ALPHA
+    if isinstance(USE, slice):
+        C += P
+    else:
+        C[USE] += P
+
+
+def gemm_strided_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, SRNAME):
+    """Forms ``C[p] := ALPHA[p]*op(A[p])*op(B[p]) + BETA[p]*C[p]`` for 3-D stacks.
+
+    Parameters
+    ----------
+    TRANSA : str
+        'N', 'T' or 'C', the form of op(A[p])
+    TRANSB : str
+        'N', 'T' or 'C', the form of op(B[p])
+    M : int
+        Number of rows of op(`A[p]`) and of `C[p]`
+    N : int
+        Number of columns of op(`B[p]`) and of `C[p]`
+    K : int
+        Number of columns of op(`A[p]`) and rows of op(`B[p]`)
+    ALPHA : scalar or sequence
+        Multiplier of op(`A[p]`)*op(`B[p]`), shared or one per matrix
+    A : numpy.ndarray
+        Array of shape (BATCH_COUNT, NROWA, NCOLA)
+    B : numpy.ndarray
+        Array of shape (BATCH_COUNT, NROWB, NCOLB)
+    BETA : scalar or sequence
+        Multiplier of `C[p]`, shared or one per matrix
+    C : numpy.ndarray
+        Array of shape (BATCH_COUNT, M, N), overwritten with the results
+    SRNAME : str
+        Name of the calling routine, for error reports
+
+    Returns
+    -------
+    None
+    """
+    BATCH_COUNT = _check(SRNAME, TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C)
+    if BATCH_COUNT is None or BATCH_COUNT == 0 or M == 0 or N == 0:
+        return
+    NROWA, NCOLA = (M, K) if lsame(TRANSA, "N") else (K, M)
+    NROWB, NCOLB = (K, N) if lsame(TRANSB, "N") else (N, K)
+    for P0, P1 in _chunks(BATCH_COUNT, M, N, C.itemsize):
+        CP = C[P0:P1, :M, :N]
+        _scale(_per_batch(BETA, P0, P1), CP)
+        USE = _multiplied(ALPHA, P0, P1)
+        if USE is not None:
+            AP = _op(A[P0:P1, :NROWA, :NCOLA][USE], TRANSA)
+            BP = _op(B[P0:P1, :NROWB, :NCOLB][USE], TRANSB)
+            _add(_per_batch(ALPHA, P0, P1), np.matmul(AP, BP), CP, USE)
+
+
+def gemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, SRNAME):
+    """Forms ``C[p] := ALPHA[p]*op(A[p])*op(B[p]) + BETA[p]*C[p]`` for lists.
+
+    The arguments are those of `gemm_strided_batched`, except that `A`, `B`
+    and `C` are sequences of 2-D arrays.  Each chunk of the batch is gathered
+    into a contiguous stack, multiplied in one pass and scattered back.
+    """
+    BATCH_COUNT = _check(SRNAME, TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C)
+    if BATCH_COUNT is None or BATCH_COUNT == 0 or M == 0 or N == 0:
+        return
+    NROWA, NCOLA = (M, K) if lsame(TRANSA, "N") else (K, M)
+    NROWB, NCOLB = (K, N) if lsame(TRANSB, "N") else (N, K)
+    for P0, P1 in _chunks(BATCH_COUNT, M, N, C[0].itemsize):
+        CP = np.stack([X[:M, :N] for X in C[P0:P1]])
+        _scale(_per_batch(BETA, P0, P1), CP)
+        USE = _multiplied(ALPHA, P0, P1)
+        if USE is not None:
+            INDICES = np.arange(P0, P1)[USE]
+            AP = _op(np.stack([A[P][:NROWA, :NCOLA] for P in INDICES]), TRANSA)
+            BP = _op(np.stack([B[P][:NROWB, :NCOLB] for P in INDICES]), TRANSB)
+            _add(_per_batch(ALPHA, P0, P1), np.matmul(AP, BP), CP, USE)
+        for X, Y in zip(C[P0:P1], CP):
+            X[:M, :N] = Y
+
+
+def sgemm_strided_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Single-precision real `gemm_strided_batched`."""
+    gemm_strided_batched(
+        TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "SGEMM_STRIDED_BATCHED"
+    )
+
+
+def dgemm_strided_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Double-precision real `gemm_strided_batched`."""
+    gemm_strided_batched(
+        TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "DGEMM_STRIDED_BATCHED"
+    )
+
+
+def cgemm_strided_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Single-precision complex `gemm_strided_batched`."""
+    gemm_strided_batched(
+        TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "CGEMM_STRIDED_BATCHED"
+    )
+
+
+def zgemm_strided_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Double-precision complex `gemm_strided_batched`."""
+    gemm_strided_batched(
+        TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "ZGEMM_STRIDED_BATCHED"
+    )
+
+
+def sgemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Single-precision real `gemm_batched`."""
+    gemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "SGEMM_BATCHED")
+
+
+def dgemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Double-precision real `gemm_batched`."""
+    gemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "DGEMM_BATCHED")
+
+
+def cgemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Single-precision complex `gemm_batched`."""
+    gemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "CGEMM_BATCHED")
+
+
+def zgemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C):
+    """Double-precision complex `gemm_batched`."""
+    gemm_batched(TRANSA, TRANSB, M, N, K, ALPHA, A, B, BETA, C, "ZGEMM_BATCHED")
@@ -0,0 +1,219 @@
+"""Out-of-core GEMM for operands that live on disk as `numpy.memmap` files.
+
+Indexing a memmap element by element, or in the wrong order, makes the
+operating system page the file in and out over and over.  `gemm_outofcore`
+instead walks the tiles of ``C`` in the order ``C`` is stored, reads each
+tile of ``A`` and ``B`` with a single copy that follows the operand's own
+storage order, and has a background thread read the next pair of tiles while
+the current pair is multiplied.  Tile sizes are chosen so the tiles held in
+memory never exceed a fixed budget.  `stats` reports the bytes read so far,
+whether `gemm_outofcore` was called directly or through xGEMM.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..util import lsame
+from .blocked import scale, storage_order, tiles
+
+# Default number of bytes of tiles held in memory at any one time.
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+
+_STATS_LOCK = threading.Lock()
+_STATS = {"calls": 0, "bytes_read": 0}
+
+
+def tile_size(MEMORY_BUDGET, ITEMSIZE):
+    """Returns the edge length of square tiles that fit in `MEMORY_BUDGET` bytes.
+
+    At any one time memory holds the accumulator of a tile of ``C``, a
+    scratch tile taking each partial product and then the tile of ``C``
+    itself, and two tiles each of ``A`` and ``B`` (the pair being multiplied
+    and the pair being prefetched): six tiles in all.  Conjugation and the
+    products are done in place in these, so nothing else of tile size is
+    allocated.
+    """
+    return max(1, int((MEMORY_BUDGET / (6 * ITEMSIZE)) ** 0.5))
+
+
+def read_tile(X):
+    """Copies the memmap region `X` into memory, in the order it is stored.
+
+    Returns the copy and the number of bytes read.
+    """
+    T = np.asarray(X).copy(order="K")
+    return T, T.nbytes
+
+
+def gemm_outofcore(
+    TRANSA, TRANSB, ALPHA, A, B, BETA, C, MEMORY_BUDGET=None, EPILOGUE=None
+):
+    """Forms ``C := ALPHA*op(A)*op(B) + BETA*C`` streaming tiles from disk.
+
+    Parameters
+    ----------
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    TRANSB : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(B)``
+    ALPHA : scalar
+        Multiplier of ``op(A)*op(B)``
+    A : numpy.ndarray
+        The stored matrix `A`, exactly ``NROWA x NCOLA``, typically a memmap
+    B : numpy.ndarray
+        The stored matrix `B`, exactly ``NROWB x NCOLB``, typically a memmap
+    BETA : scalar
+        Multiplier of `C`
+    C : numpy.ndarray
+        The ``M x N`` matrix `C`, overwritten with the result
+    MEMORY_BUDGET : int, optional
+        Upper bound in bytes on the tiles held in memory, by default
+        `DEFAULT_MEMORY_BUDGET`
+    EPILOGUE : callable, optional
+        Applied to each finished tile of `C` before it is written back, as in
+        `blocked.gemm`
+
+    Returns
+    -------
+    int
+        Number of bytes read from `A`, `B` and `C`, which is also added to
+        the ``bytes_read`` of `stats`
+    """
+    BYTES_READ = _gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, MEMORY_BUDGET, EPILOGUE)
+    with _STATS_LOCK:
+        _STATS["calls"] += 1
+        _STATS["bytes_read"] += BYTES_READ
+    return BYTES_READ
+
+
+def stats():
+    """Returns the number of ``calls`` of `gemm_outofcore` so far and the
+    ``bytes_read`` by all of them."""
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
+def reset_stats():
+    """Sets the call and byte counts back to zero."""
+    with _STATS_LOCK:
+        for NAME in _STATS:
+            _STATS[NAME] = 0
+
+
+def _gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, MEMORY_BUDGET, EPILOGUE):
+    # The body of gemm_outofcore, returning the number of bytes read.
+    if MEMORY_BUDGET is None:
+        MEMORY_BUDGET = DEFAULT_MEMORY_BUDGET
+    M, N = C.shape
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    if M == 0 or N == 0:
+        return 0
+    if ALPHA == 0 or K == 0:
+        BYTES_READ = 0
+        for I0, I1, J0, J1 in _c_tiles(C, tile_size(MEMORY_BUDGET, C.itemsize)):
+            if BETA == 0 and EPILOGUE is None:
+                C[I0:I1, J0:J1] = 0
+            elif BETA != 1 or EPILOGUE is not None:
+                CT, NBYTES = read_tile(C[I0:I1, J0:J1])
+                BYTES_READ += NBYTES
+                scale(BETA, CT)
+                if EPILOGUE is not None:
+                    EPILOGUE(CT, I0, I1, J0, J1)
+                C[I0:I1, J0:J1] = CT
+        return BYTES_READ
+
+    ITEMSIZE = max(A.itemsize, B.itemsize, C.itemsize)
+    T = tile_size(MEMORY_BUDGET, ITEMSIZE)
+    STEPS = [
+        (I0, I1, J0, J1, L0, L1)
+        for I0, I1, J0, J1 in _c_tiles(C, T)
+        for L0, L1 in tiles(K, T)
+    ]
+
+    def load(STEP):
+        I0, I1, J0, J1, L0, L1 = STEP
+        AT, A_BYTES = read_tile(_stored(A, TRANSA, I0, I1, L0, L1))
+        BT, B_BYTES = read_tile(_stored(B, TRANSB, L0, L1, J0, J1))
+        return AT, BT, A_BYTES + B_BYTES
+
+    # The sum over the inner dimension goes to ACC and each partial product
+    # to P, which then also takes the tile of C.  Both are laid out like C
+    # and allocated once, at the full tile size.
+    ORDER = storage_order(C)
+    DTYPE = np.result_type(A, B, C)
+    SIZE = min(T, M) * min(T, N)
+    ACC_BUFFER, P_BUFFER = np.empty(SIZE, DTYPE), np.empty(SIZE, DTYPE)
+
+    BYTES_READ = 0
+    with ThreadPoolExecutor(1, thread_name_prefix="pyblas-prefetch") as PREFETCH:
+        NEXT = PREFETCH.submit(load, STEPS[0])
+        for S, (I0, I1, J0, J1, L0, L1) in enumerate(STEPS):
+            AT, BT, NBYTES = NEXT.result()
+            BYTES_READ += NBYTES
+            if S + 1 < len(STEPS):
+                NEXT = PREFETCH.submit(load, STEPS[S + 1])
+            SHAPE = (I1 - I0, J1 - J0)
+            ACC = _tile(ACC_BUFFER, SHAPE, ORDER)
+            P = _tile(P_BUFFER, SHAPE, ORDER)
+            if L0 == 0:
+                _product(_op(AT, TRANSA), _op(BT, TRANSB), ACC)
+            else:
+                _product(_op(AT, TRANSA), _op(BT, TRANSB), P)
+                ACC += P
+            del AT, BT
+            if L1 == K:
+                if ALPHA != 1:
+                    ACC *= ALPHA
+                if BETA == 0:
+                    CT = ACC
+                else:
+                    CT = P
+                    CT[...] = C[I0:I1, J0:J1]
+                    BYTES_READ += CT.nbytes
+                    scale(BETA, CT)
+                    CT += ACC
+                if EPILOGUE is not None:
+                    EPILOGUE(CT, I0, I1, J0, J1)
+                C[I0:I1, J0:J1] = CT
+    return BYTES_READ
+
+
+def _tile(BUFFER, SHAPE, ORDER):
+    # A SHAPE view of the start of the flat BUFFER, laid out in ORDER.
+    return BUFFER[: SHAPE[0] * SHAPE[1]].reshape(SHAPE, order=ORDER)
+
+
+def _product(X, Y, OUT):
+    # Forms X*Y in OUT, handing numpy a row-major output either way so that
+    # it can use its optimized GEMM.
+    if storage_order(OUT) == "C":
+        np.matmul(X, Y, out=OUT)
+    else:
+        np.matmul(Y.T, X.T, out=OUT.T)
+
+
+def _c_tiles(C, T):
+    # Walk the tiles of C in the order C is stored, so writes are sequential.
+    M, N = C.shape
+    if C.strides[1] > C.strides[0]:
+        return [(I0, I1, J0, J1) for J0, J1 in tiles(N, T) for I0, I1 in tiles(M, T)]
+    return [(I0, I1, J0, J1) for I0, I1 in tiles(M, T) for J0, J1 in tiles(N, T)]
+
+
+def _stored(X, TRANS, I0, I1, J0, J1):
+    # The region of the stored X holding the [I0:I1, J0:J1] tile of op(X).
+    if lsame(TRANS, "N"):
+        return X[I0:I1, J0:J1]
+    return X[J0:J1, I0:I1]
+
+
+def _op(T, TRANS):
+    # op(X) of a tile read from the region given by _stored.  The tile is a
+    # private copy, so it is conjugated in place rather than copied again.
+    if lsame(TRANS, "N"):
+        return T
+    if lsame(TRANS, "C") and np.iscomplexobj(T):
+        np.conjugate(T, out=T)
+    return T.T
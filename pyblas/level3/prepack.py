@@ -0,0 +1,190 @@
+"""Prepacked ``B`` operands for repeated GEMMs with the same matrix.
+
+When the same ``B`` is multiplied by many different ``A``, every call to
+``xGEMM`` repeats the same layout work on it: slicing out its tiles,
+transposing or conjugating them, and handing numpy strided views.
+`dgemm_pack` and `sgemm_pack` do that work once.  They copy ``op(B)`` into
+contiguous ``KB x NB`` tiles and return a `PackedMatrix`, which ``DGEMM`` and
+``SGEMM`` accept as their `B` argument with ``TRANSB = 'P'``, provided it was
+packed in their own precision.
+
+A handle keeps the tile sizes it was packed with, so it stays valid if
+`blocked.KB` or `blocked.NB` change afterwards.
+"""
+
+import numpy as np
+
+from .. import workspace
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from . import blocked
+
+
+class PackedMatrix(object):
+    """``op(B)`` stored as contiguous tiles, column panel by column panel.
+
+    Attributes
+    ----------
+    shape : tuple
+        ``(K, N)``, the shape of ``op(B)``
+    dtype : numpy.dtype
+        Data type of the tiles
+    kb : int
+        Rows of a tile, the inner dimension of the products
+    nb : int
+        Columns of a tile
+    panels : list
+        For every block of `nb` columns ``(J0, J1, TILES)``, with `TILES` a
+        list of ``(L0, L1, TILE)`` covering the `K` rows in order
+    """
+
+    __slots__ = ("shape", "dtype", "kb", "nb", "panels")
+
+    def __init__(self, shape, dtype, kb, nb, panels):
+        self.shape = shape
+        self.dtype = dtype
+        self.kb = kb
+        self.nb = nb
+        self.panels = panels
+
+    @property
+    def nbytes(self):
+        return sum(T.nbytes for _, _, TILES in self.panels for _, _, T in TILES)
+
+
+def pack(TRANS, B, KB=None, NB=None):
+    """Copies ``op(B)`` into the contiguous tiles of a `PackedMatrix`.
+
+    Parameters
+    ----------
+    TRANS : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(B)``
+    B : numpy.ndarray
+        The stored matrix `B`, exactly ``NROWB x NCOLB``
+    KB : int, optional
+        Rows of a tile, by default from `blocked.block_sizes`
+    NB : int, optional
+        Columns of a tile, by default from `blocked.block_sizes`
+
+    Returns
+    -------
+    PackedMatrix
+    """
+    _, DEFAULT_NB, DEFAULT_KB = blocked.block_sizes(B.dtype)
+    if KB is None:
+        KB = DEFAULT_KB
+    if NB is None:
+        NB = DEFAULT_NB
+    K, N = B.shape if lsame(TRANS, "N") else B.shape[::-1]
+    PANELS = [
+        (
+            J0,
+            J1,
+            [
+                (
+                    L0,
+                    L1,
+                    np.ascontiguousarray(blocked.op_tile(B, TRANS, L0, L1, J0, J1)),
+                )
+                for L0, L1 in blocked.tiles(K, KB)
+            ],
+        )
+        for J0, J1 in blocked.tiles(N, NB)
+    ]
+    return PackedMatrix((K, N), B.dtype, KB, NB, PANELS)
+
+
+def gemm_packed(TRANSA, ALPHA, A, BP, BETA, C, NUM_THREADS=None, EPILOGUE=None):
+    """Forms ``C := ALPHA*op(A)*op(B) + BETA*C`` with ``op(B)`` prepacked in `BP`.
+
+    The arguments are those of `blocked.gemm`, with the `PackedMatrix` `BP`
+    taking the place of `TRANSB` and `B`.  Tiles of `C` are ``MB x BP.nb`` and
+    the inner dimension is accumulated in steps of ``BP.kb``.
+    """
+    M, N = C.shape
+    K = BP.shape[0]
+    if M == 0 or N == 0:
+        return
+    if ALPHA == 0 or K == 0:
+        blocked.scale_tiles(BETA, C, EPILOGUE, NUM_THREADS)
+        return
+
+    def f(I0, I1, J0, J1, TILES):
+        CT = C[I0:I1, J0:J1]
+        ORDER = blocked.storage_order(CT)
+        with workspace.borrow(CT.shape, np.result_type(A, BP.dtype), ORDER) as ACC:
+            blocked.accumulate(
+                (
+                    (blocked.op_tile(A, TRANSA, I0, I1, L0, L1), BT)
+                    for L0, L1, BT in TILES
+                ),
+                ALPHA,
+                ORDER,
+                ACC,
+            )
+            blocked.scale(BETA, CT)
+            CT += ACC
+        if EPILOGUE is not None:
+            EPILOGUE(CT, I0, I1, J0, J1)
+
+    blocked.run_tiles(
+        f,
+        [
+            (I0, I1, J0, J1, TILES)
+            for J0, J1, TILES in BP.panels
+            for I0, I1 in blocked.tiles(M, blocked.block_sizes(C.dtype)[0])
+        ],
+        NUM_THREADS,
+    )
+
+
+def _gemm_pack(SRNAME, TRANSB, K, N, B, LDB):
+    NOTB = lsame(TRANSB, "N")
+    NROWB = K if NOTB else N
+    INFO = 0
+    if (not NOTB) and (not lsame(TRANSB, "C")) and (not lsame(TRANSB, "T")):
+        INFO = 1
+    elif K < 0:
+        INFO = 2
+    elif N < 0:
+        INFO = 3
+    elif LDB < max(1, NROWB):
+        INFO = 5
+    if INFO != 0:
+        xerbla(SRNAME, INFO)
+        return None
+    NCOLB = N if NOTB else K
+    B = as_matrix(B, LDB, NROWB, NCOLB)
+    return pack(TRANSB, B[:NROWB, :NCOLB])
+
+
+def sgemm_pack(TRANSB, K, N, B, LDB):
+    """Packs ``op(B)`` for use as the `B` argument of ``SGEMM`` with ``TRANSB = 'P'``.
+
+    Parameters
+    ----------
+    TRANSB : str
+        'N', 'T' or 'C', the form of op(B)
+    K : int
+        Number of rows of op(`B`)
+    N : int
+        Number of columns of op(`B`)
+    B : numpy.ndarray
+        A single precision real array, dimension (`LDB`, N or K)
+    LDB : int
+        Leading dimension of `B`
+
+    Returns
+    -------
+    PackedMatrix
+    """
+    return _gemm_pack("SGEMM_PACK", TRANSB, K, N, B, LDB)
+
+
+def dgemm_pack(TRANSB, K, N, B, LDB):
+    """Packs ``op(B)`` for use as the `B` argument of ``DGEMM`` with ``TRANSB = 'P'``.
+
+    The arguments are those of `sgemm_pack`, with `B` a double precision
+    real array.
+    """
+    return _gemm_pack("DGEMM_PACK", TRANSB, K, N, B, LDB)
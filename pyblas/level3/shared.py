@@ -0,0 +1,184 @@
+"""Process-parallel GEMM over operands held in shared memory.
+
+Threads stop scaling once the interpreter itself becomes the bottleneck.
+`gemm_shared` instead copies ``A``, ``B`` and ``C`` once into
+`multiprocessing.shared_memory` segments and has a pool of worker processes
+compute column panels of ``C`` in place.  Only the segment names, shapes and
+panel bounds are sent to the workers, never the operands themselves.
+
+`multiprocessing.shared_memory` requires Python 3.8 or later; on older
+versions `gemm_shared` raises `RuntimeError` rather than fall back silently.
+"""
+
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+from ..util import lsame
+from . import blocked
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def process_pool(NUM_PROCESSES):
+    """Returns the persistent pool of `NUM_PROCESSES` workers.
+
+    The pool is created on first use.
+    """
+    with _POOLS_LOCK:
+        if NUM_PROCESSES not in _POOLS:
+            _POOLS[NUM_PROCESSES] = ProcessPoolExecutor(NUM_PROCESSES)
+        return _POOLS[NUM_PROCESSES]
+
+
+def _discard_pool(NUM_PROCESSES):
+    with _POOLS_LOCK:
+        POOL = _POOLS.pop(NUM_PROCESSES, None)
+    if POOL is not None:
+        POOL.shutdown(wait=False)
+
+
+def _attach(SPEC):
+    NAME, SHAPE, DTYPE, ORDER = SPEC
+    SHM = shared_memory.SharedMemory(name=NAME)
+    return SHM, np.ndarray(SHAPE, dtype=DTYPE, buffer=SHM.buf, order=ORDER)
+
+
+def _release(SEGMENTS):
+    for SHM in SEGMENTS:
+        try:
+            SHM.close()
+        except BufferError:
+            # A traceback still holds a view; the mapping goes with it.
+            pass
+
+
+def _gemm_panel(TRANSA, TRANSB, ALPHA, A_SPEC, B_SPEC, BETA, C_SPEC, J0, J1, EPILOGUE):
+    SEGMENTS, VIEWS = [], []
+    try:
+        for SPEC in (A_SPEC, B_SPEC, C_SPEC):
+            SHM, X = _attach(SPEC)
+            SEGMENTS.append(SHM)
+            VIEWS.append(X)
+        del X
+        A, B, C = VIEWS
+        for I0, I1 in blocked.tiles(C.shape[0], blocked.block_sizes(C.dtype)[0]):
+            blocked.gemm_tile(
+                TRANSA, TRANSB, ALPHA, A, B, BETA, C, I0, I1, J0, J1, EPILOGUE
+            )
+    except BaseException as e:
+        traceback.clear_frames(e.__traceback__)
+        raise
+    finally:
+        A = B = C = None
+        del VIEWS[:]
+        _release(SEGMENTS)
+
+
+def gemm_shared(
+    TRANSA, TRANSB, ALPHA, A, B, BETA, C, NUM_PROCESSES=None, EPILOGUE=None
+):
+    """Forms ``C := ALPHA*op(A)*op(B) + BETA*C`` on a pool of worker processes.
+
+    Each worker computes whole ``M x NB`` column panels of `C` with the same
+    tile kernel as `blocked.gemm`, so for contiguous operands the result is
+    bit-for-bit the one the serial engine produces.  The shared segments are
+    released when the call returns, including when a worker raises or dies.
+
+    Parameters
+    ----------
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    TRANSB : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(B)``
+    ALPHA : scalar
+        Multiplier of ``op(A)*op(B)``
+    A : numpy.ndarray
+        The stored matrix `A`, exactly ``NROWA x NCOLA``
+    B : numpy.ndarray
+        The stored matrix `B`, exactly ``NROWB x NCOLB``
+    BETA : scalar
+        Multiplier of `C`
+    C : numpy.ndarray
+        The ``M x N`` matrix `C`, overwritten with the result
+    NUM_PROCESSES : int, optional
+        Number of worker processes, see `blocked.num_threads`
+    EPILOGUE : callable, optional
+        Applied to each finished tile of `C` as in `blocked.gemm`; it is sent
+        to the workers, so it must be picklable
+
+    Returns
+    -------
+    None
+    """
+    M, N = C.shape
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    NUM_PROCESSES = blocked.num_threads(NUM_PROCESSES)
+    if M == 0 or N == 0 or ALPHA == 0 or K == 0 or NUM_PROCESSES == 1:
+        blocked.gemm(TRANSA, TRANSB, ALPHA, A, B, BETA, C, 1, EPILOGUE)
+        return
+    if shared_memory is None:
+        raise RuntimeError(
+            "NUM_PROCESSES needs multiprocessing.shared_memory, "
+            "which requires Python 3.8 or later"
+        )
+
+    SEGMENTS, VIEWS, SPECS = [], [], []
+    try:
+        for X in (A, B, C):
+            SHM = shared_memory.SharedMemory(create=True, size=max(1, X.nbytes))
+            SEGMENTS.append(SHM)
+            # Keep each operand's memory order so the tile products match
+            # the ones the serial engine computes.
+            ORDER = "C" if X.flags.c_contiguous else "F"
+            VIEWS.append(
+                np.ndarray(X.shape, dtype=X.dtype, buffer=SHM.buf, order=ORDER)
+            )
+            VIEWS[-1][...] = X
+            SPECS.append((SHM.name, X.shape, X.dtype.str, ORDER))
+
+        FUTURES = []
+        try:
+            POOL = process_pool(NUM_PROCESSES)
+            for J0, J1 in blocked.tiles(N, blocked.block_sizes(C.dtype)[1]):
+                FUTURES.append(
+                    POOL.submit(
+                        _gemm_panel,
+                        TRANSA,
+                        TRANSB,
+                        ALPHA,
+                        *SPECS[:2],
+                        BETA,
+                        SPECS[2],
+                        J0,
+                        J1,
+                        EPILOGUE
+                    )
+                )
+            for FUTURE in FUTURES:
+                FUTURE.result()
+        except BrokenProcessPool:
+            _discard_pool(NUM_PROCESSES)
+            raise
+        finally:
+            # Never unlink a segment while a worker may still be using it.
+            for FUTURE in FUTURES:
+                FUTURE.cancel()
+            for FUTURE in FUTURES:
+                if not FUTURE.cancelled():
+                    FUTURE.exception()
+        C[...] = VIEWS[2]
+    finally:
+        del VIEWS[:]
+        for SHM in SEGMENTS:
+            SHM.close()
+            SHM.unlink()
@@ -167,8 +167,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import syrk
 
 
 def SSYRK(UPLO, TRANS, N, K, ALPHA, A, LDA, BETA, C, LDC):
@@ -233,75 +234,16 @@ def SSYRK(UPLO, TRANS, N, K, ALPHA, A, LDA, BETA, C, LDC):
         INFO = 10
     if INFO != 0:
         xerbla("SSYRK ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if lsame(TRANS, "N") else N)
+    C = as_matrix(C, LDC, N, N)
 
     # Quick return if possible.
     if (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        if UPPER:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] *= BETA
-        else:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] *= BETA
-        return
-
-    # Start the operations.
-    if lsame(TRANS, "N"):
-        # Form  C := alpha*A*A**T + beta*C.
-        if UPPER:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    if A[J, L] != 0:
-                        TEMP = ALPHA * A[J, L]
-                        for I in range(J):
-                            C[I, J] += TEMP * A[I, L]
-        else:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J - 1, N):
-                        C[I, J] *= BETA
-                for L in range(K):
-                    if A[J, L] != 0:
-                        TEMP = ALPHA * A[J, L]
-                        for I in range(J - 1, N):
-                            C[I, J] += TEMP * A[I, L]
-    else:
-        # Form  C := alpha*A**T*A + beta*C.
-        if UPPER:
-            for J in range(N):
-                for I in range(J):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I] * A[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
-        else:
-            for J in range(N):
-                for I in range(J - 1, N):
-                    C[I, J] = ALPHA * (A[:K, I] * A[:K, J]).sum() + BETA * C[I, J]
+    # Start the operations, computing only the tiles of the UPLO triangle.
+    NCOLA = K if lsame(TRANS, "N") else N
+    syrk(UPLO, TRANS, ALPHA, A[:NROWA, :NCOLA], BETA, C[:N, :N])
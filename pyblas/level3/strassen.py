@@ -0,0 +1,193 @@
+"""Strassen-Winograd matrix multiplication.
+
+Winograd's variant of Strassen's algorithm forms the product of two matrices
+split into 2 x 2 blocks with 7 block products and 15 block additions instead
+of 8 products.  Applied recursively down to `CUTOFF`, below which the blocked
+GEMM kernel takes over, it reduces the flop count of large products by up to
+``(7/8)**levels``.  The price is a somewhat weaker error bound than the
+classical algorithm, see ``benchmarks/bench_strassen.py``.
+
+All intermediate sums and products live in a workspace borrowed once per
+call from the `pyblas.workspace` pool: each recursion level owns one buffer
+for sums of ``A`` blocks and one for sums of ``B`` blocks, and the block
+products are written straight into the quadrants of ``C``, using the schedule
+of Boyer, Dumas, Pernet and Zhou, "Memory efficient scheduling of
+Strassen-Winograd's matrix multiplication algorithm" (2009).  Odd dimensions
+are handled by peeling off the last row, column or inner index and adding
+their contribution with the blocked kernel.
+"""
+
+from contextlib import ExitStack
+
+import numpy as np
+
+from ..util import lsame
+from ..workspace import borrow
+from .blocked import gemm, op_tile, scale
+
+# Below this size in any dimension products are handed to the blocked kernel.
+DEFAULT_CUTOFF = 1024
+
+
+def workspace(M, N, K, CUTOFF, DTYPE, STACK=None):
+    """Allocates the ``(X, Y)`` buffers used by each recursion level of `strassen`.
+
+    Given the `contextlib.ExitStack` `STACK`, the buffers are borrowed from
+    the `pyblas.workspace` pool until `STACK` is closed.
+    """
+
+    def empty(SIZE):
+        if STACK is None:
+            return np.empty(SIZE, DTYPE)
+        return STACK.enter_context(borrow((SIZE,), DTYPE))
+
+    WORK = []
+    while min(M, N, K) > CUTOFF:
+        M, N, K = M // 2, N // 2, K // 2
+        WORK.append((empty(M * max(K, N)), empty(K * N)))
+    return WORK
+
+
+def _view(BUF, M, N):
+    return BUF[: M * N].reshape(M, N)
+
+
+def strassen(A, B, C, WORK, LEVEL=0):
+    """Forms ``C := A*B`` by Strassen-Winograd recursion.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        ``M x K`` matrix
+    B : numpy.ndarray
+        ``K x N`` matrix
+    C : numpy.ndarray
+        ``M x N`` matrix, overwritten with the product
+    WORK : list
+        Buffers from `workspace`, one pair per recursion level
+    LEVEL : int
+        Recursion depth of this call
+
+    Returns
+    -------
+    None
+    """
+    M, K = A.shape
+    N = B.shape[1]
+    if LEVEL == len(WORK):
+        gemm("N", "N", 1, A, B, 0, C)
+        return
+
+    M2, N2, K2 = M // 2, N // 2, K // 2
+    A11, A12, A21, A22 = (
+        A[:M2, :K2],
+        A[:M2, K2 : 2 * K2],
+        A[M2 : 2 * M2, :K2],
+        A[M2 : 2 * M2, K2 : 2 * K2],
+    )
+    B11, B12, B21, B22 = (
+        B[:K2, :N2],
+        B[:K2, N2 : 2 * N2],
+        B[K2 : 2 * K2, :N2],
+        B[K2 : 2 * K2, N2 : 2 * N2],
+    )
+    C11, C12, C21, C22 = (
+        C[:M2, :N2],
+        C[:M2, N2 : 2 * N2],
+        C[M2 : 2 * M2, :N2],
+        C[M2 : 2 * M2, N2 : 2 * N2],
+    )
+    XBUF, YBUF = WORK[LEVEL]
+    X, Y = _view(XBUF, M2, K2), _view(YBUF, K2, N2)
+    NEXT = LEVEL + 1
+
+    np.subtract(A11, A21, out=X)  # S3
+    np.subtract(B22, B12, out=Y)  # T3
+    strassen(X, Y, C21, WORK, NEXT)  # P7
+    np.add(A21, A22, out=X)  # S1
+    np.subtract(B12, B11, out=Y)  # T1
+    strassen(X, Y, C22, WORK, NEXT)  # P5
+    np.subtract(X, A11, out=X)  # S2
+    np.subtract(B22, Y, out=Y)  # T2
+    strassen(X, Y, C12, WORK, NEXT)  # P6
+    np.subtract(A12, X, out=X)  # S4
+    strassen(X, B22, C11, WORK, NEXT)  # P3
+    P1 = _view(XBUF, M2, N2)
+    strassen(A11, B11, P1, WORK, NEXT)  # P1
+    C12 += P1  # U2 = P1 + P6
+    C21 += C12  # U3 = U2 + P7
+    C12 += C22  # U4 = U2 + P5
+    C22 += C21  # U7 = U3 + P5
+    C12 += C11  # U5 = U4 + P3
+    np.subtract(Y, B21, out=Y)  # T4
+    strassen(A22, Y, C11, WORK, NEXT)  # P4
+    C21 -= C11  # U6 = U3 - P4
+    strassen(A12, B21, C11, WORK, NEXT)  # P2
+    C11 += P1  # U1 = P1 + P2
+
+    # Peel off odd dimensions.
+    if K > 2 * K2:
+        gemm(
+            "N",
+            "N",
+            1,
+            A[: 2 * M2, 2 * K2 :],
+            B[2 * K2 :, : 2 * N2],
+            1,
+            C[: 2 * M2, : 2 * N2],
+        )
+    if N > 2 * N2:
+        gemm("N", "N", 1, A[: 2 * M2, :], B[:, 2 * N2 :], 0, C[: 2 * M2, 2 * N2 :])
+    if M > 2 * M2:
+        gemm("N", "N", 1, A[2 * M2 :, :], B, 0, C[2 * M2 :, :])
+
+
+def gemm_strassen(TRANSA, TRANSB, ALPHA, A, B, BETA, C, CUTOFF=None):
+    """Forms ``C := ALPHA*op(A)*op(B) + BETA*C`` with Strassen-Winograd recursion.
+
+    Parameters
+    ----------
+    TRANSA : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(A)``
+    TRANSB : str
+        ``'N'``, ``'T'`` or ``'C'``, the form of ``op(B)``
+    ALPHA : scalar
+        Multiplier of ``op(A)*op(B)``
+    A : numpy.ndarray
+        The stored matrix `A`, exactly ``NROWA x NCOLA``
+    B : numpy.ndarray
+        The stored matrix `B`, exactly ``NROWB x NCOLB``
+    BETA : scalar
+        Multiplier of `C`
+    C : numpy.ndarray
+        The ``M x N`` matrix `C`, overwritten with the result
+    CUTOFF : int, optional
+        Recursion stops once a dimension is at most `CUTOFF`, by default
+        `DEFAULT_CUTOFF`
+
+    Returns
+    -------
+    None
+    """
+    if CUTOFF is None:
+        CUTOFF = DEFAULT_CUTOFF
+    M, N = C.shape
+    K = A.shape[1] if lsame(TRANSA, "N") else A.shape[0]
+    if M == 0 or N == 0:
+        return
+    if ALPHA == 0 or K == 0:
+        scale(BETA, C)
+        return
+    OPA = op_tile(A, TRANSA, 0, M, 0, K)
+    OPB = op_tile(B, TRANSB, 0, K, 0, N)
+    DTYPE = np.result_type(A, B)
+    with ExitStack() as STACK:
+        WORK = workspace(M, N, K, max(1, CUTOFF), DTYPE, STACK)
+        if ALPHA == 1 and BETA == 0:
+            strassen(OPA, OPB, C, WORK)
+            return
+        P = STACK.enter_context(borrow((M, N), DTYPE))
+        strassen(OPA, OPB, P, WORK)
+        P *= ALPHA
+        scale(BETA, C)
+        C += P
@@ -179,8 +179,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import trsm
 
 
 def STRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
@@ -227,7 +228,6 @@ def STRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         NROWA = M
     else:
         NROWA = N
-    NOUNIT = lsame(DIAG, "N")
     UPPER = lsame(UPLO, "U")
     #
     INFO = 0
@@ -255,127 +255,14 @@ def STRSM(SIDE, UPLO, TRANSA, DIAG, M, N, ALPHA, A, LDA, B, LDB):
         xerbla("STRSM ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, NROWA)
+    B = as_matrix(B, LDB, M, N)
+
     # Quick return if possible.
     if M == 0 or N == 0:
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        for J in range(N):
-            for I in range(M):
-                B[I, J] = 0
-        return
-
-    # Start the operations.
-    if LSIDE:
-        if lsame(TRANSA, "N"):
-            #
-            #           Form  B := alpha*inv( A )*B.
-            #
-            if UPPER:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(M - 1, -1, -1):
-                        if B[K, J] != 0:
-                            if NOUNIT:
-                                B[K, J] = B[K, J] / A[K, K]
-                            for I in range(K - 1):
-                                B[I, J] -= B[K, J] * A[I, K]
-            else:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(M):
-                        if B[K, J] != 0:
-                            if NOUNIT:
-                                B[K, J] = B[K, J] / A[K, K]
-                            for I in range(K, M):
-                                B[I, J] -= B[K, J] * A[I, K]
-        else:
-            #
-            #           Form  B := alpha*inv( A**T )*B.
-            #
-            if UPPER:
-                for J in range(N):
-                    for I in range(M):
-                        TEMP = ALPHA * B[I, J]
-                        for K in range(I - 1):
-                            TEMP -= A[K, I] * B[K, J]
-                        if NOUNIT:
-                            TEMP = TEMP / A[I, I]
-                        B[I, J] = TEMP
-            else:
-                for J in range(N):
-                    for I in range(M - 1, -1, -1):
-                        TEMP = ALPHA * B[I, J]
-                        for K in range(I, M):
-                            TEMP -= A[K, I] * B[K, J]
-                        if NOUNIT:
-                            TEMP = TEMP / A[I, I]
-                        B[I, J] = TEMP
-    else:
-        if lsame(TRANSA, "N"):
-            #
-            #           Form  B := alpha*B*inv( A ).
-            #
-            if UPPER:
-                for J in range(N):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(J - 1):
-                        if A[K, J] != 0:
-                            for I in range(M):
-                                B[I, J] -= A[K, J] * B[I, K]
-                    if NOUNIT:
-                        TEMP = 1 / A[J, J]
-                        for I in range(M):
-                            B[I, J] = TEMP * B[I, J]
-            else:
-                for J in range(N - 1, -1, -1):
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, J] *= ALPHA
-                    for K in range(J, N):
-                        if A[K, J] != 0:
-                            for I in range(M):
-                                B[I, J] -= A[K, J] * B[I, K]
-                    if NOUNIT:
-                        TEMP = 1 / A[J, J]
-                        for I in range(M):
-                            B[I, J] = TEMP * B[I, J]
-        else:
-            #
-            #           Form  B := alpha*B*inv( A**T ).
-            #
-            if UPPER:
-                for K in range(N - 1, -1, -1):
-                    if NOUNIT:
-                        TEMP = 1 / A[K, K]
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
-                    for K in range(K - 1):
-                        if A[J, K] != 0:
-                            TEMP = A[J, K]
-                            for I in range(M):
-                                B[I, J] -= TEMP * B[I, K]
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, K] = ALPHA * B[I, K]
-            else:
-                for K in range(N):
-                    if NOUNIT:
-                        TEMP = 1 / A[K, K]
-                        for I in range(M):
-                            B[I, K] = TEMP * B[I, K]
-                    for J in range(K, N):
-                        if A[J, K] != 0:
-                            TEMP = A[J, K]
-                            for I in range(M):
-                                B[I, J] -= TEMP * B[I, K]
-                    if ALPHA != 1:
-                        for I in range(M):
-                            B[I, K] = ALPHA * B[I, K]
+    # Start the operations.  The recursive solve does all but the diagonal
+    # blocks of the work as blocked matrix products.
+    trsm(SIDE, UPLO, TRANSA, DIAG, ALPHA, A[:NROWA, :NROWA], B[:M, :N])
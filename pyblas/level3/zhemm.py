@@ -189,8 +189,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import symm
 
 
 def ZHEMM(SIDE, UPLO, M, N, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
@@ -259,75 +260,17 @@ def ZHEMM(SIDE, UPLO, M, N, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
         INFO = 12
     if INFO != 0:
         xerbla("ZHEMM ", INFO)
+        return
+
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, NROWA)
+    B = as_matrix(B, LDB, M, N)
+    C = as_matrix(C, LDC, M, N)
 
     # Quick return if possible.
     if (M == 0) or (N == 0) or ((ALPHA == 0) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        if BETA == 0:
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] = 0
-        else:
-            for J in range(N):
-                for I in range(M):
-                    C[I, J] *= BETA
-        return
-
-    # Start the operations.
-    if lsame(SIDE, "L"):
-        #
-        #        Form  C := alpha*A*B + beta*C.
-        #
-        if UPPER:
-            for J in range(N):
-                for I in range(M):
-                    TEMP1 = ALPHA * B[I, J]
-                    TEMP2 = 0
-                    for K in range(I - 1):
-                        C[K, J] = C[K, J] + TEMP1 * A[K, I]
-                        TEMP2 += B[K, J] * A[K, I].conjugate()
-                    if BETA == 0:
-                        C[I, J] = TEMP1 * A[I, I].real + ALPHA * TEMP2
-                    else:
-                        C[I, J] *= BETA + TEMP1 * A[I, I].real + ALPHA * TEMP2
-        else:
-            for J in range(N):
-                for I in range(M - 1, -1, -1):
-                    TEMP1 = ALPHA * B[I, J]
-                    TEMP2 = 0
-                    for K in range(I, M):
-                        C[K, J] = C[K, J] + TEMP1 * A[K, I]
-                        TEMP2 += B[K, J] * A[K, I].conjugate()
-                    if BETA == 0:
-                        C[I, J] = TEMP1 * A[I, I].real + ALPHA * TEMP2
-                    else:
-                        C[I, J] *= BETA + TEMP1 * A[I, I].real + ALPHA * TEMP2
-    else:
-        #
-        #        Form  C := alpha*B*A + beta*C.
-        #
-        for J in range(N):
-            TEMP1 = ALPHA * A[J, J].real
-            if BETA == 0:
-                for I in range(M):
-                    C[I, J] = TEMP1 * B[I, J]
-            else:
-                for I in range(M):
-                    C[I, J] *= BETA + TEMP1 * B[I, J]
-            for K in range(J - 1):
-                if UPPER:
-                    TEMP1 = ALPHA * A[K, J]
-                else:
-                    TEMP1 = ALPHA * A[J, K].conjugate()
-                for I in range(M):
-                    C[I, J] += TEMP1 * B[I, K]
-            for K in range(J, N):
-                if UPPER:
-                    TEMP1 = ALPHA * A[J, K].conjugate()
-                else:
-                    TEMP1 = ALPHA * A[K, J]
-                for I in range(M):
-                    C[I, J] += TEMP1 * B[I, K]
+    # Start the operations, one tile of C at a time, reading only the UPLO
+    # triangle of A.
+    symm(SIDE, UPLO, ALPHA, A[:NROWA, :NROWA], B[:M, :N], BETA, C[:M, :N], HERM=True)
@@ -196,8 +196,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import syrk
 
 
 def ZHER2K(UPLO, TRANS, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
@@ -267,132 +268,16 @@ def ZHER2K(UPLO, TRANS, N, K, ALPHA, A, LDA, B, LDB, BETA, C, LDC):
         xerbla("ZHER2K", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if lsame(TRANS, "N") else N)
+    B = as_matrix(B, LDB, NROWA, K if lsame(TRANS, "N") else N)
+    C = as_matrix(C, LDC, N, N)
+
     # Quick return if possible.
     if (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        if UPPER:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J - 1):
-                        C[I, J] *= BETA
-                    C[J, J] = BETA * C[J, J].real
-        else:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    C[J, J] = BETA * C[J, J].real
-                    for I in range(J, N):
-                        C[I, J] *= BETA
-        return
-
-    # Start the operations.
-    if lsame(TRANS, "N"):
-        #
-        #        Form  C := alpha*A*B**H + conjg( alpha )*B*A**H +
-        #                   C.
-        #
-        if UPPER:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J - 1):
-                        C[I, J] *= BETA
-                    C[J, J] = BETA * C[J, J].real
-                else:
-                    C[J, J] = C[J, J].real
-                for L in range(K):
-                    if (A[J, L] != 0) or (B[J, L] != 0):
-                        TEMP1 = ALPHA * B[J, L].conjugate()
-                        TEMP2 = (ALPHA * A[J, L]).conjugate()
-                        for I in range(J - 1):
-                            C[I, J] += A[I, L] * TEMP1 + B[I, L] * TEMP2
-                        C[J, J] = (
-                            C[J, J].real + (A[J, L] * TEMP1 + B[J, L] * TEMP2).real
-                        )
-        else:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J, N):
-                        C[I, J] *= BETA
-                    C[J, J] = BETA * C[J, J].real
-                else:
-                    C[J, J] = C[J, J].real
-                for L in range(K):
-                    if (A[J, L] != 0) or (B[J, L] != 0):
-                        TEMP1 = ALPHA * B[J, L].conjugate()
-                        TEMP2 = (ALPHA * A[J, L]).conjugate()
-                        for I in range(J, N):
-                            C[I, J] += A[I, L] * TEMP1 + B[I, L] * TEMP2
-                        C[J, J] = (
-                            C[J, J].real + (A[J, L] * TEMP1 + B[J, L] * TEMP2).real
-                        )
-    else:
-        #
-        #        Form  C := alpha*A**H*B + conjg( alpha )*B**H*A +
-        #                   C.
-        #
-        if UPPER:
-            for J in range(N):
-                for I in range(J):
-                    TEMP1 = 0
-                    TEMP2 = 0
-                    for L in range(K):
-                        TEMP1 += A[L, I].conjugate() * B[L, J]
-                        TEMP2 += (B[L, I]).conjugate() * A[L, J]
-                    if I == J:
-                        if BETA == 0:
-                            C[J, J] = (ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2).real
-                        else:
-                            C[J, J] = (
-                                BETA * C[J, J].real
-                                + (ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2).real
-                            )
-                    else:
-                        if BETA == 0:
-                            C[I, J] = ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2
-                        else:
-                            C[I, J] = (
-                                BETA * C[I, J]
-                                + ALPHA * TEMP1
-                                + (ALPHA).conjugate() * TEMP2
-                            )
-        else:
-            for J in range(N):
-                for I in range(J - 1, N):
-                    TEMP1 = 0
-                    TEMP2 = 0
-                    for L in range(K):
-                        TEMP1 += A[L, I].conjugate() * B[L, J]
-                        TEMP2 += (B[L, I]).conjugate() * A[L, J]
-                    if I == J:
-                        if BETA == 0:
-                            C[J, J] = (ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2).real
-                        else:
-                            C[J, J] = (
-                                BETA * C[J, J].real
-                                + (ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2).real
-                            )
-                    else:
-                        if BETA == 0:
-                            C[I, J] = ALPHA * TEMP1 + (ALPHA).conjugate() * TEMP2
-                        else:
-                            C[I, J] = (
-                                BETA * C[I, J]
-                                + ALPHA * TEMP1
-                                + (ALPHA).conjugate() * TEMP2
-                            )
+    # Start the operations, computing only the tiles of the UPLO triangle.
+    NCOLA = K if lsame(TRANS, "N") else N
+    A, B = A[:NROWA, :NCOLA], B[:NROWA, :NCOLA]
+    syrk(UPLO, TRANS, ALPHA, A, BETA, C[:N, :N], HERM=True, B=B)
@@ -171,8 +171,9 @@
 # > \endverbatim
 # >
 #  =====================================================================
-from util import lsame
-from xerbla import xerbla
+from ..util import as_matrix, lsame
+from ..xerbla import xerbla
+from .blocked import syrk
 
 
 def ZHERK(UPLO, TRANS, N, K, ALPHA, A, LDA, BETA, C, LDC):
@@ -217,108 +218,14 @@ def ZHERK(UPLO, TRANS, N, K, ALPHA, A, LDA, BETA, C, LDC):
         xerbla("ZHERK ", INFO)
         return
 
+    # View flat buffers as LD x N column-major matrices, without copying.
+    A = as_matrix(A, LDA, NROWA, K if lsame(TRANS, "N") else N)
+    C = as_matrix(C, LDC, N, N)
+
     # Quick return if possible.
     if (N == 0) or (((ALPHA == 0) or (K == 0)) and (BETA == 1)):
         return
 
-    # And when  alpha==zero.
-    if ALPHA == 0:
-        if UPPER:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    for I in range(J - 1):
-                        C[I, J] *= BETA
-                    C[J, J] = BETA * C[J, J].real
-        else:
-            if BETA == 0:
-                for J in range(N):
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-            else:
-                for J in range(N):
-                    C[J, J] = BETA * C[J, J].real
-                    for I in range(J, N):
-                        C[I, J] *= BETA
-        return
-
-    # Start the operations.
-    if lsame(TRANS, "N"):
-        #
-        #        Form  C := alpha*A*A**H + beta*C.
-        #
-        if UPPER:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    for I in range(J - 1):
-                        C[I, J] *= BETA
-                    C[J, J] = BETA * C[J, J].real
-                else:
-                    C[J, J] = C[J, J].real
-                for L in range(K):
-                    if A[J, L] != 0:
-                        TEMP = ALPHA * A[J, L].conjugate()
-                        for I in range(J - 1):
-                            C[I, J] += TEMP * A[I, L]
-                        C[J, J] = C[J, J].real + (TEMP * A[I, L]).real
-        else:
-            for J in range(N):
-                if BETA == 0:
-                    for I in range(J - 1, N):
-                        C[I, J] = 0
-                elif BETA != 1:
-                    C[J, J] = BETA * C[J, J].real
-                    for I in range(J, N):
-                        C[I, J] *= BETA
-                else:
-                    C[J, J] = C[J, J].real
-                for L in range(K):
-                    if A[J, L] != 0:
-                        TEMP = ALPHA * A[J, L].conjugate()
-                        C[J, J] = C[J, J].real + (TEMP * A[J, L]).real
-                        for I in range(J, N):
-                            C[I, J] += TEMP * A[I, L]
-    else:
-        #
-        #        Form  C := alpha*A**H*A + beta*C.
-        #
-        if UPPER:
-            for J in range(N):
-                for I in range(J - 1):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I].conjugate() * A[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
-                RTEMP = 0
-                for L in range(K):
-                    RTEMP = RTEMP + A[L, J].conjugate() * A[L, J]
-                if BETA == 0:
-                    C[J, J] = ALPHA * RTEMP
-                else:
-                    C[J, J] = ALPHA * RTEMP + BETA * C[J, J].real
-        else:
-            for J in range(N):
-                RTEMP = 0
-                for L in range(K):
-                    RTEMP = RTEMP + A[L, J].conjugate() * A[L, J]
-                if BETA == 0:
-                    C[J, J] = ALPHA * RTEMP
-                else:
-                    C[J, J] = ALPHA * RTEMP + BETA * C[J, J].real
-                for I in range(J, N):
-                    TEMP = 0
-                    for L in range(K):
-                        TEMP += A[L, I].conjugate() * A[L, J]
-                    if BETA == 0:
-                        C[I, J] = ALPHA * TEMP
-                    else:
-                        C[I, J] = ALPHA * TEMP + BETA * C[I, J]
+    # Start the operations, computing only the tiles of the UPLO triangle.
+    NCOLA = K if lsame(TRANS, "N") else N
+    syrk(UPLO, TRANS, ALPHA, A[:NROWA, :NCOLA], BETA, C[:N, :N], HERM=True)
@@ -0,0 +1,207 @@
+"""Autotuner for the tile sizes of the blocked level 3 kernels.
+
+Usage: python -m pyblas.tune [--size N] [--repeat R] [--dtypes sdcz]
+
+The blocked kernels are fastest with tiles that suit the caches of the host.
+For each dtype this times GEMM, TRSM and SYRK on ``N x N`` operands (default
+1024) for every combination of tile sizes in `GRID_MN` (for ``MB = NB``) and
+`GRID_K` (for ``KB``).  The winner is the combination whose times, each
+relative to the best time for its routine, add up to the least.
+
+The winners are written as JSON to `cache_path`, from which
+`pyblas.level3.blocked` loads them at import.  Delete the file to go back to
+the built-in tile sizes.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+VERSION = 1
+
+GRID_MN = (64, 128, 256, 512)
+GRID_K = (128, 256, 512)
+
+
+def cache_path():
+    """Returns the path of the tuning cache.
+
+    ``PYBLAS_TUNE_FILE`` takes precedence.  Otherwise the file lives in the
+    user's cache directory: ``$XDG_CACHE_HOME`` or ``~/.cache`` on Linux,
+    ``~/Library/Caches`` on macOS and ``%LOCALAPPDATA%`` on Windows.
+    """
+    PATH = os.environ.get("PYBLAS_TUNE_FILE")
+    if PATH:
+        return PATH
+    if sys.platform == "win32":
+        BASE = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        BASE = os.path.expanduser("~/Library/Caches")
+    else:
+        BASE = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(BASE, "pyblas", "tune.json")
+
+
+def load(PATH=None):
+    """Returns the tuned ``{dtype char: (MB, NB, KB)}`` from the cache.
+
+    A missing, unreadable or outdated cache gives an empty dict.
+    """
+    if PATH is None:
+        PATH = cache_path()
+    try:
+        with open(PATH) as f:
+            DATA = json.load(f)
+        if DATA.get("version") != VERSION:
+            return {}
+        return {
+            CHAR: (int(T["MB"]), int(T["NB"]), int(T["KB"]))
+            for CHAR, T in DATA["tiles"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save(TILES, PATH=None):
+    """Writes ``{dtype char: (MB, NB, KB)}`` to the cache, merged with what it holds."""
+    if PATH is None:
+        PATH = cache_path()
+    MERGED = load(PATH)
+    MERGED.update(TILES)
+    DIRECTORY = os.path.dirname(PATH)
+    if DIRECTORY and not os.path.isdir(DIRECTORY):
+        os.makedirs(DIRECTORY)
+    TMP = PATH + ".tmp"
+    with open(TMP, "w") as f:
+        json.dump(
+            {
+                "version": VERSION,
+                "tiles": {
+                    CHAR: {"MB": MB, "NB": NB, "KB": KB}
+                    for CHAR, (MB, NB, KB) in sorted(MERGED.items())
+                },
+            },
+            f,
+            indent=2,
+        )
+    os.replace(TMP, PATH)
+
+
+def _problems(N, DTYPE):
+    # The routines timed for each candidate, as (name, run, reset) triples.
+    import numpy as np
+
+    from .level3 import blocked
+
+    rng = np.random.default_rng(0)
+
+    def random(SHAPE):
+        X = rng.uniform(-1, 1, SHAPE)
+        if np.dtype(DTYPE).kind == "c":
+            X = X + 1j * rng.uniform(-1, 1, SHAPE)
+        return np.asfortranarray(X, DTYPE)
+
+    A, B = random((N, N)), random((N, N))
+    C = np.zeros((N, N), DTYPE, order="F")
+    T = np.tril(A) + N * np.eye(N, dtype=DTYPE)
+    X = np.empty_like(B)
+    return [
+        ("gemm", lambda: blocked.gemm("N", "N", 1, A, B, 0, C), lambda: None),
+        (
+            "trsm",
+            lambda: blocked.trsm("L", "L", "N", "N", 1, T, X),
+            lambda: np.copyto(X, B),
+        ),
+        ("syrk", lambda: blocked.syrk("L", "N", 1, A, 0, C), lambda: None),
+    ]
+
+
+def tune(DTYPE, N=1024, REPEAT=3, GRID=None, OUT=sys.stdout):
+    """Times the candidate tile sizes for `DTYPE` and returns the best ``(MB, NB, KB)``.
+
+    Parameters
+    ----------
+    DTYPE : numpy.dtype
+        Data type to tune for
+    N : int
+        Order of the matrices timed
+    REPEAT : int
+        Each time is the best of `REPEAT` runs
+    GRID : list, optional
+        Candidate ``(MB, NB, KB)``, by default every combination of `GRID_MN`
+        and `GRID_K`
+    OUT : file, optional
+        Where to print a table of the times, None for silence
+
+    Returns
+    -------
+    tuple
+    """
+    import numpy as np
+
+    from .level3 import blocked
+
+    if GRID is None:
+        GRID = [(MN, MN, K) for MN in GRID_MN for K in GRID_K]
+    CHAR = np.dtype(DTYPE).char
+    PROBLEMS = _problems(N, DTYPE)
+    SAVED = blocked.TUNED.get(CHAR)
+    TIMES = []
+    try:
+        for SIZES in GRID:
+            blocked.TUNED[CHAR] = SIZES
+            TIMES.append(
+                [
+                    min(timeit.repeat(RUN, setup=RESET, number=1, repeat=REPEAT))
+                    for _, RUN, RESET in PROBLEMS
+                ]
+            )
+    finally:
+        if SAVED is None:
+            blocked.TUNED.pop(CHAR, None)
+        else:
+            blocked.TUNED[CHAR] = SAVED
+    BEST = [min(COLUMN) for COLUMN in zip(*TIMES)]
+    SCORES = [sum(T / B for T, B in zip(ROW, BEST)) for ROW in TIMES]
+    WINNER = min(range(len(GRID)), key=SCORES.__getitem__)
+    if OUT is not None:
+        NAMES = [NAME for NAME, _, _ in PROBLEMS]
+        OUT.write(
+            "%-5s %4s %4s %4s " % ("dtype", "MB", "NB", "KB")
+            + " ".join("%9s" % NAME for NAME in NAMES)
+            + " %7s\n" % "score"
+        )
+        for I, (SIZES, ROW) in enumerate(zip(GRID, TIMES)):
+            OUT.write(
+                "%-5s %4d %4d %4d " % ((CHAR,) + tuple(SIZES))
+                + " ".join("%9.4f" % T for T in ROW)
+                + " %7.3f%s\n" % (SCORES[I], " *" if I == WINNER else "")
+            )
+    return tuple(GRID[WINNER])
+
+
+def main(ARGV=None):
+    PARSER = argparse.ArgumentParser(
+        prog="python -m pyblas.tune",
+        description="Pick tile sizes for the blocked level 3 kernels.",
+    )
+    PARSER.add_argument("--size", type=int, default=1024, help="matrix order")
+    PARSER.add_argument("--repeat", type=int, default=3, help="runs per timing")
+    PARSER.add_argument("--dtypes", default="sdcz", help="subset of 'sdcz'")
+    ARGS = PARSER.parse_args(ARGV)
+
+    import numpy as np
+
+    DTYPES = {"s": np.single, "d": np.double, "c": np.csingle, "z": np.cdouble}
+    TILES = {}
+    for PREFIX in ARGS.dtypes:
+        DTYPE = np.dtype(DTYPES[PREFIX])
+        TILES[DTYPE.char] = tune(DTYPE, ARGS.size, ARGS.repeat)
+    save(TILES)
+    print("wrote %s" % cache_path())
+
+
+if __name__ == "__main__":
+    main()
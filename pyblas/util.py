@@ -1,3 +1,7 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
 def lsame(a, b):
     return a.lower() == b.lower()
 
@@ -18,3 +22,25 @@ def range_(N, inc):
         return range(0, N * inc, inc)
     else:
         return range(-(N - 1) * inc, inc, inc)
+
+
+def as_matrix(X, LD, M, N):
+    """Returns the ``M x N`` matrix stored by columns in `X`, leading dimension `LD`.
+
+    A 1-D array `X`, for instance a flat buffer received from ctypes or
+    mmap, is viewed without copying as the ``M x N`` array whose element
+    ``(I, J)`` is ``X[I + J*LD]``, as in Fortran.  Sub-matrices of a larger
+    matrix are passed as in Fortran too, by offsetting `X` and keeping the
+    leading dimension of the full matrix.  The view keeps the class of `X`,
+    so a flat `numpy.memmap` stays a memmap.  Anything other than a 1-D
+    array is returned unchanged.
+    """
+    if not isinstance(X, np.ndarray) or X.ndim != 1:
+        return X
+    if M > 0 and N > 0 and len(X) < (N - 1) * LD + M:
+        raise ValueError(
+            "buffer of %d elements is too short for a %d x %d matrix with "
+            "leading dimension %d" % (len(X), M, N, LD)
+        )
+    S = X.strides[0]
+    return as_strided(X, (M, N), (S, LD * S), subok=True, writeable=X.flags.writeable)
@@ -0,0 +1,172 @@
+"""Pool of scratch buffers shared by the blocked kernels.
+
+The blocked kernels need tile-sized temporaries over and over: accumulators,
+partial products and triangular copies.  Allocating each one afresh costs
+page faults and allocator work on every tile.  `borrow` instead hands out
+views of buffers kept in a pool and takes them back when the ``with`` block
+ends::
+
+    with workspace.borrow((MB, NB), np.double) as ACC:
+        ...
+
+Buffers are keyed by dtype and size class, the element count rounded up to a
+power of two, so a buffer serves any request of its class.  Every thread has
+its own arena, which also keeps its own hit, miss and eviction counts, so no
+locking is needed on the fast path.  Each arena keeps at most `MEMORY_CAP`
+bytes of free buffers, evicting the least recently used size classes first.
+`stats` adds up the counts of all arenas, including those of threads that
+have since ended.
+
+A borrowed array must not be used after its ``with`` block: the buffer may
+be handed out again at once.
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+# Bytes of free buffers each thread's arena may hold.
+MEMORY_CAP = int(os.environ.get("PYBLAS_WORKSPACE_BYTES", 64 * 2**20))
+
+_LOCAL = threading.local()
+_ARENAS = weakref.WeakSet()
+_ARENAS_LOCK = threading.RLock()
+# The counts of the arenas of threads that have ended.
+_RETIRED = {"hits": 0, "misses": 0, "evictions": 0}
+# The totals at the last reset_stats, which stats subtracts.
+_BASELINE = dict(_RETIRED)
+
+
+def size_class(SIZE):
+    """Returns the number of elements of the buffers serving requests of `SIZE`."""
+    return 1 << max(0, SIZE - 1).bit_length()
+
+
+class _Arena(object):
+    # The free buffers of one thread, least recently used size class first.
+
+    def __init__(self):
+        self.FREE = OrderedDict()
+        self.NBYTES = 0
+        # Only ever written by the owning thread.
+        self.COUNTS = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def take(self, KEY):
+        BUFFERS = self.FREE.get(KEY)
+        if BUFFERS:
+            BUFFER = BUFFERS.pop()
+            self.NBYTES -= BUFFER.nbytes
+            self.FREE.move_to_end(KEY)
+            self.COUNTS["hits"] += 1
+            return BUFFER
+        self.COUNTS["misses"] += 1
+        DTYPE, SIZE = KEY
+        return np.empty(SIZE, DTYPE)
+
+    def give(self, KEY, BUFFER):
+        self.FREE.setdefault(KEY, []).append(BUFFER)
+        self.FREE.move_to_end(KEY)
+        self.NBYTES += BUFFER.nbytes
+        while self.NBYTES > MEMORY_CAP:
+            OLDEST = next(iter(self.FREE))
+            BUFFERS = self.FREE[OLDEST]
+            self.NBYTES -= BUFFERS.pop(0).nbytes
+            if not BUFFERS:
+                del self.FREE[OLDEST]
+            self.COUNTS["evictions"] += 1
+
+    def clear(self):
+        self.FREE.clear()
+        self.NBYTES = 0
+
+
+def _retire(COUNTS):
+    # Keeps the counts of an arena whose thread has ended.
+    with _ARENAS_LOCK:
+        for NAME in _RETIRED:
+            _RETIRED[NAME] += COUNTS[NAME]
+
+
+def _arena():
+    ARENA = getattr(_LOCAL, "ARENA", None)
+    if ARENA is None:
+        ARENA = _LOCAL.ARENA = _Arena()
+        weakref.finalize(ARENA, _retire, ARENA.COUNTS)
+        with _ARENAS_LOCK:
+            _ARENAS.add(ARENA)
+    return ARENA
+
+
+@contextmanager
+def borrow(SHAPE, DTYPE, ORDER="C"):
+    """Lends an uninitialized array of `SHAPE` and `DTYPE` for the duration of a
+    ``with`` block.
+
+    Parameters
+    ----------
+    SHAPE : tuple
+        Shape of the array
+    DTYPE : numpy.dtype
+        Data type of the array
+    ORDER : str
+        ``'C'`` or ``'F'``, the memory layout of the array
+
+    Yields
+    ------
+    numpy.ndarray
+        A contiguous view of a pooled buffer
+    """
+    DTYPE = np.dtype(DTYPE)
+    SIZE = int(np.prod(SHAPE))
+    KEY = (DTYPE, size_class(SIZE))
+    ARENA = _arena()
+    BUFFER = ARENA.take(KEY)
+    try:
+        yield BUFFER[:SIZE].reshape(SHAPE, order=ORDER)
+    finally:
+        ARENA.give(KEY, BUFFER)
+
+
+def _totals(ARENAS):
+    # Adds up the counts of ARENAS and of the ended threads; holds the lock.
+    TOTALS = dict(_RETIRED)
+    for ARENA in ARENAS:
+        for NAME in _RETIRED:
+            TOTALS[NAME] += ARENA.COUNTS[NAME]
+    return TOTALS
+
+
+def stats():
+    """Returns the ``hits``, ``misses`` and ``evictions`` of all arenas since
+    `reset_stats`, and the ``nbytes`` of free buffers they hold.
+
+    Counts are read without stopping the threads that own the arenas, so
+    they may miss borrows still under way.
+    """
+    with _ARENAS_LOCK:
+        ARENAS = list(_ARENAS)
+        STATS = _totals(ARENAS)
+        for NAME in _BASELINE:
+            STATS[NAME] -= _BASELINE[NAME]
+        STATS["nbytes"] = sum(ARENA.NBYTES for ARENA in ARENAS)
+    return STATS
+
+
+def reset_stats():
+    """Sets the hit, miss and eviction counts reported by `stats` back to zero.
+
+    The arenas' own counts are left alone, as only their threads write them,
+    so borrows under way on other threads are never lost: `stats` subtracts
+    the totals taken here instead.
+    """
+    with _ARENAS_LOCK:
+        _BASELINE.update(_totals(list(_ARENAS)))
+
+
+def clear():
+    """Frees the buffers held by the calling thread's arena."""
+    _arena().clear()
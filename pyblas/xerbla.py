@@ -81,7 +81,7 @@ def xerbla(srname, info):
         " ** On entry to "
         + srname
         + " parameter number "
-        + info
+        + str(info)
         + " had an illegal value"
     )
     # WRITE( *, FMT = 9999 ) SRNAME( 1:LEN_TRIM( SRNAME ) ), INFO
@@ -0,0 +1,30 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from pyblas.level2 import banded
+from pyblas.level2 import blocked as level2_blocked
+from pyblas.level3 import blocked
+
+
+@pytest.fixture
+def small_tiles(monkeypatch):
+    # Tiles small enough that the test matrices span several, with partial
+    # tiles at the edges, whatever the tuned block sizes of the machine.
+    monkeypatch.setattr(blocked, "TUNED", {})
+    monkeypatch.setattr(blocked, "MB", 4)
+    monkeypatch.setattr(blocked, "NB", 3)
+    monkeypatch.setattr(blocked, "KB", 5)
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Level 2 blocks, panels and band chunks of a few elements, so that the
+    # test vectors span several of each.
+    monkeypatch.setattr(level2_blocked, "NB", 3)
+    monkeypatch.setattr(level2_blocked, "MB", 4)
+    monkeypatch.setattr(level2_blocked, "PANEL_BYTES", 7 * 3 * 8)
+    monkeypatch.setattr(banded, "CHUNK", 4)
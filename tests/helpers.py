@@ -0,0 +1,53 @@
+"""Helpers shared by the test modules."""
+
+import numpy as np
+
+
+def random(rng, shape, dtype):
+    X = rng.uniform(-1, 1, shape)
+    if np.dtype(dtype).kind == "c":
+        X = X + 1j * rng.uniform(-1, 1, shape)
+    return X.astype(dtype)
+
+
+def strided(b, incx):
+    # The vector b stored with increment incx, padded with NaN.
+    x = np.full(1 + (len(b) - 1) * abs(incx), np.nan, dtype=b.dtype)
+    x[:: abs(incx)] = b if incx > 0 else b[::-1]
+    return x
+
+
+def unstrided(x, N, incx):
+    b = x[:: abs(incx)][:N]
+    return b if incx > 0 else b[::-1]
+
+
+def op(X, trans):
+    if trans == "N":
+        return X
+    if trans == "T":
+        return X.T
+    return X.conj().T
+
+
+def band_storage(T, K, uplo):
+    # The (K + 1) x N band storage of the uplo triangle of T, unused corners
+    # filled with NaN so that reading them shows up.
+    N = T.shape[0]
+    A = np.full((K + 1, N), np.nan, dtype=T.dtype)
+    for J in range(N):
+        if uplo == "U":
+            for I in range(max(0, J - K), J + 1):
+                A[K + I - J, J] = T[I, J]
+        else:
+            for I in range(J, min(N, J + K + 1)):
+                A[I - J, J] = T[I, J]
+    return A
+
+
+def packed_storage(A, uplo):
+    # The reference column-by-column packing of the uplo triangle of A.
+    N = A.shape[0]
+    if uplo == "U":
+        return np.concatenate([A[: J + 1, J] for J in range(N)])
+    return np.concatenate([A[J:, J] for J in range(N)])
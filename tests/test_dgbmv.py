@@ -0,0 +1,95 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.cgbmv import CGBMV
+from pyblas.level2.dgbmv import DGBMV
+from pyblas.level2.sgbmv import SGBMV
+from pyblas.level2.zgbmv import ZGBMV
+
+from helpers import op, random, strided, unstrided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+def band(rng, M, N, KL, KU, dtype):
+    # A random M x N band matrix and its band storage, NaN where unused.
+    G = np.triu(np.tril(random(rng, (M, N), dtype), KU), -KL)
+    AB = np.full((KL + KU + 1, N), np.nan, dtype=dtype)
+    for J in range(N):
+        for I in range(max(0, J - KU), min(M, J + KL + 1)):
+            AB[KU + I - J, J] = G[I, J]
+    return G, AB
+
+
+SHAPES = [(9, 9, 1, 2), (7, 12, 2, 0), (12, 7, 0, 3), (6, 8, 9, 10)]
+
+
+@pytest.mark.parametrize("M,N,KL,KU", SHAPES)
+@pytest.mark.parametrize(
+    "trans,incx,incy", list(itertools.product("NTC", [1, -2], [1, 3]))
+)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SGBMV, np.single, 1e-5),
+        (DGBMV, np.double, 1e-12),
+        (CGBMV, np.csingle, 1e-5),
+        (ZGBMV, np.cdouble, 1e-12),
+    ],
+)
+def test_gbmv(routine, dtype, atol, M, N, KL, KU, trans, incx, incy):
+    rng = np.random.default_rng(0)
+    G, AB = band(rng, M, N, KL, KU, dtype)
+    LENX, LENY = (N, M) if trans == "N" else (M, N)
+    x, y = random(rng, LENX, dtype), random(rng, LENY, dtype)
+    Y = strided(y, incy)
+    routine(
+        trans, M, N, KL, KU, 0.5, AB, KL + KU + 1, strided(x, incx), incx, -2.0, Y, incy
+    )
+    npt.assert_allclose(
+        unstrided(Y, LENY, incy), 0.5 * op(G, trans) @ x - 2.0 * y, atol=atol
+    )
+    assert np.isnan(np.delete(Y, np.s_[:: abs(incy)])).all()
+
+
+def test_dgbmv_beta_zero_and_alpha_zero():
+    rng = np.random.default_rng(1)
+    G, AB = band(rng, 6, 6, 1, 1, np.double)
+    x = random(rng, 6, np.double)
+    y = np.full(6, np.nan)
+    DGBMV("N", 6, 6, 1, 1, 1.0, AB, 3, x, 1, 0.0, y, 1)
+    npt.assert_allclose(y, G @ x, atol=1e-12)
+    y = np.ones(6)
+    DGBMV("N", 6, 6, 1, 1, 0.0, np.full((3, 6), np.nan), 3, x, 1, 3.0, y, 1)
+    npt.assert_equal(y, 3.0)
+
+
+def test_dgbmv_flat_lda():
+    rng = np.random.default_rng(2)
+    M, N, KL, KU, LDA = 8, 8, 2, 1, 6
+    G, AB = band(rng, M, N, KL, KU, np.double)
+    A = np.zeros((LDA, N))
+    A[1 : KL + KU + 2] = AB
+    x = random(rng, N, np.double)
+    y = np.zeros(M)
+    # The band starts one row down the leading dimension of the buffer.
+    DGBMV("N", M, N, KL, KU, 1.0, A.ravel(order="F")[1:], LDA, x, 1, 0.0, y, 1)
+    npt.assert_allclose(y, G @ x, atol=1e-12)
+
+
+def test_dgbmv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DGBMV("X", 3, 3, 1, 1, 1.0, np.zeros((3, 3)), 3, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DGBMV("N", 3, 3, 1, 1, 1.0, np.zeros((3, 3)), 2, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DGBMV("N", 3, 3, 1, 1, 1.0, np.zeros((3, 3)), 3, x, 1, 0.0, x, 0)
@@ -0,0 +1,426 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import tracemalloc
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level3 import blocked, outofcore
+from pyblas.level3.dgemm import DGEMM
+from pyblas.level3.zgemm import ZGEMM
+
+from helpers import op
+
+needs_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="multiprocessing.shared_memory needs 3.8"
+)
+
+
+@pytest.mark.parametrize("transa", ["N", "T", "C"])
+@pytest.mark.parametrize("transb", ["N", "T", "C"])
+def test_dgemm(small_tiles, transa, transb):
+    rng = np.random.default_rng(0)
+    M, N, K = 11, 7, 13
+    A = rng.standard_normal((M, K) if transa == "N" else (K, M))
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K))
+    C = rng.standard_normal((M, N))
+    expected = 1.5 * op(A, transa) @ op(B, transb) - 0.5 * C
+    DGEMM(transa, transb, M, N, K, 1.5, A, A.shape[0], B, B.shape[0], -0.5, C, M)
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("transa", ["N", "T", "C"])
+@pytest.mark.parametrize("transb", ["N", "T", "C"])
+def test_zgemm(small_tiles, transa, transb):
+    rng = np.random.default_rng(1)
+    M, N, K = 9, 8, 6
+    A = rng.standard_normal((M, K) if transa == "N" else (K, M)) + 1j
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K)) - 2j
+    C = rng.standard_normal((M, N)) + 0j
+    alpha, beta = 1 - 1j, 0.5j
+    expected = alpha * op(A, transa) @ op(B, transb) + beta * C
+    ZGEMM(transa, transb, M, N, K, alpha, A, A.shape[0], B, B.shape[0], beta, C, M)
+    npt.assert_allclose(C, expected)
+
+
+def test_dgemm_beta_zero_ignores_c():
+    A = np.ones((2, 3))
+    B = np.ones((3, 2))
+    C = np.full((2, 2), np.nan)
+    DGEMM("N", "N", 2, 2, 3, 2.0, A, 2, B, 3, 0.0, C, 2)
+    npt.assert_equal(C, 6.0)
+
+
+def test_dgemm_alpha_zero():
+    A = np.full((2, 2), np.nan)
+    C = np.ones((3, 3))
+    DGEMM("N", "N", 2, 2, 2, 0.0, A, 2, A, 2, 3.0, C, 3)
+    npt.assert_equal(C, [[3, 3, 1], [3, 3, 1], [1, 1, 1]])
+
+
+@pytest.mark.parametrize("num_threads", [2, 3, 8])
+def test_dgemm_threads_bit_identical(small_tiles, num_threads):
+    rng = np.random.default_rng(2)
+    M, N, K = 23, 17, 19
+    A = rng.standard_normal((K, M))
+    B = rng.standard_normal((K, N))
+    C0 = rng.standard_normal((M, N))
+    C1 = C0.copy()
+    DGEMM("T", "N", M, N, K, 0.3, A, K, B, K, 0.7, C0, M, NUM_THREADS=1)
+    DGEMM("T", "N", M, N, K, 0.3, A, K, B, K, 0.7, C1, M, NUM_THREADS=num_threads)
+    npt.assert_array_equal(C0, C1)
+
+
+def test_num_threads_env(monkeypatch):
+    monkeypatch.setenv("PYBLAS_NUM_THREADS", "4")
+    assert blocked.num_threads() == 4
+    assert blocked.num_threads(2) == 2
+    monkeypatch.delenv("PYBLAS_NUM_THREADS")
+    assert blocked.num_threads() == 1
+
+
+def shm_segments():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+@needs_shared_memory
+def test_dgemm_shared_memory(small_tiles):
+    rng = np.random.default_rng(3)
+    M, N, K = 13, 11, 9
+    A = rng.standard_normal((M, K))
+    B = rng.standard_normal((N, K))
+    C0 = rng.standard_normal((M, N))
+    C1 = C0.copy()
+    before = shm_segments()
+    DGEMM("N", "T", M, N, K, 2.0, A, M, B, N, -1.0, C0, M)
+    DGEMM("N", "T", M, N, K, 2.0, A, M, B, N, -1.0, C1, M, NUM_PROCESSES=2)
+    npt.assert_array_equal(C0, C1)
+    assert shm_segments() == before
+
+
+@needs_shared_memory
+def test_zgemm_shared_memory_worker_failure(small_tiles):
+    from pyblas.level3.shared import gemm_shared
+
+    A = np.ones((4, 5), dtype=complex)
+    B = np.ones((4, 3), dtype=complex)  # Inner dimensions do not agree
+    C = np.zeros((4, 3), dtype=complex)
+    before = shm_segments()
+    with pytest.raises(ValueError):
+        gemm_shared("N", "N", 1.0, A, B, 0.0, C, NUM_PROCESSES=2)
+    assert shm_segments() == before
+    npt.assert_array_equal(C, 0)
+
+
+def test_dgemm_shared_memory_unavailable(monkeypatch):
+    # Before Python 3.8 asking for worker processes fails with a clear error.
+    from pyblas.level3 import shared
+
+    monkeypatch.setattr(shared, "shared_memory", None)
+    A = np.ones((4, 4))
+    with pytest.raises(RuntimeError, match="Python 3.8"):
+        DGEMM("N", "N", 4, 4, 4, 1.0, A, 4, A, 4, 0.0, A.copy(), 4, NUM_PROCESSES=2)
+
+
+def memmap(tmp_path, name, X, order):
+    Y = np.memmap(tmp_path / name, dtype=X.dtype, mode="w+", shape=X.shape, order=order)
+    Y[...] = X
+    return Y
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_dgemm_outofcore(tmp_path, order):
+    from pyblas.level3.outofcore import gemm_outofcore
+
+    rng = np.random.default_rng(4)
+    M, N, K = 19, 23, 17
+    A = rng.standard_normal((K, M))
+    B = rng.standard_normal((K, N))
+    C = rng.standard_normal((M, N))
+    expected = 2.0 * A.T @ B + 3.0 * C
+    Am, Bm, Cm = (memmap(tmp_path, n, X, order) for n, X in zip("ABC", (A, B, C)))
+    # Budget for 5 x 5 tiles of doubles.
+    nbytes = gemm_outofcore("T", "N", 2.0, Am, Bm, 3.0, Cm, MEMORY_BUDGET=6 * 8 * 25)
+    npt.assert_allclose(Cm, expected)
+    # A is read once per column of C tiles, B once per row, C once.
+    assert nbytes == (A.nbytes * 5 + B.nbytes * 4 + C.nbytes)
+
+    Cm[...] = C
+    outofcore.reset_stats()
+    DGEMM("T", "N", M, N, K, 2.0, Am, K, Bm, K, 3.0, Cm, M, MEMORY_BUDGET=6 * 8 * 25)
+    npt.assert_allclose(Cm, expected)
+    assert outofcore.stats() == {"calls": 1, "bytes_read": nbytes}
+
+
+@pytest.mark.parametrize("trans", ["NN", "CT", "CC"])
+def test_zgemm_outofcore_stays_within_budget(tmp_path, trans):
+    rng = np.random.default_rng(6)
+    M, N, K = 150, 140, 160
+    transa, transb = trans
+    A = rng.standard_normal((M, K) if transa == "N" else (K, M)) + 1j
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K)) - 1j
+    C = rng.standard_normal((M, N)) + 0j
+    expected = 2.0 * op(A, transa) @ op(B, transb) - C
+    Am, Bm, Cm = (memmap(tmp_path, n, X, "F") for n, X in zip("ABC", (A, B, C)))
+    # Budget for six 64 x 64 tiles of complex doubles.
+    BUDGET = 6 * 16 * 64**2
+
+    def zgemm(BETA, C):
+        LDA, LDB = A.shape[0], B.shape[0]
+        ZGEMM(*trans, M, N, K, 2.0, Am, LDA, Bm, LDB, BETA, C, M, MEMORY_BUDGET=BUDGET)
+
+    # A first call leaves the interpreter's one-off allocations (such as the
+    # specialised bytecode of the kernel) out of the measurement.
+    zgemm(0.0, memmap(tmp_path, "W", C, "F"))
+    tracemalloc.start()
+    try:
+        zgemm(-1.0, Cm)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    npt.assert_allclose(Cm, expected)
+    # Allow for the bookkeeping of the call (the prefetch thread, memmap
+    # views and the list of steps), but not for another tile.
+    assert peak <= BUDGET + 32 * 2**10
+
+
+@pytest.mark.parametrize("shape", [(32, 32, 32), (37, 29, 43)])
+@pytest.mark.parametrize("trans", ["NN", "TN", "NT"])
+def test_dgemms(shape, trans):
+    from pyblas.level3.dgemms import DGEMMS
+
+    rng = np.random.default_rng(5)
+    M, N, K = shape
+    transa, transb = trans
+    A = rng.standard_normal((M, K) if transa == "N" else (K, M))
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K))
+    C = rng.standard_normal((M, N))
+    expected = -2.0 * op(A, transa) @ op(B, transb) + 0.25 * C
+    DGEMMS(
+        transa,
+        transb,
+        M,
+        N,
+        K,
+        -2.0,
+        A,
+        A.shape[0],
+        B,
+        B.shape[0],
+        0.25,
+        C,
+        M,
+        CUTOFF=4,
+    )
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("transa", ["N", "T", "C"])
+@pytest.mark.parametrize("transb", ["N", "T", "C"])
+def test_zgemm3m(small_tiles, transa, transb):
+    from pyblas.level3.zgemm3m import ZGEMM3M
+
+    rng = np.random.default_rng(6)
+    M, N, K = 9, 8, 12
+    A = rng.standard_normal((M, K) if transa == "N" else (K, M)) * (1 + 2j)
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K)) - 1j
+    C = rng.standard_normal((M, N)) + 0.5j
+    alpha, beta = 0.5 + 1j, 2 - 1j
+    expected = alpha * op(A, transa) @ op(B, transb) + beta * C
+    ZGEMM3M(transa, transb, M, N, K, alpha, A, A.shape[0], B, B.shape[0], beta, C, M)
+    npt.assert_allclose(C, expected)
+
+
+def test_cgemm3m_single_precision(small_tiles):
+    from pyblas.level3.cgemm3m import CGEMM3M
+
+    rng = np.random.default_rng(7)
+    M, N, K = 10, 7, 11
+    A = (rng.standard_normal((M, K)) + 1j * rng.standard_normal((M, K))).astype(
+        np.csingle
+    )
+    B = (rng.standard_normal((K, N)) + 1j * rng.standard_normal((K, N))).astype(
+        np.csingle
+    )
+    C = np.full((M, N), np.nan, np.csingle)
+    CGEMM3M("N", "N", M, N, K, 1, A, M, B, K, 0, C, M)
+    assert C.dtype == np.csingle
+    npt.assert_allclose(C, A.astype(np.cdouble) @ B.astype(np.cdouble), rtol=1e-4)
+
+
+@pytest.mark.parametrize("transa", ["N", "T"])
+@pytest.mark.parametrize("transb", ["N", "T", "C"])
+def test_dgemm_prepacked(small_tiles, transa, transb):
+    from pyblas.level3.prepack import dgemm_pack
+
+    rng = np.random.default_rng(8)
+    M, N, K = 10, 8, 12
+    B = rng.standard_normal((K, N) if transb == "N" else (N, K))
+    BP = dgemm_pack(transb, K, N, B, B.shape[0])
+    assert BP.shape == (K, N)
+    # The handle keeps its own tile sizes.
+    blocked.KB, blocked.NB = 7, 2
+    for seed in range(3):
+        A = rng.standard_normal((M, K) if transa == "N" else (K, M))
+        C = rng.standard_normal((M, N))
+        expected = 2.0 * op(A, transa) @ op(B, transb) - C
+        DGEMM(transa, "P", M, N, K, 2.0, A, A.shape[0], BP, 0, -1.0, C, M)
+        npt.assert_allclose(C, expected)
+
+
+def test_sgemm_prepacked_shape_mismatch():
+    from pyblas.level3.prepack import sgemm_pack
+    from pyblas.level3.sgemm import SGEMM
+
+    B = np.ones((4, 3), np.single)
+    BP = sgemm_pack("N", 4, 3, B, 4)
+    A = np.ones((2, 5), np.single)
+    C = np.zeros((2, 3), np.single)
+    with pytest.raises(Exception):
+        SGEMM("N", "P", 2, 3, 5, 1, A, 2, BP, 0, 0, C, 2)
+    SGEMM("N", "P", 2, 3, 4, 1, A, 2, BP, 0, 0, C, 2)
+    npt.assert_array_equal(C, np.full((2, 3), 4, np.single))
+
+
+def test_dgemm_prepacked_rejects_other_precision_and_processes():
+    from pyblas.level3.prepack import dgemm_pack, sgemm_pack
+
+    A = np.ones((2, 4))
+    C = np.zeros((2, 3))
+    BP = sgemm_pack("N", 4, 3, np.ones((4, 3), np.single), 4)
+    with pytest.raises(Exception, match="parameter number 9 "):
+        DGEMM("N", "P", 2, 3, 4, 1.0, A, 2, BP, 0, 0.0, C, 2)
+    BP = dgemm_pack("N", 4, 3, np.ones((4, 3)), 4)
+    with pytest.raises(Exception, match="parameter number 15 "):
+        DGEMM("N", "P", 2, 3, 4, 1.0, A, 2, BP, 0, 0.0, C, 2, NUM_PROCESSES=2)
+    DGEMM("N", "P", 2, 3, 4, 1.0, A, 2, BP, 0, 0.0, C, 2)
+    npt.assert_array_equal(C, 4.0)
+
+
+def reference_epilogue(C, row_bias, col_bias, col_scale):
+    return np.maximum(col_scale * C + row_bias[:, None] + col_bias, 0)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "threads",
+        pytest.param("processes", marks=needs_shared_memory),
+        "memmap",
+        "alpha zero",
+    ],
+)
+def test_dgemm_epilogue(small_tiles, tmp_path, path):
+    from pyblas.level3.epilogue import Epilogue
+
+    rng = np.random.default_rng(9)
+    M, N, K = 11, 10, 7
+    A = rng.standard_normal((M, K))
+    B = rng.standard_normal((K, N))
+    C = rng.standard_normal((M, N))
+    row_bias, col_bias, col_scale = (rng.standard_normal(n) for n in (M, N, N))
+    alpha = 0.0 if path == "alpha zero" else 2.0
+    expected = reference_epilogue(alpha * A @ B + C, row_bias, col_bias, col_scale)
+    epilogue = Epilogue(row_bias, col_bias, col_scale, "relu")
+    kwargs = {"EPILOGUE": epilogue}
+    if path == "threads":
+        kwargs["NUM_THREADS"] = 3
+    elif path == "processes":
+        kwargs["NUM_PROCESSES"] = 2
+    elif path == "memmap":
+        C = memmap(tmp_path, "C", C, "F")
+    DGEMM("N", "N", M, N, K, alpha, A, M, B, K, 1.0, C, M, **kwargs)
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("activation", ["tanh", "clip"])
+def test_sgemm_prepacked_epilogue(small_tiles, activation):
+    from pyblas.level3.epilogue import Epilogue
+    from pyblas.level3.prepack import sgemm_pack
+    from pyblas.level3.sgemm import SGEMM
+
+    rng = np.random.default_rng(10)
+    M, N, K = 9, 8, 6
+    A = rng.standard_normal((M, K)).astype(np.single)
+    B = rng.standard_normal((K, N)).astype(np.single)
+    C = np.empty((M, N), np.single)
+    col_bias = rng.standard_normal(N).astype(np.single)
+    expected = A @ B + col_bias
+    if activation == "tanh":
+        expected = np.tanh(expected)
+    else:
+        expected = np.clip(expected, -0.5, None)
+    epilogue = Epilogue(COL_BIAS=col_bias, ACTIVATION=activation, CLIP=(-0.5, None))
+    SGEMM(
+        "N",
+        "P",
+        M,
+        N,
+        K,
+        1,
+        A,
+        M,
+        sgemm_pack("N", K, N, B, K),
+        0,
+        0,
+        C,
+        M,
+        EPILOGUE=epilogue,
+    )
+    npt.assert_allclose(C, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"ROW_BIAS": np.zeros(4)}, "ROW_BIAS has 4 elements but C has 5 rows"),
+        ({"COL_BIAS": np.zeros(1)}, "COL_BIAS has 1 elements but C has 6 columns"),
+        ({"COL_SCALE": np.ones(7)}, "COL_SCALE has 7 elements but C has 6 columns"),
+    ],
+)
+def test_dgemm_epilogue_checks_lengths(kwargs, message):
+    from pyblas.level3.epilogue import Epilogue
+
+    A, B = np.ones((5, 3)), np.ones((3, 6))
+    C = np.zeros((5, 6))
+    with pytest.raises(ValueError, match=message):
+        DGEMM(
+            "N", "N", 5, 6, 3, 1.0, A, 5, B, 3, 0.0, C, 5, EPILOGUE=Epilogue(**kwargs)
+        )
+    npt.assert_equal(C, 0.0)
+
+
+def test_dgemm_flat_buffers():
+    rng = np.random.default_rng(11)
+    M, N, K, LD = 5, 4, 3, 7
+    A = rng.standard_normal((LD, K))
+    B = rng.standard_normal((N, LD))
+    C = rng.standard_normal((LD, N))
+    expected = C.copy()
+    expected[:M] = 2.0 * A[:M] @ B[:, :K].T + expected[:M]
+    a, b, c = (X.ravel(order="F") for X in (A, B, C))
+    DGEMM("N", "T", M, N, K, 2.0, a, LD, b, N, 1.0, c, LD)
+    npt.assert_allclose(c.reshape(N, LD).T, expected)
+
+
+def test_dgemm_flat_memmap_streams(tmp_path):
+    # Flat memmap buffers keep their class through as_matrix, so they take
+    # the out-of-core path.
+    rng = np.random.default_rng(12)
+    M, N, K, LD = 19, 13, 11, 21
+    A = rng.standard_normal((LD, K))
+    B = rng.standard_normal((K, N))
+    C = rng.standard_normal((LD, N))
+    expected = C.copy()
+    expected[:M] = A[:M] @ B - expected[:M]
+    a, b, c = (
+        memmap(tmp_path, n, X.ravel(order="F"), "F") for n, X in zip("ABC", (A, B, C))
+    )
+    outofcore.reset_stats()
+    DGEMM("N", "N", M, N, K, 1.0, a, LD, b, K, -1.0, c, LD, MEMORY_BUDGET=6 * 8 * 25)
+    assert outofcore.stats()["calls"] > 0
+    npt.assert_allclose(np.asarray(c).reshape(N, LD).T, expected)
@@ -0,0 +1,82 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.cgemv import cgemv
+from pyblas.level2.dgemv import DGEMV
+from pyblas.level2.sgemv import SGEMV
+from pyblas.level2.zgemv import ZGEMV
+
+from helpers import op, random, strided, unstrided
+
+CASES = list(itertools.product("NTC", [1, -2], [1, 3], [0, -0.5]))
+
+
+@pytest.mark.parametrize("M,N", [(7, 10), (1, 4), (5, 1)])
+@pytest.mark.parametrize("trans,incx,incy,beta", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SGEMV, np.single, 1e-5),
+        (DGEMV, np.double, 1e-12),
+        (cgemv, np.csingle, 1e-5),
+        (ZGEMV, np.cdouble, 1e-12),
+    ],
+)
+def test_gemv(routine, dtype, atol, M, N, trans, incx, incy, beta):
+    rng = np.random.default_rng(0)
+    A = random(rng, (M, N), dtype)
+    LENX, LENY = (N, M) if trans == "N" else (M, N)
+    x, y = random(rng, LENX, dtype), random(rng, LENY, dtype)
+    Y = strided(y, incy)
+    if beta == 0:
+        Y[:: abs(incy)] = np.nan  # y is not read
+    routine(
+        trans, M, N, 2.0, np.asfortranarray(A), M, strided(x, incx), incx, beta, Y, incy
+    )
+    expected = 2.0 * op(A, trans) @ x + (beta * y if beta else 0)
+    npt.assert_allclose(unstrided(Y, LENY, incy), expected, atol=atol)
+
+
+@pytest.mark.parametrize("trans", "NT")
+def test_dgemv_flat_buffer(trans):
+    # A given as the flat column-major buffer of a LDA x N array, with rows
+    # past M that must not be read.
+    rng = np.random.default_rng(1)
+    M, N, LDA = 6, 5, 9
+    buf = random(rng, (LDA, N), np.double)
+    buf[M:] = np.nan
+    LENX, LENY = (N, M) if trans == "N" else (M, N)
+    x, y = random(rng, LENX, np.double), random(rng, LENY, np.double)
+    Y = y.copy()
+    DGEMV(trans, M, N, 1.5, buf.ravel(order="F"), LDA, x, 1, 0.5, Y, 1)
+    expected = 1.5 * op(buf[:M], trans) @ x + 0.5 * y
+    npt.assert_allclose(Y, expected, atol=1e-12)
+
+
+def test_dgemv_alpha_zero_and_quick_return():
+    A, x = np.full((3, 4), np.nan), np.full(4, np.nan)
+    Y = np.ones(3)
+    DGEMV("N", 3, 4, 0.0, A, 3, x, 1, 2.0, Y, 1)
+    npt.assert_equal(Y, 2.0)
+    DGEMV("N", 3, 4, 0.0, A, 3, x, 1, 1.0, Y, 1)
+    npt.assert_equal(Y, 2.0)
+    DGEMV("N", 0, 4, 1.0, A, 1, x, 1, 0.0, Y, 1)
+    npt.assert_equal(Y, 2.0)
+
+
+def test_dgemv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DGEMV("X", 3, 3, 1.0, np.zeros((3, 3)), 3, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DGEMV("N", 3, 3, 1.0, np.zeros((3, 3)), 2, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DGEMV("N", 3, 3, 1.0, np.zeros((3, 3)), 3, x, 0, 0.0, x, 1)
@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas import workspace
+from pyblas.level2 import blocked
+from pyblas.level2.cgerc import cgerc
+from pyblas.level2.cgeru import cgeru
+from pyblas.level2.dger import DGER
+from pyblas.level2.sger import SGER
+from pyblas.level2.zgerc import ZGERC
+from pyblas.level2.zgeru import ZGERU
+
+from helpers import random, strided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+CASES = list(itertools.product([1, -2], [1, 3]))
+ROUTINES = [
+    (SGER, np.single, False, 1e-5),
+    (DGER, np.double, False, 1e-12),
+    (cgeru, np.csingle, False, 1e-5),
+    (cgerc, np.csingle, True, 1e-5),
+    (ZGERU, np.cdouble, False, 1e-12),
+    (ZGERC, np.cdouble, True, 1e-12),
+]
+
+
+@pytest.mark.parametrize("M,N", [(7, 10), (1, 4), (5, 1)])
+@pytest.mark.parametrize("incx,incy", CASES)
+@pytest.mark.parametrize("routine,dtype,conj,atol", ROUTINES)
+def test_ger(routine, dtype, conj, atol, M, N, incx, incy):
+    rng = np.random.default_rng(0)
+    A0 = random(rng, (M, N), dtype)
+    x, y = random(rng, M, dtype), random(rng, N, dtype)
+    A = A0.copy(order="F")
+    routine(M, N, 0.5, strided(x, incx), incx, strided(y, incy), incy, A, M)
+    expected = A0 + 0.5 * np.outer(x, y.conj() if conj else y)
+    npt.assert_allclose(A, expected, atol=atol)
+
+
+def test_dger_skips_zero_y():
+    # As in the reference routine, columns for which y(j) is zero are not
+    # touched even when x holds NaNs.
+    A = np.ones((3, 8), order="F")
+    x = np.array([1.0, np.nan, 2.0])
+    y = np.array([1.0, 0.0, 0.0, 2.0, 0.0, 3.0, 0.0, 0.0])
+    DGER(3, 8, 1.0, x, 1, y, 1, A, 3)
+    npt.assert_equal(A[:, y == 0], 1.0)
+    npt.assert_equal(A[:, 0], [2.0, np.nan, 3.0])
+    npt.assert_equal(A[:, 5], [4.0, np.nan, 7.0])
+
+
+def test_dger_lda_and_quick_return():
+    rng = np.random.default_rng(1)
+    M, N, LDA = 4, 6, 9
+    buf = random(rng, (LDA, N), np.double)
+    expected = buf.copy()
+    x, y = random(rng, M, np.double), random(rng, N, np.double)
+    DGER(M, N, 2.0, x, 1, y, 1, buf, LDA)
+    expected[:M] += 2.0 * np.outer(x, y)
+    npt.assert_allclose(buf, expected, atol=1e-12)
+    DGER(M, N, 0.0, np.full(M, np.nan), 1, y, 1, buf, LDA)
+    npt.assert_allclose(buf, expected, atol=1e-12)
+
+
+def test_dger_reuses_one_panel(monkeypatch):
+    # Every panel of every call is formed in the same pooled buffers.
+    monkeypatch.setattr(blocked, "PANEL_BYTES", 1 << 19)
+    rng = np.random.default_rng(2)
+    A = np.zeros((300, 500), order="F")
+    x, y = random(rng, 300, np.double), random(rng, 500, np.double)
+    DGER(300, 500, 1.0, x, 1, y, 1, A, 300)
+    before = workspace.stats()
+    for _ in range(3):
+        DGER(300, 500, 1.0, x, 1, y, 1, A, 300)
+    after = workspace.stats()
+    assert after["misses"] == before["misses"]
+    npt.assert_allclose(A, 4 * np.outer(x, y), atol=1e-12)
+
+
+def test_dger_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DGER(-1, 3, 1.0, x, 1, x, 1, np.zeros((3, 3)), 3)
+    with pytest.raises(Exception):
+        DGER(3, 3, 1.0, x, 0, x, 1, np.zeros((3, 3)), 3)
+    with pytest.raises(Exception):
+        DGER(3, 3, 1.0, x, 1, x, 1, np.zeros((3, 3)), 2)
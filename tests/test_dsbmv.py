@@ -0,0 +1,78 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.chbmv import CHBMV
+from pyblas.level2.dsbmv import DSBMV
+from pyblas.level2.ssbmv import SSBMV
+from pyblas.level2.zhbmv import ZHBMV
+
+from helpers import random, strided, unstrided
+
+
+def band(rng, N, K, uplo, dtype):
+    # A random symmetric, or Hermitian when complex, band matrix and the band
+    # storage of its uplo triangle, NaN where unused.
+    H = np.triu(np.tril(random(rng, (N, N), dtype), K), -K)
+    H = H + H.conj().T
+    AB = np.full((K + 1, N), np.nan, dtype=dtype)
+    for J in range(N):
+        if uplo == "U":
+            for I in range(max(0, J - K), J + 1):
+                AB[K + I - J, J] = H[I, J]
+        else:
+            for I in range(J, min(N, J + K + 1)):
+                AB[I - J, J] = H[I, J]
+    if np.dtype(dtype).kind == "c":
+        AB[K if uplo == "U" else 0] += 1j  # imaginary parts are ignored
+    return H, AB
+
+
+CASES = list(itertools.product("UL", [0, 1, 3, 12], [1, -2], [1, 3], [0, -0.5]))
+
+
+@pytest.mark.parametrize("uplo,K,incx,incy,beta", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSBMV, np.single, 1e-5),
+        (DSBMV, np.double, 1e-12),
+        (CHBMV, np.csingle, 1e-5),
+        (ZHBMV, np.cdouble, 1e-12),
+    ],
+)
+def test_sbmv_hbmv(routine, dtype, atol, uplo, K, incx, incy, beta):
+    rng = np.random.default_rng(0)
+    N = 10
+    H, AB = band(rng, N, K, uplo, dtype)
+    x, y = random(rng, N, dtype), random(rng, N, dtype)
+    Y = strided(y, incy)
+    if beta == 0:
+        Y[:: abs(incy)] = np.nan  # y is not read
+    routine(uplo, N, K, 2.0, AB, K + 1, strided(x, incx), incx, beta, Y, incy)
+    expected = 2.0 * H @ x + (beta * y if beta else 0)
+    npt.assert_allclose(unstrided(Y, N, incy), expected, atol=atol)
+    assert np.isnan(np.delete(Y, np.s_[:: abs(incy)])).all()
+
+
+def test_dsbmv_alpha_zero():
+    y = np.array([1.0, 2.0])
+    DSBMV("U", 2, 1, 0.0, np.full((2, 2), np.nan), 2, np.ones(2), 1, 2.0, y, 1)
+    npt.assert_equal(y, [2.0, 4.0])
+
+
+def test_dsbmv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DSBMV("X", 3, 1, 1.0, np.zeros((2, 3)), 2, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DSBMV("U", 3, 1, 1.0, np.zeros((2, 3)), 1, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DSBMV("U", 3, 1, 1.0, np.zeros((2, 3)), 2, x, 1, 0.0, x, 0)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level3 import blocked
+from pyblas.level3.dsymm import DSYMM
+from pyblas.level3.zhemm import ZHEMM
+
+pytestmark = pytest.mark.usefixtures("small_tiles")
+
+
+def stored(X, uplo):
+    # X with its unreferenced triangle poisoned.
+    Y = X.copy()
+    Y[np.tril_indices(len(X), -1) if uplo == "U" else np.triu_indices(len(X), 1)] = (
+        np.nan
+    )
+    return Y
+
+
+@pytest.mark.parametrize("side", ["L", "R"])
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_dsymm(side, uplo, order):
+    rng = np.random.default_rng(0)
+    M, N = 11, 8
+    K = M if side == "L" else N
+    S = rng.standard_normal((K, K))
+    S += S.T
+    B = rng.standard_normal((M, N))
+    C = np.asarray(rng.standard_normal((M, N)), order=order)
+    expected = 2.0 * (S @ B if side == "L" else B @ S) - 0.5 * C
+    DSYMM(side, uplo, M, N, 2.0, stored(S, uplo), K, B, M, -0.5, C, M)
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("side", ["L", "R"])
+@pytest.mark.parametrize("uplo", ["U", "L"])
+def test_zhemm(side, uplo):
+    rng = np.random.default_rng(1)
+    M, N = 9, 10
+    K = M if side == "L" else N
+    H = rng.standard_normal((K, K)) + 1j * rng.standard_normal((K, K))
+    H += H.conj().T
+    B = rng.standard_normal((M, N)) + 1j * rng.standard_normal((M, N))
+    C = np.zeros((M, N), complex)
+    expected = (1 - 1j) * (H @ B if side == "L" else B @ H)
+    A = stored(H, uplo)
+    # The imaginary part of the diagonal is not referenced.
+    A[np.diag_indices(K)] += 7j
+    ZHEMM(side, uplo, M, N, 1 - 1j, A, K, B, M, 0, C, M)
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_gemm_tile_follows_storage_order(order):
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((10, 7))
+    B = rng.standard_normal((7, 9))
+    C = np.zeros((10, 9), order=order)
+    blocked.gemm("N", "N", 1.0, A, B, 0.0, C)
+    npt.assert_allclose(C, A @ B)
+    P = blocked.product_tile("N", "N", 1.0, A, B, 0, 4, 0, 3, order)
+    assert blocked.storage_order(P) == order
+    assert P.flags["C_CONTIGUOUS" if order == "C" else "F_CONTIGUOUS"]
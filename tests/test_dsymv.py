@@ -0,0 +1,95 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2 import blocked
+from pyblas.level2.chemv import CHEMV
+from pyblas.level2.dsymv import DSYMV
+from pyblas.level2.ssymv import SSYMV
+from pyblas.level2.zhemv import ZHEMV
+
+from helpers import random, strided, unstrided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+def symmetric(rng, N, uplo, dtype):
+    # A random symmetric, or Hermitian when complex, matrix and a copy with
+    # NaN in the triangle that must not be read.
+    H = random(rng, (N, N), dtype)
+    H = H + H.conj().T
+    A = H.copy()
+    A[np.tril_indices(N, -1) if uplo == "U" else np.triu_indices(N, 1)] = np.nan
+    if np.dtype(dtype).kind == "c":
+        A[np.diag_indices(N)] += 1j  # imaginary parts are ignored
+    return H, A
+
+
+CASES = list(itertools.product("UL", [1, -2], [1, 3], [0, -0.5]))
+
+
+@pytest.mark.parametrize("N", [1, 10])
+@pytest.mark.parametrize("uplo,incx,incy,beta", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSYMV, np.single, 1e-5),
+        (DSYMV, np.double, 1e-12),
+        (CHEMV, np.csingle, 1e-5),
+        (ZHEMV, np.cdouble, 1e-12),
+    ],
+)
+def test_symv_hemv(routine, dtype, atol, N, uplo, incx, incy, beta):
+    rng = np.random.default_rng(0)
+    H, A = symmetric(rng, N, uplo, dtype)
+    x, y = random(rng, N, dtype), random(rng, N, dtype)
+    Y = strided(y, incy)
+    if beta == 0:
+        Y[:: abs(incy)] = np.nan  # y is not read
+    routine(
+        uplo, N, 2.0, np.asfortranarray(A), N, strided(x, incx), incx, beta, Y, incy
+    )
+    expected = 2.0 * H @ x + (beta * y if beta else 0)
+    npt.assert_allclose(unstrided(Y, N, incy), expected, atol=atol)
+    assert np.isnan(np.delete(Y, np.s_[:: abs(incy)])).all()
+
+
+def test_dsymv_block_size_independent(monkeypatch):
+    rng = np.random.default_rng(1)
+    N = 40
+    H, A = symmetric(rng, N, "L", np.double)
+    x = random(rng, N, np.double)
+    for nb in (1, 7, 64):
+        monkeypatch.setattr(blocked, "NB", nb)
+        y = np.zeros(N)
+        DSYMV("L", N, 1.0, A, N, x, 1, 0.0, y, 1)
+        npt.assert_allclose(y, H @ x, atol=1e-12)
+
+
+def test_dsymv_flat_lda():
+    rng = np.random.default_rng(2)
+    N, LDA = 7, 9
+    H, _ = symmetric(rng, N, "U", np.double)
+    A = np.zeros((LDA, N))
+    A[:N] = H
+    x = random(rng, N, np.double)
+    y = np.zeros(N)
+    DSYMV("U", N, 1.0, A.ravel(order="F"), LDA, x, 1, 0.0, y, 1)
+    npt.assert_allclose(y, H @ x, atol=1e-12)
+
+
+def test_dsymv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DSYMV("X", 3, 1.0, np.eye(3), 3, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DSYMV("U", 3, 1.0, np.eye(3), 2, x, 1, 0.0, x, 1)
+    with pytest.raises(Exception):
+        DSYMV("U", 3, 1.0, np.eye(3), 3, x, 1, 0.0, x, 0)
@@ -0,0 +1,110 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.cher import CHER
+from pyblas.level2.cher2 import CHER2
+from pyblas.level2.dsyr import dsyr
+from pyblas.level2.dsyr2 import dsyr2
+from pyblas.level2.ssyr import SSYR
+from pyblas.level2.ssyr2 import SSYR2
+from pyblas.level2.zher import ZHER
+from pyblas.level2.zher2 import ZHER2
+
+from helpers import random, strided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+def triangle(X, uplo):
+    return np.triu(X) if uplo == "U" else np.tril(X)
+
+
+def update(rng, N, uplo, dtype):
+    # A random matrix with NaN in the triangle that must not be touched and,
+    # when complex, imaginary parts on the diagonal that must be dropped.
+    A = random(rng, (N, N), dtype)
+    A[np.tril_indices(N, -1) if uplo == "U" else np.triu_indices(N, 1)] = np.nan
+    return A
+
+
+CASES = list(itertools.product("UL", [1, -2], [1, 3]))
+
+
+@pytest.mark.parametrize("N", [1, 10])
+@pytest.mark.parametrize("uplo,incx", list(itertools.product("UL", [1, -2])))
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSYR, np.single, 1e-5),
+        (dsyr, np.double, 1e-12),
+        (CHER, np.csingle, 1e-5),
+        (ZHER, np.cdouble, 1e-12),
+    ],
+)
+def test_syr_her(routine, dtype, atol, N, uplo, incx):
+    rng = np.random.default_rng(0)
+    A0 = update(rng, N, uplo, dtype)
+    x = random(rng, N, dtype)
+    A = A0.copy(order="F")
+    routine(uplo, N, 0.5, strided(x, incx), incx, A, N)
+    expected = A0 + 0.5 * np.outer(x, x.conj())
+    if np.dtype(dtype).kind == "c":
+        np.fill_diagonal(expected, expected.diagonal().real)
+    npt.assert_allclose(triangle(A, uplo), triangle(expected, uplo), atol=atol)
+    npt.assert_equal(A - triangle(A, uplo), A0 - triangle(A0, uplo))
+
+
+@pytest.mark.parametrize("N", [1, 10])
+@pytest.mark.parametrize("uplo,incx,incy", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSYR2, np.single, 1e-5),
+        (dsyr2, np.double, 1e-12),
+        (CHER2, np.csingle, 1e-5),
+        (ZHER2, np.cdouble, 1e-12),
+    ],
+)
+def test_syr2_her2(routine, dtype, atol, N, uplo, incx, incy):
+    rng = np.random.default_rng(1)
+    A0 = update(rng, N, uplo, dtype)
+    x, y = random(rng, N, dtype), random(rng, N, dtype)
+    alpha = 0.5 - 0.25j if np.dtype(dtype).kind == "c" else 0.5
+    A = A0.copy(order="F")
+    routine(uplo, N, alpha, strided(x, incx), incx, strided(y, incy), incy, A, N)
+    P = alpha * np.outer(x, y.conj())
+    expected = A0 + P + P.conj().T
+    if np.dtype(dtype).kind == "c":
+        np.fill_diagonal(expected, expected.diagonal().real)
+    npt.assert_allclose(triangle(A, uplo), triangle(expected, uplo), atol=atol)
+    npt.assert_equal(A - triangle(A, uplo), A0 - triangle(A0, uplo))
+
+
+def test_dsyr_skips_zero_x():
+    # As in the reference routine, columns for which x(j) is zero are not
+    # touched even when other elements of x are NaN.
+    A = np.ones((4, 4), order="F")
+    x = np.array([np.nan, 0.0, 1.0, 0.0])
+    dsyr("U", 4, 1.0, x, 1, A, 4)
+    npt.assert_equal(A[:, [1, 3]], 1.0)
+    npt.assert_equal(A[:3, 2], [np.nan, 1.0, 2.0])
+
+
+def test_dsyr2_lda():
+    rng = np.random.default_rng(2)
+    N, LDA = 5, 8
+    buf = random(rng, (LDA, N), np.double)
+    expected = buf.copy()
+    x, y = random(rng, N, np.double), random(rng, N, np.double)
+    dsyr2("L", N, 2.0, x, 1, y, 1, buf, LDA)
+    P = 2.0 * np.outer(x, y)
+    expected[:N] += np.tril(P + P.T)
+    npt.assert_allclose(buf, expected, atol=1e-12)
@@ -0,0 +1,110 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level3.cher2k import cher2k
+from pyblas.level3.dsyr2k import DSYR2K
+from pyblas.level3.dsyrk import DSYRK
+from pyblas.level3.ssyr2k import SSYR2K
+from pyblas.level3.zher2k import ZHER2K
+from pyblas.level3.zherk import ZHERK
+from pyblas.level3.zsyr2k import ZSYR2K
+
+pytestmark = pytest.mark.usefixtures("small_tiles")
+
+
+def triangle(X, uplo):
+    return np.triu(X) if uplo == "U" else np.tril(X)
+
+
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("trans", ["N", "T"])
+@pytest.mark.parametrize("beta", [0.0, 0.5])
+def test_dsyrk(uplo, trans, beta):
+    rng = np.random.default_rng(0)
+    N, K = 11, 7
+    A = rng.standard_normal((N, K) if trans == "N" else (K, N))
+    C = rng.standard_normal((N, N))
+    full = 1.5 * (A @ A.T if trans == "N" else A.T @ A) + beta * C
+    expected = triangle(full, uplo) + (C - triangle(C, uplo))
+    DSYRK(uplo, trans, N, K, 1.5, A, A.shape[0], beta, C, N)
+    npt.assert_allclose(C, expected)
+
+
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("trans", ["N", "C"])
+def test_zherk(uplo, trans):
+    rng = np.random.default_rng(1)
+    N, K = 10, 6
+    A = rng.standard_normal((N, K) if trans == "N" else (K, N)) * (1 - 1j)
+    A += 1j * rng.standard_normal(A.shape)
+    C = rng.standard_normal((N, N)) + 1j * rng.standard_normal((N, N))
+    H = A @ A.conj().T if trans == "N" else A.conj().T @ A
+    full = 2.0 * H + 0.5 * C
+    np.fill_diagonal(full, 2.0 * H.diagonal().real + 0.5 * C.diagonal().real)
+    expected = triangle(full, uplo) + (C - triangle(C, uplo))
+    ZHERK(uplo, trans, N, K, 2.0, A, A.shape[0], 0.5, C, N)
+    npt.assert_allclose(C, expected)
+    assert np.all(C.diagonal().imag == 0)
+
+
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("trans", ["N", "T"])
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSYR2K, np.single, 1e-5),
+        (DSYR2K, np.double, 1e-12),
+        (ZSYR2K, np.cdouble, 1e-12),
+    ],
+)
+def test_syr2k(routine, dtype, atol, uplo, trans):
+    rng = np.random.default_rng(2)
+    N, K = 11, 7
+    shape = (N, K) if trans == "N" else (K, N)
+    A, B = rng.standard_normal(shape), rng.standard_normal(shape)
+    C = rng.standard_normal((N, N))
+    alpha = 1.5
+    if np.dtype(dtype).kind == "c":
+        A, B = A + 1j * rng.standard_normal(shape), B - 1j * rng.standard_normal(shape)
+        C, alpha = C + 1j * rng.standard_normal((N, N)), 1.5 - 0.5j
+    A, B, C = A.astype(dtype), B.astype(dtype), C.astype(dtype, order="F")
+    P = A @ B.T if trans == "N" else A.T @ B
+    full = alpha * (P + P.T) + 0.5 * C
+    expected = triangle(full, uplo) + (C - triangle(C, uplo))
+    routine(uplo, trans, N, K, alpha, A, A.shape[0], B, B.shape[0], 0.5, C, N)
+    npt.assert_allclose(C, expected, atol=atol)
+
+
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("trans", ["N", "C"])
+@pytest.mark.parametrize(
+    "routine,dtype,atol", [(cher2k, np.csingle, 1e-5), (ZHER2K, np.cdouble, 1e-12)]
+)
+def test_her2k(routine, dtype, atol, uplo, trans):
+    rng = np.random.default_rng(3)
+    N, K = 10, 6
+    shape = (N, K) if trans == "N" else (K, N)
+    A = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    B = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    C = rng.standard_normal((N, N)) + 1j * rng.standard_normal((N, N))
+    A, B, C = A.astype(dtype), B.astype(dtype), C.astype(dtype, order="F")
+    alpha = 1.5 - 0.5j
+    P = alpha * (A @ B.conj().T if trans == "N" else A.conj().T @ B)
+    full = P + P.conj().T + 0.5 * C
+    np.fill_diagonal(full, full.diagonal().real)
+    expected = triangle(full, uplo) + (C - triangle(C, uplo))
+    routine(uplo, trans, N, K, alpha, A, A.shape[0], B, B.shape[0], 0.5, C, N)
+    npt.assert_allclose(C, expected, atol=atol)
+    assert np.all(C.diagonal().imag == 0)
+
+
+def test_dsyrk_alpha_zero():
+    C = np.ones((5, 5))
+    DSYRK("L", "N", 5, 2, 0.0, np.full((5, 2), np.nan), 5, 2.0, C, 5)
+    npt.assert_equal(C, np.tril(np.full((5, 5), 2.0)) + np.triu(np.ones((5, 5)), 1))
@@ -0,0 +1,99 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.ctbsv import CTBSV
+from pyblas.level2.dtbsv import DTBSV
+from pyblas.level2.stbsv import STBSV
+from pyblas.level2.ztbsv import ZTBSV
+
+from helpers import band_storage, op, strided, unstrided
+
+
+def random_band(rng, N, K, uplo, dtype):
+    T = rng.uniform(-1, 1, (N, N))
+    if np.dtype(dtype).kind == "c":
+        T = T + 1j * rng.uniform(-1, 1, (N, N))
+    T = T.astype(dtype) + 4 * np.eye(N, dtype=dtype)
+    T = np.triu(np.tril(T, K), -K)
+    return np.triu(T) if uplo == "U" else np.tril(T)
+
+
+CASES = list(itertools.product("UL", "NTC", "UN", [1, 2, -1, -3]))
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,rtol",
+    [
+        (STBSV, np.single, 1e-4),
+        (DTBSV, np.double, 1e-12),
+        (CTBSV, np.csingle, 1e-4),
+        (ZTBSV, np.cdouble, 1e-12),
+    ],
+)
+def test_tbsv(routine, dtype, rtol, uplo, trans, diag, incx):
+    rng = np.random.default_rng(0)
+    N, K = 11, 3
+    T = random_band(rng, N, K, uplo, dtype)
+    A = band_storage(T, K, uplo)
+    if diag == "U":
+        np.fill_diagonal(T, 1)
+        A[K if uplo == "U" else 0] = np.nan
+    b = rng.uniform(-1, 1, N).astype(dtype)
+    x = strided(b, incx)
+    routine(uplo, trans, diag, N, K, A, K + 1, x, incx)
+    npt.assert_allclose(op(T, trans) @ unstrided(x, N, incx), b, rtol=rtol, atol=rtol)
+    # Elements between the strided ones are left alone.
+    assert np.isnan(np.delete(x, np.s_[:: abs(incx)])).all()
+
+
+@pytest.mark.parametrize("K", [0, 1, 12, 20])
+def test_dtbsv_bandwidths(K):
+    # From a diagonal matrix up to a band wider than the matrix itself.
+    rng = np.random.default_rng(1)
+    N = 13
+    for uplo, trans in itertools.product("UL", "NT"):
+        T = random_band(rng, N, K, uplo, np.double)
+        b = rng.uniform(-1, 1, N)
+        x = b.copy()
+        DTBSV(uplo, trans, "N", N, K, band_storage(T, K, uplo), K + 1, x, 1)
+        npt.assert_allclose(op(T, trans) @ x, b, atol=1e-12)
+
+
+def test_dtbsv_flat_lda():
+    # Band storage in a flat buffer with a leading dimension above K + 1.
+    rng = np.random.default_rng(2)
+    N, K, LDA = 9, 2, 5
+    T = random_band(rng, N, K, "L", np.double)
+    A = np.zeros((LDA, N))
+    A[: K + 1] = band_storage(T, K, "L")
+    b = rng.uniform(-1, 1, N)
+    x = b.copy()
+    DTBSV("L", "N", "N", N, K, A.ravel(order="F"), LDA, x, 1)
+    npt.assert_allclose(T @ x, b, atol=1e-12)
+
+
+def test_dtbsv_zero_rhs_skips_column():
+    # As in the reference, a zero element of x does not read its column.
+    A = np.array([[np.nan, np.nan], [2.0, 4.0]])
+    x = np.array([2.0, 0.0])
+    DTBSV("U", "N", "N", 2, 1, A, 2, x, 1)
+    npt.assert_equal(x, [1.0, 0.0])
+
+
+def test_dtbsv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DTBSV("X", "N", "N", 3, 1, np.zeros((2, 3)), 2, x, 1)
+    with pytest.raises(Exception):
+        DTBSV("U", "N", "N", 3, 1, np.zeros((2, 3)), 1, x, 1)
+    with pytest.raises(Exception):
+        DTBSV("U", "N", "N", 3, 1, np.zeros((2, 3)), 2, x, 0)
@@ -0,0 +1,105 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import contextlib
+import itertools
+import tracemalloc
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas import workspace
+from pyblas.level3 import blocked
+from pyblas.level3.dtrmm import DTRMM
+from pyblas.level3.ztrmm import ZTRMM
+
+from helpers import op
+
+pytestmark = pytest.mark.usefixtures("small_tiles")
+
+
+def triangular(A, uplo, diag):
+    T = np.triu(A) if uplo == "U" else np.tril(A)
+    if diag == "U":
+        np.fill_diagonal(T, 1)
+    return T
+
+
+CASES = list(itertools.product("LR", "UL", "NTC", "UN"))
+
+
+@pytest.mark.parametrize("side,uplo,transa,diag", CASES)
+def test_dtrmm(side, uplo, transa, diag):
+    rng = np.random.default_rng(2)
+    M, N = 11, 10
+    NA = M if side == "L" else N
+    A = rng.standard_normal((NA, NA))
+    A[(np.tril_indices(NA, -1) if uplo == "U" else np.triu_indices(NA, 1))] = np.nan
+    B = rng.standard_normal((M, N))
+    T = op(triangular(np.nan_to_num(A), uplo, diag), transa)
+    expected = 0.5 * (T @ B if side == "L" else B @ T)
+    DTRMM(side, uplo, transa, diag, M, N, 0.5, A, NA, B, M)
+    npt.assert_allclose(B, expected)
+
+
+@pytest.mark.parametrize("side,uplo,transa,diag", CASES)
+def test_ztrmm(side, uplo, transa, diag):
+    rng = np.random.default_rng(3)
+    M, N = 7, 12
+    NA = M if side == "L" else N
+    A = rng.standard_normal((NA, NA)) + 1j * rng.standard_normal((NA, NA))
+    B = rng.standard_normal((M, N)) + 1j * rng.standard_normal((M, N))
+    T = op(triangular(A, uplo, diag), transa)
+    expected = 1j * (T @ B if side == "L" else B @ T)
+    ZTRMM(side, uplo, transa, diag, M, N, 1j, A, NA, B, M)
+    npt.assert_allclose(B, expected)
+
+
+@pytest.mark.parametrize("side,uplo,transa", list(itertools.product("LR", "UL", "NC")))
+def test_ztrmm_splits_diagonal_blocks(monkeypatch, side, uplo, transa):
+    # Diagonal blocks of more than 16 rows are split in two recursively.
+    monkeypatch.setattr(blocked, "NB", 40)
+    rng = np.random.default_rng(2)
+    M, N = 90, 70
+    K = M if side == "L" else N
+    A = rng.standard_normal((K, K)) + 1j * rng.standard_normal((K, K))
+    B = rng.standard_normal((M, N)) + 1j * rng.standard_normal((M, N))
+    T = triangular(A, uplo, "N")
+    expected = 0.5 * (op(T, transa) @ B if side == "L" else B @ op(T, transa))
+    ZTRMM(side, uplo, transa, "N", M, N, 0.5, A, K, B, M)
+    npt.assert_allclose(B, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("side", "LR")
+def test_dtrmm_scratch_is_one_tile(monkeypatch, side):
+    monkeypatch.setattr(blocked, "NB", 32)
+    borrow, held, most = workspace.borrow, [], []
+
+    @contextlib.contextmanager
+    def counting_borrow(shape, *args):
+        held.append(shape)
+        most.append(list(held))
+        with borrow(shape, *args) as X:
+            yield X
+        held.pop()
+
+    monkeypatch.setattr(workspace, "borrow", counting_borrow)
+    rng = np.random.default_rng(3)
+    N = 200
+    A = rng.standard_normal((N, N))
+    B = rng.standard_normal((N, N))
+    expected = np.tril(A) @ B if side == "L" else B @ np.tril(A)
+    tracemalloc.start()
+    try:
+        DTRMM(side, "L", "N", "N", N, N, 1.0, A, N, B, N)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    npt.assert_allclose(B, expected, atol=1e-12)
+    # A single scratch tile at a time, and nothing near the size of B.
+    assert max(len(shapes) for shapes in most) == 1
+    assert all(np.prod(shape) <= 32 * 32 for shape, in most)
+    assert peak < B.nbytes // 4
@@ -0,0 +1,138 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.ctbmv import CTBMV
+from pyblas.level2.ctpmv import CTPMV
+from pyblas.level2.ctrmv import CTRMV
+from pyblas.level2.dtbmv import DTBMV
+from pyblas.level2.dtpmv import DTPMV
+from pyblas.level2.dtrmv import DTRMV
+from pyblas.level2.stbmv import STBMV
+from pyblas.level2.stpmv import STPMV
+from pyblas.level2.strmv import STRMV
+from pyblas.level2.ztbmv import ZTBMV
+from pyblas.level2.ztpmv import ZTPMV
+from pyblas.level2.ztrmv import ZTRMV
+
+from helpers import band_storage, op, packed_storage, random, strided, unstrided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+def triangular(rng, N, K, uplo, diag, dtype):
+    # A triangular matrix with K off-diagonals, and the same matrix with NaN
+    # wherever the routines must not read it.
+    T = random(rng, (N, N), dtype)
+    T = np.triu(np.tril(T, K), -K)
+    T = np.triu(T) if uplo == "U" else np.tril(T)
+    A = T.copy()
+    A[np.tril_indices(N, -1) if uplo == "U" else np.triu_indices(N, 1)] = np.nan
+    if diag == "U":
+        np.fill_diagonal(T, 1)
+        np.fill_diagonal(A, np.nan)
+    return A, T
+
+
+CASES = list(itertools.product("UL", "NTC", "UN", [1, 2, -1, -3]))
+ROUTINES = {
+    np.single: (STRMV, STBMV, STPMV, 1e-5),
+    np.double: (DTRMV, DTBMV, DTPMV, 1e-12),
+    np.csingle: (CTRMV, CTBMV, CTPMV, 1e-5),
+    np.cdouble: (ZTRMV, ZTBMV, ZTPMV, 1e-12),
+}
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+@pytest.mark.parametrize("dtype", list(ROUTINES))
+def test_trmv(dtype, uplo, trans, diag, incx):
+    TRMV, _, _, atol = ROUTINES[dtype]
+    rng = np.random.default_rng(0)
+    N = 11
+    A, T = triangular(rng, N, N, uplo, diag, dtype)
+    b = random(rng, N, dtype)
+    x = strided(b, incx)
+    TRMV(uplo, trans, diag, N, np.asfortranarray(A), N, x, incx)
+    npt.assert_allclose(unstrided(x, N, incx), op(T, trans) @ b, atol=atol)
+    assert np.isnan(np.delete(x, np.s_[:: abs(incx)])).all()
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+@pytest.mark.parametrize("dtype", list(ROUTINES))
+@pytest.mark.parametrize("K", [0, 2, 12])
+def test_tbmv(dtype, K, uplo, trans, diag, incx):
+    _, TBMV, _, atol = ROUTINES[dtype]
+    rng = np.random.default_rng(1)
+    N = 11
+    A, T = triangular(rng, N, K, uplo, diag, dtype)
+    b = random(rng, N, dtype)
+    x = strided(b, incx)
+    TBMV(uplo, trans, diag, N, K, band_storage(A, K, uplo), K + 1, x, incx)
+    npt.assert_allclose(unstrided(x, N, incx), op(T, trans) @ b, atol=atol)
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+@pytest.mark.parametrize("dtype", list(ROUTINES))
+def test_tpmv(dtype, uplo, trans, diag, incx):
+    _, _, TPMV, atol = ROUTINES[dtype]
+    rng = np.random.default_rng(2)
+    N = 11
+    A, T = triangular(rng, N, N, uplo, diag, dtype)
+    b = random(rng, N, dtype)
+    x = strided(b, incx)
+    TPMV(uplo, trans, diag, N, packed_storage(A, uplo), x, incx)
+    npt.assert_allclose(unstrided(x, N, incx), op(T, trans) @ b, atol=atol)
+
+
+@pytest.mark.parametrize("uplo", ["U", "L"])
+@pytest.mark.parametrize("diag", ["U", "N"])
+@pytest.mark.parametrize("K", [2, 10])
+def test_dtrmv_skips_zero_x(uplo, diag, K):
+    # As in the reference, the columns of A for which x(j) is zero are not
+    # read, so NaN stored there does not reach the result.
+    rng = np.random.default_rng(4)
+    N = 11
+    A, T = triangular(rng, N, K, uplo, diag, np.double)
+    b = random(rng, N, np.double)
+    ZERO = [0, 4, 5, 10]
+    b[ZERO] = 0
+    expected = T @ b
+    for J in ZERO:
+        A[:, J][~np.isnan(A[:, J])] = np.nan
+    for TMV, args in [
+        (DTRMV, (np.asfortranarray(A), N)),
+        (DTBMV, (K, band_storage(A, K, uplo), K + 1)),
+        (DTPMV, (packed_storage(A, uplo),)),
+    ]:
+        x = b.copy()
+        TMV(uplo, "N", diag, N, *args, x, 1)
+        npt.assert_allclose(x, expected, atol=1e-12)
+
+
+def test_dtrmv_flat_lda():
+    rng = np.random.default_rng(3)
+    N, LDA = 7, 9
+    _, T = triangular(rng, N, N, "U", "N", np.double)
+    A = np.zeros((LDA, N))
+    A[:N] = T
+    b = random(rng, N, np.double)
+    x = b.copy()
+    DTRMV("U", "N", "N", N, A.ravel(order="F"), LDA, x, 1)
+    npt.assert_allclose(x, T @ b, atol=1e-12)
+
+
+def test_trmv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DTRMV("U", "X", "N", 3, np.eye(3), 3, x, 1)
+    with pytest.raises(Exception):
+        DTBMV("U", "N", "N", 3, -1, np.eye(3), 3, x, 1)
+    with pytest.raises(Exception):
+        DTPMV("U", "N", "N", 3, np.zeros(6), x, 0)
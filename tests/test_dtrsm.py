@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level3.dtrsm import DTRSM
+from pyblas.level3.ztrsm import ZTRSM
+
+from helpers import op
+
+pytestmark = pytest.mark.usefixtures("small_tiles")
+
+
+def triangular(A, uplo, diag):
+    T = np.triu(A) if uplo == "U" else np.tril(A)
+    if diag == "U":
+        np.fill_diagonal(T, 1)
+    return T
+
+
+CASES = list(itertools.product("LR", "UL", "NTC", "UN"))
+
+
+@pytest.mark.parametrize("side,uplo,transa,diag", CASES)
+def test_dtrsm(side, uplo, transa, diag):
+    rng = np.random.default_rng(0)
+    M, N = 13, 9
+    NA = M if side == "L" else N
+    A = rng.standard_normal((NA, NA)) + 4 * np.eye(NA)
+    A[(np.tril_indices(NA, -1) if uplo == "U" else np.triu_indices(NA, 1))] = np.nan
+    B = rng.standard_normal((M, N))
+    T = op(triangular(np.nan_to_num(A), uplo, diag), transa)
+    X = B.copy()
+    DTRSM(side, uplo, transa, diag, M, N, 2.0, A, NA, X, M)
+    npt.assert_allclose(T @ X if side == "L" else X @ T, 2.0 * B, atol=1e-12)
+
+
+@pytest.mark.parametrize("side,uplo,transa,diag", CASES)
+def test_ztrsm(side, uplo, transa, diag):
+    rng = np.random.default_rng(1)
+    M, N = 8, 14
+    NA = M if side == "L" else N
+    A = rng.standard_normal((NA, NA)) + 1j * rng.standard_normal((NA, NA))
+    A += 4 * np.eye(NA)
+    B = rng.standard_normal((M, N)) + 1j * rng.standard_normal((M, N))
+    T = op(triangular(A, uplo, diag), transa)
+    X = B.copy()
+    ZTRSM(side, uplo, transa, diag, M, N, 1 - 1j, A, NA, X, M)
+    npt.assert_allclose(T @ X if side == "L" else X @ T, (1 - 1j) * B, atol=1e-12)
@@ -0,0 +1,165 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2 import blocked
+from pyblas.level2.ctrsv import CTRSV
+from pyblas.level2.dtrsv import DTRSV
+from pyblas.level2.strsv import STRSV
+from pyblas.level2.ztrsv import ZTRSV
+
+from helpers import op, random, strided, unstrided
+
+pytestmark = pytest.mark.usefixtures("small_blocks")
+
+
+def triangular(rng, N, uplo, diag, dtype):
+    # A and the triangular matrix it holds, with NaN wherever A must not be read.
+    T = random(rng, (N, N), dtype) + 4 * np.eye(N, dtype=dtype)
+    T = np.triu(T) if uplo == "U" else np.tril(T)
+    A = T.copy()
+    A[np.tril_indices(N, -1) if uplo == "U" else np.triu_indices(N, 1)] = np.nan
+    if diag == "U":
+        np.fill_diagonal(T, 1)
+        np.fill_diagonal(A, np.nan)
+    return A, T
+
+
+CASES = list(itertools.product("UL", "NTC", "UN", [1, 2, -1, -3]))
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (STRSV, np.single, 1e-4),
+        (DTRSV, np.double, 1e-12),
+        (CTRSV, np.csingle, 1e-4),
+        (ZTRSV, np.cdouble, 1e-12),
+    ],
+)
+def test_trsv(routine, dtype, atol, uplo, trans, diag, incx):
+    rng = np.random.default_rng(0)
+    N = 11
+    A, T = triangular(rng, N, uplo, diag, dtype)
+    b = random(rng, N, dtype)
+    x = strided(b, incx)
+    routine(uplo, trans, diag, N, np.asfortranarray(A), N, x, incx)
+    npt.assert_allclose(op(T, trans) @ unstrided(x, N, incx), b, atol=atol)
+    assert np.isnan(np.delete(x, np.s_[:: abs(incx)])).all()
+
+
+@pytest.mark.parametrize("uplo,trans", list(itertools.product("UL", "NT")))
+def test_dtrsv_block_size_independent(monkeypatch, uplo, trans):
+    rng = np.random.default_rng(1)
+    N = 50
+    A, _ = triangular(rng, N, uplo, "N", np.double)
+    b = random(rng, N, np.double)
+    results = []
+    for nb in (1, 7, 64):
+        monkeypatch.setattr(blocked, "NB", nb)
+        x = b.copy()
+        DTRSV(uplo, trans, "N", N, A, N, x, 1)
+        results.append(x)
+    npt.assert_allclose(results[0], results[1], rtol=1e-13)
+    npt.assert_allclose(results[0], results[2], rtol=1e-13)
+
+
+@pytest.mark.parametrize("uplo", "UL")
+def test_dtrsv_zero_rhs_skips_columns(uplo):
+    # As in the reference, columns of A that multiply a zero element of x
+    # are not read, in the diagonal blocks and in the trailing updates.
+    rng = np.random.default_rng(2)
+    N = 10
+    A, T = triangular(rng, N, uplo, "N", np.double)
+    b = np.zeros(N)
+    J = 1 if uplo == "L" else N - 2
+    b[J] = 1.0
+    for K in range(N):
+        if K != J and (K < J if uplo == "L" else K > J):
+            A[:, K] = np.inf  # columns solved before J stay zero
+    x = b.copy()
+    DTRSV(uplo, "N", "N", N, A, N, x, 1)
+    assert np.isfinite(x).all()
+    npt.assert_allclose(np.nan_to_num(T) @ x, b, atol=1e-12)
+
+
+def reference_trsv(uplo, trans, diag, A, b):
+    # The loops of the netlib reference routine, one scalar at a time.
+    N, x = len(b), b.copy()
+    nounit = diag == "N"
+    c = (lambda v: v.conjugate()) if trans == "C" else (lambda v: v)
+    if trans == "N":
+        for j in range(N - 1, -1, -1) if uplo == "U" else range(N):
+            if x[j] != 0:
+                if nounit:
+                    x[j] = x[j] / A[j, j]
+                temp = x[j]
+                for i in range(j - 1, -1, -1) if uplo == "U" else range(j + 1, N):
+                    x[i] = x[i] - temp * A[i, j]
+    else:
+        for j in range(N) if uplo == "U" else range(N - 1, -1, -1):
+            temp = x[j]
+            for i in range(j) if uplo == "U" else range(N - 1, j, -1):
+                temp = temp - c(A[i, j]) * x[i]
+            if nounit:
+                temp = temp / c(A[j, j])
+            x[j] = temp
+    return x
+
+
+def well_conditioned(rng, N, dtype):
+    A = random(rng, (N, N), dtype) / N
+    A[np.diag_indices(N)] = rng.uniform(1, 2, N)
+    return A
+
+
+@pytest.mark.parametrize("uplo", "UL")
+def test_dtrsv_matches_reference_within_one_block(monkeypatch, uplo):
+    # With a single panel the solve by columns is the reference loop itself.
+    monkeypatch.setattr(blocked, "NB", 64)
+    rng = np.random.default_rng(3)
+    N = 60
+    A = well_conditioned(rng, N, np.double)
+    b = random(rng, N, np.double)
+    x = b.copy()
+    DTRSV(uplo, "N", "N", N, A, N, x, 1)
+    npt.assert_array_equal(x, reference_trsv(uplo, "N", "N", A, b))
+
+
+@pytest.mark.parametrize("uplo,trans", list(itertools.product("UL", "NTC")))
+@pytest.mark.parametrize(
+    "routine,dtype",
+    [(STRSV, np.single), (DTRSV, np.double), (CTRSV, np.csingle), (ZTRSV, np.cdouble)],
+)
+def test_trsv_agrees_with_reference(monkeypatch, routine, dtype, uplo, trans):
+    # The panel products sum in another order than the reference loops, so
+    # the two may differ by rounding, at most 32 units in the last place of
+    # the largest element of x for these well-conditioned matrices.
+    monkeypatch.setattr(blocked, "NB", 16)
+    rng = np.random.default_rng(4)
+    N = 120
+    A = well_conditioned(rng, N, dtype)
+    b = random(rng, N, dtype)
+    x = b.copy()
+    routine(uplo, trans, "N", N, np.asfortranarray(A), N, x, 1)
+    expected = reference_trsv(uplo, trans, "N", A, b)
+    ulp = np.spacing(np.abs(expected).max())
+    assert np.abs(x - expected).max() <= 32 * ulp
+
+
+def test_dtrsv_errors():
+    x = np.zeros(3)
+    with pytest.raises(Exception):
+        DTRSV("X", "N", "N", 3, np.eye(3), 3, x, 1)
+    with pytest.raises(Exception):
+        DTRSV("U", "N", "N", 3, np.eye(3), 2, x, 1)
+    with pytest.raises(Exception):
+        DTRSV("U", "N", "N", 3, np.eye(3), 3, x, 0)
@@ -0,0 +1,80 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level3 import gemm_batched
+from pyblas.level3.gemm_batched import (
+    dgemm_batched,
+    dgemm_strided_batched,
+    zgemm_strided_batched,
+)
+
+from helpers import op
+
+
+@pytest.mark.parametrize("trans", ["NN", "TC", "CT"])
+def test_zgemm_strided_batched(monkeypatch, trans):
+    monkeypatch.setattr(gemm_batched, "CHUNK_BYTES", 1000)
+    rng = np.random.default_rng(0)
+    P, M, N, K = 50, 4, 5, 3
+    transa, transb = trans
+    A = rng.standard_normal((P,) + ((M, K) if transa == "N" else (K, M))) * (1 + 2j)
+    B = rng.standard_normal((P, K, N) if transb == "N" else (P, N, K)) + 1j
+    C = rng.standard_normal((P, M, N)) + 0j
+    alpha = rng.standard_normal(P)
+    beta = np.where(np.arange(P) % 2, 0.5, 0.0)
+    C[::2] = np.nan  # Ignored where beta is zero
+    expected = [
+        alpha[p] * op(A[p], transa) @ op(B[p], transb)
+        + (beta[p] * C[p] if beta[p] else 0)
+        for p in range(P)
+    ]
+    zgemm_strided_batched(transa, transb, M, N, K, alpha, A, B, beta, C)
+    npt.assert_allclose(C, expected)
+
+
+def test_dgemm_batched():
+    rng = np.random.default_rng(1)
+    P, M, N, K = 20, 6, 3, 7
+    A = [rng.standard_normal((M + 1, K)) for _ in range(P)]
+    B = [rng.standard_normal((N, K)) for _ in range(P)]
+    C = [rng.standard_normal((M, N)) for _ in range(P)]
+    expected = [2.0 * a[:M] @ b.T - c for a, b, c in zip(A, B, C)]
+    dgemm_batched("N", "T", M, N, K, 2.0, A, B, -1.0, C)
+    npt.assert_allclose(C, expected)
+
+
+def test_dgemm_batched_alpha_zero_skips_a_and_b():
+    rng = np.random.default_rng(2)
+    P, M, N, K = 6, 3, 4, 2
+    A = np.full((P, M, K), np.nan)
+    B = np.full((P, K, N), np.nan)
+    C = rng.standard_normal((P, M, N))
+    expected = 3.0 * C
+    dgemm_strided_batched("N", "N", M, N, K, 0.0, A, B, 3.0, C)
+    npt.assert_array_equal(C, expected)
+    # With one ALPHA per matrix, only those with a zero ALPHA are skipped.
+    alpha = np.array([0.0, 1.0, 0.0, 2.0, 0.0, 0.0])
+    A[1::2], B[1::2] = 1.0, 1.0
+    dgemm_batched("N", "N", M, N, K, alpha, list(A), list(B), 1.0, list(C))
+    expected += alpha[:, None, None] * K
+    npt.assert_array_equal(C, expected)
+
+
+@pytest.mark.parametrize("which", "ABC")
+def test_dgemm_batched_checks_every_matrix(which):
+    # A matrix too small for M, N and K anywhere in the list is an error.
+    M, N, K = 3, 4, 2
+    A = [np.ones((M, K)) for _ in range(5)]
+    B = [np.ones((K, N)) for _ in range(5)]
+    C = [np.ones((M, N)) for _ in range(5)]
+    operands = {"A": A, "B": B, "C": C}
+    operands[which][3] = operands[which][3][:-1]
+    info = {"A": 7, "B": 8, "C": 10}[which]
+    with pytest.raises(Exception, match="parameter number %d " % info):
+        dgemm_batched("N", "N", M, N, K, 1.0, A, B, 0.0, C)
@@ -0,0 +1,186 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import itertools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2 import packed
+from pyblas.level2.chpmv import chpmv
+from pyblas.level2.chpr import chpr
+from pyblas.level2.dspmv import DSPMV
+from pyblas.level2.dspr import DSPR
+from pyblas.level2.dspr2 import DSPR2
+from pyblas.level2.dtpsv import DTPSV
+from pyblas.level2.sspmv import SSPMV
+from pyblas.level2.sspr import SSPR
+from pyblas.level2.zhpmv import ZHPMV
+from pyblas.level2.zhpr2 import ZHPR2
+from pyblas.level2.ztpsv import ZTPSV
+
+from helpers import packed_storage, random, strided
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    packed.clear_cache()
+    yield
+    packed.clear_cache()
+
+
+@pytest.mark.parametrize("N", [0, 1, 2, 7])
+@pytest.mark.parametrize("uplo", "UL")
+def test_index_map(N, uplo):
+    A = np.arange(N * N, dtype=np.double).reshape(N, N)
+    MAP = packed.index_map(N, uplo)
+    npt.assert_array_equal(A[MAP.rows, MAP.cols], packed_storage(A, uplo) if N else [])
+    npt.assert_array_equal(MAP.rows[MAP.diag], np.arange(N))
+    npt.assert_array_equal(MAP.cols[MAP.diag], np.arange(N))
+    npt.assert_array_equal(MAP.starts, packed.column_starts(N, uplo))
+    lengths = np.arange(1, N + 1) if uplo == "U" else np.arange(N, 0, -1)
+    npt.assert_array_equal(np.diff(MAP.starts), lengths)
+
+
+def test_index_map_cache():
+    MAP = packed.index_map(10, "U")
+    assert packed.index_map(10, "u") is MAP
+    assert packed.index_map(10, "L") is not MAP
+    INFO = packed.cache_info()
+    assert (INFO["hits"], INFO["misses"], INFO["size"]) == (1, 2, 2)
+    with pytest.raises(ValueError):
+        MAP.rows[0] = 1
+
+
+def test_index_map_cache_evicts_least_recent(monkeypatch):
+    SIZE = packed.index_map(20, "U").nbytes
+    monkeypatch.setattr(packed, "CACHE_BYTES", 2 * SIZE)
+    packed.index_map(20, "L")
+    packed.index_map(20, "U")
+    packed.index_map(20, "L")  # L used more recently than U
+    packed.index_map(5, "U")
+    assert packed.cache_info()["size"] == 2
+    MISSES = packed.cache_info()["misses"]
+    packed.index_map(20, "L")
+    assert packed.cache_info()["misses"] == MISSES
+    packed.index_map(20, "U")
+    assert packed.cache_info()["misses"] == MISSES + 1
+    # A map larger than the whole cache is built but not kept.
+    packed.index_map(40, "U")
+    assert packed.cache_info()["nbytes"] <= 2 * SIZE
+
+
+@pytest.mark.parametrize("uplo,incx", list(itertools.product("UL", [1, -2])))
+def test_dspr_dspr2(uplo, incx):
+    rng = np.random.default_rng(0)
+    N = 9
+    A = random(rng, (N, N), np.double)
+    A = A + A.T
+    x, y = random(rng, N, np.double), random(rng, N, np.double)
+    AP = packed_storage(A, uplo)
+    DSPR(uplo, N, 0.5, strided(x, incx), incx, AP)
+    npt.assert_allclose(AP, packed_storage(A + 0.5 * np.outer(x, x), uplo))
+    AP = packed_storage(A, uplo)
+    DSPR2(uplo, N, 0.5, strided(x, incx), incx, strided(y, -incx), -incx, AP)
+    npt.assert_allclose(
+        AP, packed_storage(A + 0.5 * (np.outer(x, y) + np.outer(y, x)), uplo)
+    )
+
+
+def test_sspr_keeps_precision():
+    AP = np.zeros(6, np.single)
+    SSPR("U", 3, 2.0, np.ones(3, np.single), 1, AP)
+    assert AP.dtype == np.single
+    npt.assert_equal(AP, 2)
+
+
+@pytest.mark.parametrize("uplo", "UL")
+def test_chpr_zhpr2(uplo):
+    rng = np.random.default_rng(1)
+    N = 8
+    A = random(rng, (N, N), np.cdouble)
+    A = A + A.conj().T
+    x, y = random(rng, N, np.cdouble), random(rng, N, np.cdouble)
+    alpha = 0.5 - 0.25j
+
+    AP = packed_storage(A, uplo).astype(np.csingle)
+    AP[packed.index_map(N, uplo).diag] += 1j  # imaginary parts are discarded
+    chpr(uplo, N, 0.5, x.astype(np.csingle), 1, AP)
+    npt.assert_allclose(
+        AP, packed_storage(A + 0.5 * np.outer(x, x.conj()), uplo), atol=1e-5
+    )
+
+    AP = packed_storage(A, uplo)
+    ZHPR2(uplo, N, alpha, strided(x, 2), 2, y, 1, AP)
+    expected = (
+        A + alpha * np.outer(x, y.conj()) + np.conj(alpha) * np.outer(y, x.conj())
+    )
+    npt.assert_allclose(AP, packed_storage(expected, uplo))
+    npt.assert_equal(AP[packed.index_map(N, uplo).diag].imag, 0)
+
+
+@pytest.mark.parametrize(
+    "uplo,incx,incy,beta", list(itertools.product("UL", [1, -2], [1, 3], [0, 1, -0.5]))
+)
+@pytest.mark.parametrize(
+    "routine,dtype,atol",
+    [
+        (SSPMV, np.single, 1e-5),
+        (DSPMV, np.double, 1e-12),
+        (chpmv, np.csingle, 1e-5),
+        (ZHPMV, np.cdouble, 1e-12),
+    ],
+)
+def test_spmv_hpmv(routine, dtype, atol, uplo, incx, incy, beta):
+    rng = np.random.default_rng(3)
+    N = 11
+    A = random(rng, (N, N), dtype)
+    A = A + A.conj().T
+    AP = packed_storage(A, uplo)
+    if np.dtype(dtype).kind == "c":
+        AP[packed.index_map(N, uplo).diag] += 1j  # imaginary parts are ignored
+    x, y = random(rng, N, dtype), random(rng, N, dtype)
+    Y = strided(y, incy)
+    if beta == 0:
+        Y[:: abs(incy)] = np.nan  # y is not read
+    routine(uplo, N, 2.0, AP, strided(x, incx), incx, beta, Y, incy)
+    Y = Y[:: abs(incy)] if incy > 0 else Y[:: abs(incy)][::-1]
+    npt.assert_allclose(Y, 2.0 * A @ x + beta * y, atol=atol)
+
+
+def test_dspmv_alpha_zero():
+    y = np.array([1.0, 2.0])
+    DSPMV("U", 2, 0.0, np.full(3, np.nan), np.ones(2), 1, 3.0, y, 1)
+    npt.assert_equal(y, [3.0, 6.0])
+
+
+CASES = list(itertools.product("UL", "NTC", "UN", [1, -2]))
+
+
+@pytest.mark.parametrize("uplo,trans,diag,incx", CASES)
+def test_tpsv(uplo, trans, diag, incx):
+    rng = np.random.default_rng(2)
+    N = 10
+    for routine, dtype in [(DTPSV, np.double), (ZTPSV, np.cdouble)]:
+        T = random(rng, (N, N), dtype) + 4 * np.eye(N)
+        T = np.triu(T) if uplo == "U" else np.tril(T)
+        AP = packed_storage(T, uplo)
+        if diag == "U":
+            np.fill_diagonal(T, 1)
+            AP[packed.index_map(N, uplo).diag] = np.nan
+        b = random(rng, N, dtype)
+        x = strided(b, incx)
+        routine(uplo, trans, diag, N, AP, x, incx)
+        x = x[:: abs(incx)] if incx > 0 else x[:: abs(incx)][::-1]
+        op = {"N": T, "T": T.T, "C": T.conj().T}[trans]
+        npt.assert_allclose(op @ x, b, atol=1e-12)
+
+
+def test_packed_errors():
+    with pytest.raises(Exception):
+        DSPR("X", 3, 1.0, np.ones(3), 1, np.zeros(6))
+    with pytest.raises(Exception):
+        DTPSV("U", "N", "N", 3, np.zeros(6), np.ones(3), 0)
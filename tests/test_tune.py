@@ -0,0 +1,49 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from pyblas import tune
+from pyblas.level3 import blocked
+
+
+def test_cache_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYBLAS_TUNE_FILE", str(tmp_path / "t.json"))
+    assert tune.cache_path() == str(tmp_path / "t.json")
+    monkeypatch.delenv("PYBLAS_TUNE_FILE")
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert tune.cache_path() == str(tmp_path / "pyblas" / "tune.json")
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "sub" / "tune.json")
+    assert tune.load(path) == {}
+    tune.save({"d": (128, 128, 256)}, path)
+    tune.save({"f": (64, 64, 128)}, path)
+    assert tune.load(path) == {"d": (128, 128, 256), "f": (64, 64, 128)}
+
+
+def test_load_ignores_bad_cache(tmp_path):
+    path = tmp_path / "tune.json"
+    path.write_text("{not json")
+    assert tune.load(str(path)) == {}
+    path.write_text('{"version": 0, "tiles": {"d": {"MB": 1, "NB": 1, "KB": 1}}}')
+    assert tune.load(str(path)) == {}
+
+
+def test_tune_picks_from_grid(monkeypatch):
+    monkeypatch.setattr(blocked, "TUNED", {"f": (8, 8, 8)})
+    grid = [(8, 8, 16), (16, 16, 8)]
+    best = tune.tune(np.single, N=32, REPEAT=1, GRID=grid, OUT=None)
+    assert best in grid
+    # The sizes in force before tuning are restored.
+    assert blocked.TUNED == {"f": (8, 8, 8)}
+
+
+def test_block_sizes(monkeypatch):
+    monkeypatch.setattr(blocked, "TUNED", {"d": (32, 16, 64)})
+    assert blocked.block_sizes(np.double) == (32, 16, 64)
+    assert blocked.block_sizes(np.single) == (blocked.MB, blocked.NB, blocked.KB)
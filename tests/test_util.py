@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas.level2.dger import DGER
+from pyblas.util import as_matrix
+
+
+def test_as_matrix_views_flat_buffer():
+    X = np.arange(20.0)
+    A = as_matrix(X, 5, 3, 4)
+    npt.assert_array_equal(A, X.reshape(4, 5).T[:3])
+    A[1, 2] = -1
+    assert X[1 + 2 * 5] == -1
+    assert np.shares_memory(A, X)
+
+
+def test_as_matrix_short_last_column():
+    # Fortran only needs (N - 1)*LD + M elements.
+    X = np.arange(13.0)
+    npt.assert_array_equal(as_matrix(X, 5, 3, 3)[:, 2], [10, 11, 12])
+    with pytest.raises(ValueError):
+        as_matrix(X, 5, 4, 3)
+
+
+def test_as_matrix_leaves_2d_alone():
+    A = np.ones((3, 3))
+    assert as_matrix(A, 3, 3, 3) is A
+
+
+def test_dger_flat_submatrix():
+    # Update the 2 x 3 sub-matrix starting at (1, 1) of a 4 x 5 matrix.
+    full = np.arange(20.0).reshape(5, 4).T.copy()
+    buf = full.ravel(order="F")
+    x, y = np.array([1.0, 2.0]), np.array([1.0, -1.0, 3.0])
+    DGER(2, 3, 0.5, x, 1, y, 1, buf[1 + 4 :], 4)
+    full[1:3, 1:4] += 0.5 * np.outer(x, y)
+    npt.assert_array_equal(buf.reshape(5, 4).T, full)
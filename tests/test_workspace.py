@@ -0,0 +1,152 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from pyblas import workspace
+from pyblas.level3 import blocked
+from pyblas.level3.dtrmm import DTRMM
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    workspace.clear()
+    workspace.reset_stats()
+    yield
+    workspace.clear()
+
+
+def test_borrow_reuses_size_class():
+    with workspace.borrow((3, 5), np.double) as X:
+        assert X.shape == (3, 5) and X.flags.c_contiguous
+        base = X.base
+    with workspace.borrow((4, 4), np.double, "F") as Y:
+        assert Y.flags.f_contiguous
+        assert np.shares_memory(Y, base)
+    with workspace.borrow((4, 4), np.single):
+        pass
+    assert workspace.stats()["hits"] == 1
+    assert workspace.stats()["misses"] == 2
+
+
+def test_lru_eviction(monkeypatch):
+    monkeypatch.setattr(workspace, "MEMORY_CAP", 3 * 1024 * 8)
+    # Arenas of other threads, such as the thread pool's, count too.
+    held = workspace.stats()["nbytes"]
+    for size in (1024, 512, 1024, 2048):
+        with workspace.borrow((size,), np.double):
+            pass
+    # The 512 class is the least recently used when 2048 overflows the cap.
+    stats = workspace.stats()
+    assert stats["evictions"] == 1
+    assert stats["nbytes"] - held == 3 * 1024 * 8
+    with workspace.borrow((1024,), np.double):
+        pass
+    with workspace.borrow((512,), np.double):
+        pass
+    assert workspace.stats()["hits"] == 2
+    assert workspace.stats()["misses"] == 4
+
+
+def test_threads_have_own_arenas():
+    with workspace.borrow((100,), np.double):
+        pass
+    result = []
+
+    def worker():
+        with workspace.borrow((100,), np.double):
+            pass
+        result.append(workspace.stats()["misses"])
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert result == [2]
+
+
+def test_blocked_kernels_draw_from_pool(monkeypatch):
+    monkeypatch.setattr(blocked, "MB", 4)
+    monkeypatch.setattr(blocked, "NB", 4)
+    monkeypatch.setattr(blocked, "KB", 4)
+    rng = np.random.default_rng(0)
+    A = np.triu(rng.standard_normal((10, 10)))
+    B = rng.standard_normal((10, 6))
+    expected = A @ (A @ B)
+    DTRMM("L", "U", "N", "N", 10, 6, 1.0, A, 10, B, 10)
+    misses = workspace.stats()["misses"]
+    assert misses > 0
+    DTRMM("L", "U", "N", "N", 10, 6, 1.0, A, 10, B, 10)
+    npt.assert_allclose(B, expected)
+    # The second call finds every scratch tile in the pool.
+    assert workspace.stats()["misses"] == misses
+    assert workspace.stats()["hits"] > 0
+
+
+def test_borrow_takes_no_lock():
+    ready, go, finished = threading.Event(), threading.Event(), threading.Event()
+    done = []
+
+    def worker():
+        with workspace.borrow((100,), np.double):
+            pass
+        ready.set()
+        go.wait()
+        with workspace.borrow((100,), np.double):
+            done.append(workspace._arena().COUNTS["hits"])
+        finished.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    ready.wait()
+    # Once its arena is set up, a thread borrows while another holds the
+    # lock guarding the arenas.
+    with workspace._ARENAS_LOCK:
+        go.set()
+        finished.wait(timeout=10)
+    thread.join()
+    assert done == [1]
+
+
+def test_counts_of_ended_threads_are_kept():
+    def worker():
+        for _ in range(3):
+            with workspace.borrow((100,), np.double):
+                pass
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    del thread
+    stats = workspace.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+def test_reset_stats_leaves_other_arenas_alone():
+    # Resetting while another thread borrows loses none of its counts.
+    stop = threading.Event()
+    counts = []
+
+    def worker():
+        for _ in range(2000):
+            with workspace.borrow((100,), np.double):
+                pass
+        counts.append(workspace._arena().COUNTS["hits"])
+        stop.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    while not stop.is_set():
+        workspace.reset_stats()
+    thread.join()
+    assert counts == [1999]
+    workspace.reset_stats()
+    with workspace.borrow((100,), np.double):
+        pass
+    stats = workspace.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (0, 1, 0)